@@ -2,8 +2,10 @@ import os
 
 from pyblish import api as pyblish
 from avalon import api as avalon
-from .api import config, Anatomy
-from .lib import filter_pyblish_plugins
+from avalon import lib as avalon_lib
+from .api import Anatomy
+from .lib import filter_pyblish_plugins, plugin_index
+from .settings import get_presets, thaw
 
 
 import logging
@@ -25,6 +27,7 @@ LOAD_PATH = os.path.join(PLUGINS_DIR, "global", "load")
 # to modify upstream code.
 
 _original_discover = avalon.discover
+_original_modules_from_path = avalon_lib.modules_from_path
 
 
 def patched_discover(superclass):
@@ -33,7 +36,15 @@ def patched_discover(superclass):
     us to load presets on plugins being discovered.
     """
     # run original discover and get plugins
-    plugins = _original_discover(superclass)
+    # - plugin index skips files without subclass of superclass
+    plugin_index.superclass_name = superclass.__name__
+    try:
+        plugins = _original_discover(superclass)
+    finally:
+        plugin_index.superclass_name = None
+    # classes of unchanged modules are reused so values of previously
+    #   applied presets are reverted
+    plugin_index.restore_defaults(plugins)
 
     # determine host application to use for finding presets
     if avalon.registered_host() is None:
@@ -48,22 +59,27 @@ def patched_discover(superclass):
     elif superclass.__name__.split(".")[-1] == "Creator":
         plugin_type = "create"
 
-    print(">>> trying to find presets for {}:{} ...".format(host, plugin_type))
+    log.debug("Trying to find presets for {}:{} ...".format(
+        host, plugin_type
+    ))
     try:
-        config_data = config.get_presets()['plugins'][host][plugin_type]
+        config_data = get_presets()['plugins'][host][plugin_type]
     except KeyError:
-        print("*** no presets found.")
+        log.debug("No presets found.")
     else:
         for plugin in plugins:
-            if plugin.__name__ in config_data:
-                print(">>> We have preset for {}".format(plugin.__name__))
-                for option, value in config_data[plugin.__name__].items():
-                    if option == "enabled" and value is False:
-                        setattr(plugin, "active", False)
-                        print("  - is disabled by preset")
-                    else:
-                        setattr(plugin, option, value)
-                        print("  - setting `{}`: `{}`".format(option, value))
+            if plugin.__name__ not in config_data:
+                continue
+            log.debug("We have preset for {}".format(plugin.__name__))
+            for option, value in config_data[plugin.__name__].items():
+                if option == "enabled" and value is False:
+                    plugin_index.set_preset_attr(plugin, "active", False)
+                    log.debug("  - is disabled by preset")
+                else:
+                    plugin_index.set_preset_attr(
+                        plugin, option, thaw(value)
+                    )
+                    log.debug("  - setting `{}`: `{}`".format(option, value))
     return plugins
 
 
@@ -105,6 +121,8 @@ def install():
         avalon.register_root(anatomy.roots)
     # apply monkey patched discover to original one
     avalon.discover = patched_discover
+    # import only changed plugin files
+    avalon_lib.modules_from_path = plugin_index.modules_from_path
 
 
 def uninstall():
@@ -116,3 +134,4 @@ def uninstall():
 
     # restore original discover
     avalon.discover = _original_discover
+    avalon_lib.modules_from_path = _original_modules_from_path
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""Client for Deadline Web Service REST API.
+
+Client keeps one :class:`requests.Session` with pool of keep-alive
+connections so many jobs can be submitted without opening new connection
+for each request. Jobs can be submitted concurrently with bounded number
+of parallel requests.
+
+Example::
+
+    with DeadlineRestClient("http://192.168.0.1:8082") as client:
+        tile_jobs = client.submit_jobs(tile_payloads)
+        for payload, tile_job in zip(assembly_payloads, tile_jobs):
+            payload["JobInfo"]["JobDependency0"] = tile_job["_id"]
+        client.submit_jobs(assembly_payloads)
+
+"""
+import os
+import logging
+from multiprocessing.pool import ThreadPool
+
+import requests
+from requests.adapters import HTTPAdapter
+
+log = logging.getLogger(__name__)
+
+
+class DeadlineSubmissionError(Exception):
+    pass
+
+
+class DeadlineRestClient(object):
+    """Connection pooled client of Deadline Web Service.
+
+    Args:
+        url (str): Url of Deadline Web Service (e.g.
+            ``http://192.168.0.1:8082``).
+        max_workers (int): Maximum number of requests sent at once by
+            :meth:`submit_jobs`. Also size of connection pool.
+        timeout (int): Timeout of each request in seconds.
+        verify (bool): Validate SSL certificates. By default validation is
+            disabled if ``PYPE_DONT_VERIFY_SSL`` environment variable is
+            set (same as submit plugins).
+
+    """
+
+    def __init__(self, url, max_workers=8, timeout=10, verify=None):
+        self.url = url.rstrip("/")
+        self.max_workers = max(1, int(max_workers))
+        self.timeout = timeout
+        if verify is None:
+            verify = False if os.getenv("PYPE_DONT_VERIFY_SSL", True) else True  # noqa
+        self.verify = verify
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=1, pool_maxsize=self.max_workers
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    @property
+    def jobs_url(self):
+        return "{}/api/jobs".format(self.url)
+
+    def post(self, url, **kwargs):
+        """Post request through pooled session."""
+        kwargs.setdefault("verify", self.verify)
+        kwargs.setdefault("timeout", self.timeout)
+        return self.session.post(url, **kwargs)
+
+    def get(self, url, **kwargs):
+        """Get request through pooled session."""
+        kwargs.setdefault("verify", self.verify)
+        kwargs.setdefault("timeout", self.timeout)
+        return self.session.get(url, **kwargs)
+
+    def submit_job(self, payload):
+        """Submit one job.
+
+        Args:
+            payload (dict): Job payload with "JobInfo", "PluginInfo" and
+                "AuxFiles" keys.
+
+        Returns:
+            dict: Submitted job document returned by Deadline.
+
+        Raises:
+            DeadlineSubmissionError: When Deadline refuse the job.
+
+        """
+        response = self.post(self.jobs_url, json=payload)
+        if not response.ok:
+            raise DeadlineSubmissionError(response.text)
+        return response.json()
+
+    def submit_jobs(self, payloads):
+        """Submit multiple jobs concurrently.
+
+        Args:
+            payloads (list): Payloads of jobs.
+
+        Returns:
+            list: Submitted job documents in the same order as payloads.
+
+        Raises:
+            DeadlineSubmissionError: When any of jobs is refused.
+
+        """
+        payloads = list(payloads)
+        workers = min(self.max_workers, len(payloads))
+        if workers < 2:
+            return [self.submit_job(payload) for payload in payloads]
+
+        pool = ThreadPool(workers)
+        try:
+            # `map` keeps order and re-raises first exception from workers
+            return pool.map(self.submit_job, payloads, chunksize=1)
+        finally:
+            pool.close()
+            pool.join()
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
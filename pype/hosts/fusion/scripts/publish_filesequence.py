@@ -45,8 +45,13 @@ def publish(paths, gui=False):
         pyblish_qml.show(modal=True)
     else:
 
-        import pyblish.util
-        context = pyblish.util.publish()
+        if os.environ.get("PYPE_PARALLEL_VALIDATION"):
+            # Thread safe validators are processed concurrently
+            import pype.plugin
+            context = pype.plugin.publish()
+        else:
+            import pyblish.util
+            context = pyblish.util.publish()
 
         if not context:
             log.warning("Nothing collected.")
@@ -1,7 +1,7 @@
 import os
 import sys
 
-from avalon import api, io, harmony
+from avalon import api, harmony
 from avalon.vendor import Qt
 import avalon.tools.sceneinventory
 import pyblish.api
@@ -89,22 +89,12 @@ def ensure_scene_settings():
 
 
 def check_inventory():
-    if not lib.any_outdated():
-        return
-
     host = avalon.api.registered_host()
-    outdated_containers = []
-    for container in host.ls():
-        representation = container['representation']
-        representation_doc = io.find_one(
-            {
-                "_id": io.ObjectId(representation),
-                "type": "representation"
-            },
-            projection={"parent": True}
-        )
-        if representation_doc and not lib.is_latest(representation_doc):
-            outdated_containers.append(container)
+    outdated_containers = lib.container_version_status.outdated_containers(
+        host.ls()
+    )
+    if not outdated_containers:
+        return
 
     # Colour nodes.
     func = """function func(args){
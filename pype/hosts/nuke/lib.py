@@ -7,6 +7,7 @@ from avalon import api, io, lib
 import avalon.nuke
 from avalon.nuke import lib as anlib
 import pype.api as pype
+from pype.lib import container_version_status
 
 import nuke
 
@@ -47,41 +48,37 @@ def check_inventory_versions():
     it to red.
     """
     # get all Loader nodes by avalon attribute metadata
+    nodes_by_representation = {}
     for each in nuke.allNodes():
-        if each.Class() == 'Read':
-            container = avalon.nuke.parse_container(each)
-
-            if container:
-                node = container["_node"]
-                avalon_knob_data = avalon.nuke.get_avalon_knob_data(
-                    node, ['avalon:', 'ak:'])
-
-                # get representation from io
-                representation = io.find_one({
-                    "type": "representation",
-                    "_id": io.ObjectId(avalon_knob_data["representation"])
-                })
-
-                # Get start frame from version data
-                version = io.find_one({
-                    "type": "version",
-                    "_id": representation["parent"]
-                })
-
-                # get all versions in list
-                versions = io.find({
-                    "type": "version",
-                    "parent": version["parent"]
-                }).distinct('name')
-
-                max_version = max(versions)
-
-                # check the available version and do match
-                # change color of node if not max verion
-                if version.get("name") not in [max_version]:
-                    node["tile_color"].setValue(int("0xd84f20ff", 16))
-                else:
-                    node["tile_color"].setValue(int("0x4ecd25ff", 16))
+        if each.Class() != 'Read':
+            continue
+
+        container = avalon.nuke.parse_container(each)
+        if not container:
+            continue
+
+        node = container["_node"]
+        avalon_knob_data = avalon.nuke.get_avalon_knob_data(
+            node, ['avalon:', 'ak:'])
+        nodes_by_representation.setdefault(
+            avalon_knob_data["representation"], []
+        ).append(node)
+
+    # resolve versions of all nodes at once
+    statuses = container_version_status.representations_status(
+        nodes_by_representation.keys()
+    )
+    for representation_id, nodes in nodes_by_representation.items():
+        status = statuses.get(representation_id)
+        if status is None:
+            continue
+
+        # change color of node if not max verion
+        for node in nodes:
+            if status:
+                node["tile_color"].setValue(int("0x4ecd25ff", 16))
+            else:
+                node["tile_color"].setValue(int("0xd84f20ff", 16))
 
 
 def writes_version_sync():
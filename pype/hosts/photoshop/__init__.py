@@ -1,29 +1,19 @@
 import os
 import sys
 
-from avalon import api, io
+from avalon import api
 from avalon.vendor import Qt
 from pype import lib
 import pyblish.api
 
 
 def check_inventory():
-    if not lib.any_outdated():
-        return
-
     host = api.registered_host()
-    outdated_containers = []
-    for container in host.ls():
-        representation = container['representation']
-        representation_doc = io.find_one(
-            {
-                "_id": io.ObjectId(representation),
-                "type": "representation"
-            },
-            projection={"parent": True}
-        )
-        if representation_doc and not lib.is_latest(representation_doc):
-            outdated_containers.append(container)
+    outdated_containers = lib.container_version_status.outdated_containers(
+        host.ls()
+    )
+    if not outdated_containers:
+        return
 
     # Warn about outdated containers.
     print("Starting new QApplication..")
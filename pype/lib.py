@@ -14,12 +14,28 @@ import getpass
 import inspect
 import acre
 import platform
+import errno
+import shutil
+import time
+import threading
+import hashlib
+import array
+import tempfile
+from multiprocessing.pool import ThreadPool
 from abc import ABCMeta, abstractmethod
 
+try:
+    import fcntl
+except ImportError:
+    # Not available on Windows
+    fcntl = None
+
 from avalon import io, pipeline
+from avalon.vendor import filelink
 import six
 import avalon.api
 from .api import config, Anatomy
+from .settings import get_presets, thaw
 
 log = logging.getLogger(__name__)
 
@@ -231,6 +247,168 @@ def grouper(iterable, n, fillvalue=None):
     return itertools.izip_longest(fillvalue=fillvalue, *args)
 
 
+class ContainerVersionStatus(object):
+    """Batched resolution of loaded representations to their versions.
+
+    Resolves representation -> version -> latest version of subset for all
+    containers at once with 3 queries (representations and versions with
+    `$in` and latest version names with aggregation).
+
+    Representation's version never changes so it is cached for the whole
+    session. Latest versions are cached for `latest_ttl` seconds and are
+    invalidated when current process publishes new version.
+    """
+
+    latest_ttl = 30
+
+    def __init__(self):
+        self._project_name = None
+        # Representation id -> version id (None if missing)
+        self._repre_versions = {}
+        # Version id -> version document (None if missing)
+        self._versions = {}
+        # Subset id -> (time, latest version name)
+        self._latest = {}
+
+    def _validate_project(self):
+        project_name = io.Session.get("AVALON_PROJECT")
+        if project_name != self._project_name:
+            self.invalidate()
+            self._project_name = project_name
+
+    def invalidate(self, subset_ids=None):
+        """Invalidate latest versions of subsets or all cached data."""
+        if subset_ids is None:
+            self._repre_versions = {}
+            self._versions = {}
+            self._latest = {}
+            return
+
+        for subset_id in subset_ids:
+            self._latest.pop(subset_id, None)
+
+    def representations_status(self, representation_ids):
+        """Whether representations are of latest version.
+
+        Args:
+            representation_ids (list): Representation ids (str or ObjectId).
+
+        Returns:
+            dict: Representation id (str) -> True/False or None when
+                representation or its version is missing in database.
+        """
+        self._validate_project()
+        repre_ids = set(str(repre_id) for repre_id in representation_ids)
+        missing_ids = [
+            io.ObjectId(repre_id)
+            for repre_id in repre_ids
+            if repre_id not in self._repre_versions
+        ]
+        if missing_ids:
+            for repre_id in missing_ids:
+                self._repre_versions[str(repre_id)] = None
+            repre_docs = io.find(
+                {"type": "representation", "_id": {"$in": missing_ids}},
+                projection={"parent": True}
+            )
+            for repre_doc in repre_docs:
+                self._repre_versions[str(repre_doc["_id"])] = (
+                    repre_doc["parent"]
+                )
+
+        versions_status = self.versions_status(
+            version_id
+            for version_id in (
+                self._repre_versions[repre_id] for repre_id in repre_ids
+            )
+            if version_id is not None
+        )
+        output = {}
+        for repre_id in repre_ids:
+            version_id = self._repre_versions[repre_id]
+            output[repre_id] = versions_status.get(version_id)
+        return output
+
+    def versions_status(self, version_ids):
+        """Whether versions are latest versions of their subsets.
+
+        Returns:
+            dict: Version id -> True/False or None when version is missing.
+        """
+        self._validate_project()
+        version_ids = set(version_ids)
+        missing_ids = [
+            version_id
+            for version_id in version_ids
+            if version_id not in self._versions
+        ]
+        if missing_ids:
+            for version_id in missing_ids:
+                self._versions[version_id] = None
+            version_docs = io.find(
+                {"_id": {"$in": missing_ids}},
+                projection={"name": True, "parent": True, "type": True}
+            )
+            for version_doc in version_docs:
+                self._versions[version_doc["_id"]] = version_doc
+
+        now = time.time()
+        outdated_subset_ids = set()
+        for version_id in version_ids:
+            version_doc = self._versions[version_id]
+            if not version_doc or version_doc["type"] == "master_version":
+                continue
+            cached = self._latest.get(version_doc["parent"])
+            if cached is None or now - cached[0] > self.latest_ttl:
+                outdated_subset_ids.add(version_doc["parent"])
+
+        if outdated_subset_ids:
+            for subset_id in outdated_subset_ids:
+                self._latest[subset_id] = (now, None)
+            collection = io._database[io.Session["AVALON_PROJECT"]]
+            result = collection.aggregate([
+                {"$match": {
+                    "type": "version",
+                    "parent": {"$in": list(outdated_subset_ids)}
+                }},
+                {"$group": {"_id": "$parent", "name": {"$max": "$name"}}}
+            ])
+            for item in result:
+                self._latest[item["_id"]] = (now, item["name"])
+
+        output = {}
+        for version_id in version_ids:
+            version_doc = self._versions[version_id]
+            if not version_doc:
+                output[version_id] = None
+            elif version_doc["type"] == "master_version":
+                output[version_id] = True
+            else:
+                latest_name = self._latest[version_doc["parent"]][1]
+                output[version_id] = version_doc["name"] == latest_name
+        return output
+
+    def outdated_containers(self, containers):
+        """Containers which representation is not of latest version."""
+        containers = list(containers)
+        statuses = self.representations_status(
+            container["representation"] for container in containers
+        )
+        outdated = []
+        for container in containers:
+            status = statuses[str(container["representation"])]
+            if status is False:
+                outdated.append(container)
+            elif status is None:
+                log.debug("Container '{objectName}' has an invalid "
+                          "representation, it is missing in the "
+                          "database".format(**container))
+        return outdated
+
+
+container_version_status = ContainerVersionStatus()
+
+
 def is_latest(representation):
     """Return whether the representation is from latest version
 
@@ -241,49 +419,16 @@ def is_latest(representation):
         bool: Whether the representation is of latest version.
 
     """
-
-    version = io.find_one({"_id": representation['parent']})
-    if version["type"] == "master_version":
-        return True
-
-    # Get highest version under the parent
-    highest_version = io.find_one({
-        "type": "version",
-        "parent": version["parent"]
-    }, sort=[("name", -1)], projection={"name": True})
-
-    if version['name'] == highest_version['name']:
-        return True
-    else:
-        return False
+    version_id = representation["parent"]
+    statuses = container_version_status.versions_status([version_id])
+    return statuses[version_id] is True
 
 
 def any_outdated():
     """Return whether the current scene has any outdated content"""
 
-    checked = set()
     host = avalon.api.registered_host()
-    for container in host.ls():
-        representation = container['representation']
-        if representation in checked:
-            continue
-
-        representation_doc = io.find_one(
-            {
-                "_id": io.ObjectId(representation),
-                "type": "representation"
-            },
-            projection={"parent": True}
-        )
-        if representation_doc and not is_latest(representation_doc):
-            return True
-        elif not representation_doc:
-            log.debug("Container '{objectName}' has an invalid "
-                      "representation, it is missing in the "
-                      "database".format(**container))
-
-        checked.add(representation)
-    return False
+    return bool(container_version_status.outdated_containers(host.ls()))
 
 
 def _rreplace(s, a, b, n=1):
@@ -538,7 +683,7 @@ def filter_pyblish_plugins(plugins):
 
     host = api.current_host()
 
-    presets = config.get_presets().get('plugins', {})
+    presets = get_presets().get('plugins', {})
 
     # iterate over plugins
     for plugin in plugins[:]:
@@ -546,8 +691,7 @@ def filter_pyblish_plugins(plugins):
         if not presets:
             continue
 
-        file = os.path.normpath(inspect.getsourcefile(plugin))
-        file = os.path.normpath(file)
+        file = plugin_index.plugin_file(plugin)
 
         # host determined from path
         host_from_file = file.split(os.path.sep)[-3:-2][0]
@@ -569,7 +713,226 @@ def filter_pyblish_plugins(plugins):
                 log.info('setting {}:{} on plugin {}'.format(
                     option, value, plugin.__name__))
 
-                setattr(plugin, option, value)
+                setattr(plugin, option, thaw(value))
+
+
+class PluginDiscoveryIndex(object):
+    """Persistent index of plugin modules used to speed up discovery.
+
+    Index stores for each plugin file its modification time, size and
+    classes defined in it (with names of base classes, hosts and families).
+    Modules of unchanged files are imported only once per process and files
+    which don't define any subclass of discovered superclass are not
+    imported at all when index knows about them.
+
+    Index is stored as json file to path set by `PYPE_PLUGIN_INDEX_PATH`
+    environment variable (persistence is disabled when is set to empty
+    string) or to temp directory.
+
+    Discovered classes are the same objects between discoveries so values
+    set by presets must be set with `set_preset_attr` and reverted with
+    `restore_defaults` before presets are applied again.
+    """
+
+    def __init__(self, index_path=None):
+        if index_path is None:
+            index_path = os.environ.get("PYPE_PLUGIN_INDEX_PATH")
+            if index_path is None:
+                index_path = os.path.join(
+                    tempfile.gettempdir(), "pype_plugin_index.json"
+                )
+        self.index_path = index_path
+
+        # Name of superclass which is currently discovered
+        self.superclass_name = None
+
+        self._entries = None
+        self._modules = {}
+        self._plugin_files = {}
+        # Original attributes of classes changed by presets
+        self._preset_defaults = {}
+        self._changed = False
+        self._lock = threading.Lock()
+
+    @property
+    def entries(self):
+        if self._entries is None:
+            self._entries = self._load()
+        return self._entries
+
+    @staticmethod
+    def file_key(filepath):
+        stat = os.stat(filepath)
+        return [stat.st_mtime, stat.st_size]
+
+    def has_subclass(self, filepath, key, superclass_name):
+        """File defines subclass of superclass.
+
+        Returns:
+            bool: None when file is not in index or has changed.
+        """
+        entry = self.entries.get(filepath)
+        if not entry or entry["key"] != key:
+            return None
+        for class_info in entry["classes"].values():
+            if superclass_name in class_info["bases"]:
+                return True
+        return False
+
+    def modules_from_path(self, path):
+        """Modules of plugin files in directory.
+
+        Replacement of `avalon.lib.modules_from_path` which imports only
+        files that changed since last call.
+        """
+        path = os.path.normpath(path)
+        if not os.path.isdir(path):
+            return []
+
+        superclass_name = self.superclass_name
+        modules = []
+        for filename in os.listdir(path):
+            # Ignore files which start with underscore
+            if filename.startswith("_"):
+                continue
+
+            mod_name, mod_ext = os.path.splitext(filename)
+            if not mod_ext == ".py":
+                continue
+
+            filepath = os.path.join(path, filename)
+            if not os.path.isfile(filepath):
+                continue
+
+            key = self.file_key(filepath)
+            if (
+                superclass_name
+                and self.has_subclass(filepath, key, superclass_name)
+                is False
+            ):
+                continue
+
+            module = self.import_module(filepath, key)
+            if module is not None:
+                modules.append(module)
+
+        self.save()
+        return modules
+
+    def import_module(self, filepath, key=None):
+        """Import module from file or return module imported before."""
+        if key is None:
+            key = self.file_key(filepath)
+
+        cached = self._modules.get(filepath)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        if cached is not None:
+            # Classes of changed module are replaced by new classes
+            for obj in vars(cached[1]).values():
+                if inspect.isclass(obj):
+                    self._preset_defaults.pop(obj, None)
+
+        mod_name = os.path.splitext(os.path.basename(filepath))[0]
+        module = types.ModuleType(mod_name)
+        module.__file__ = filepath
+        try:
+            with open(filepath) as stream:
+                six.exec_(stream.read(), module.__dict__)
+
+            # Store reference to original module, to avoid
+            # garbage collection from collecting it's global
+            # imports, such as `import os`.
+            sys.modules[filepath] = module
+
+        except Exception as exc:
+            log.warning("Skipped: \"{}\" ({})".format(mod_name, exc))
+            return None
+
+        self._modules[filepath] = (key, module)
+        self._store_entry(filepath, key, module)
+        return module
+
+    def set_preset_attr(self, plugin, attr, value):
+        """Set attribute of plugin class and remember its original value."""
+        defaults = self._preset_defaults.setdefault(plugin, {})
+        if attr not in defaults:
+            own_attrs = vars(plugin)
+            defaults[attr] = (attr in own_attrs, own_attrs.get(attr))
+        setattr(plugin, attr, value)
+
+    def restore_defaults(self, plugins):
+        """Revert attributes set by presets on plugin classes."""
+        for plugin in plugins:
+            defaults = self._preset_defaults.pop(plugin, None)
+            if not defaults:
+                continue
+
+            for attr, (has_own, value) in defaults.items():
+                if has_own:
+                    setattr(plugin, attr, value)
+                elif attr in vars(plugin):
+                    # Attribute was inherited from base class
+                    delattr(plugin, attr)
+
+    def plugin_file(self, plugin):
+        """Source file of plugin class (cached `inspect.getsourcefile`).
+
+        Plugin modules are executed again on each discover so cache is keyed
+        by module and name of class, not by class object.
+        """
+        cache_key = (plugin.__module__, plugin.__name__)
+        filepath = self._plugin_files.get(cache_key)
+        if filepath is None:
+            filepath = os.path.normpath(inspect.getsourcefile(plugin))
+            self._plugin_files[cache_key] = filepath
+        return filepath
+
+    def _store_entry(self, filepath, key, module):
+        classes = {}
+        # Imported classes are included too as avalon discovers them
+        for name, obj in vars(module).items():
+            if not inspect.isclass(obj):
+                continue
+            classes[name] = {
+                "bases": [base.__name__ for base in inspect.getmro(obj)],
+                "hosts": list(getattr(obj, "hosts", None) or []),
+                "families": list(getattr(obj, "families", None) or [])
+            }
+
+        with self._lock:
+            self.entries[filepath] = {"key": key, "classes": classes}
+            self._changed = True
+
+    def _load(self):
+        if not self.index_path or not os.path.exists(self.index_path):
+            return {}
+        try:
+            with open(self.index_path, "r") as stream:
+                return json.load(stream)
+        except (IOError, OSError, ValueError):
+            return {}
+
+    def save(self):
+        """Store index to disk if was changed."""
+        if not self.index_path or not self._changed:
+            return
+
+        try:
+            tmp_path = "{}.{}.tmp".format(self.index_path, uuid.uuid4().hex)
+            with open(tmp_path, "w") as stream:
+                json.dump(self.entries, stream, default=str)
+            if os.path.exists(self.index_path):
+                os.remove(self.index_path)
+            os.rename(tmp_path, self.index_path)
+            self._changed = False
+
+        except (IOError, OSError):
+            log.debug("Failed to store plugin index.", exc_info=True)
+
+
+plugin_index = PluginDiscoveryIndex()
 
 
 def get_subsets(asset_name,
@@ -1365,8 +1728,142 @@ class BuildWorkfile:
         return output
 
 
-def ffprobe_streams(path_to_file):
-    """Load streams from entered filepath via ffprobe."""
+class FFprobeCache(object):
+    """Process wide and on-disk cache of ffprobe outputs.
+
+    Outputs are keyed by normalized path, modification time and size of
+    probed file so changed file is probed again. Memory cache keeps
+    `capacity` most recently used outputs. Outputs are also stored as json
+    files to `cache_dir` so other processes (e.g. burnin script) don't have
+    to probe the same file again. Disk cache keeps at most
+    `disk_capacity` files.
+
+    Directory of disk cache can be changed with `PYPE_FFPROBE_CACHE_DIR`
+    environment variable, disk cache is disabled when is set to empty
+    string.
+    """
+
+    def __init__(self, capacity=512, cache_dir=None, disk_capacity=4096):
+        if cache_dir is None:
+            cache_dir = os.environ.get("PYPE_FFPROBE_CACHE_DIR")
+            if cache_dir is None:
+                cache_dir = os.path.join(
+                    tempfile.gettempdir(), "pype_ffprobe_cache"
+                )
+
+        self.capacity = capacity
+        self.cache_dir = cache_dir
+        self.disk_capacity = disk_capacity
+
+        self._items = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def cache_key(path):
+        path = os.path.normpath(os.path.abspath(path))
+        stat = os.stat(path)
+        return "|".join((path, str(stat.st_mtime), str(stat.st_size)))
+
+    def get(self, path):
+        """Cached ffprobe output of the file or None."""
+        key = self.cache_key(path)
+        with self._lock:
+            data = self._items.get(key)
+            if data is not None:
+                # Move to the end as most recently used
+                self._items.pop(key)
+                self._items[key] = data
+                return data
+
+        data = self._disk_get(key)
+        if data is not None:
+            self._memory_set(key, data)
+        return data
+
+    def set(self, path, data):
+        key = self.cache_key(path)
+        self._memory_set(key, data)
+        self._disk_set(key, data)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+    def _memory_set(self, key, data):
+        with self._lock:
+            self._items.pop(key, None)
+            self._items[key] = data
+            while len(self._items) > self.capacity:
+                self._items.popitem(last=False)
+
+    def _disk_path(self, key):
+        filename = hashlib.sha1(key.encode("utf-8")).hexdigest() + ".json"
+        return os.path.join(self.cache_dir, filename)
+
+    def _disk_get(self, key):
+        if not self.cache_dir:
+            return None
+
+        filepath = self._disk_path(key)
+        try:
+            with open(filepath, "r") as stream:
+                content = json.load(stream)
+        except (IOError, OSError, ValueError):
+            return None
+
+        # Protection against hash collision
+        if content.get("key") != key:
+            return None
+        return content.get("data")
+
+    def _disk_set(self, key, data):
+        if not self.cache_dir:
+            return
+
+        try:
+            if not os.path.exists(self.cache_dir):
+                os.makedirs(self.cache_dir)
+
+            # Write to temporary file first so other processes never read
+            # incomplete file
+            filepath = self._disk_path(key)
+            tmp_path = "{}.{}.tmp".format(filepath, uuid.uuid4().hex)
+            with open(tmp_path, "w") as stream:
+                json.dump({"key": key, "data": data}, stream)
+            if os.path.exists(filepath):
+                os.remove(filepath)
+            os.rename(tmp_path, filepath)
+
+            self._disk_evict()
+
+        except (IOError, OSError):
+            log.debug("Failed to store ffprobe cache.", exc_info=True)
+
+    def _disk_evict(self):
+        filenames = [
+            filename
+            for filename in os.listdir(self.cache_dir)
+            if filename.endswith(".json")
+        ]
+        overflow = len(filenames) - self.disk_capacity
+        if overflow <= 0:
+            return
+
+        filepaths = sorted(
+            (os.path.join(self.cache_dir, filename) for filename in filenames),
+            key=os.path.getmtime
+        )
+        for filepath in filepaths[:overflow]:
+            try:
+                os.remove(filepath)
+            except OSError:
+                pass
+
+
+ffprobe_cache = FFprobeCache()
+
+
+def _ffprobe(path_to_file):
     log.info(
         "Getting information about input \"{}\".".format(path_to_file)
     )
@@ -1384,7 +1881,62 @@ def ffprobe_streams(path_to_file):
 
     popen_output = popen.communicate()[0]
     log.debug("FFprobe output: {}".format(popen_output))
-    return json.loads(popen_output)["streams"]
+    if popen.returncode != 0:
+        raise RuntimeError("Failed to run: {}".format(command))
+    return json.loads(popen_output)
+
+
+def ffprobe_data(path_to_file, use_cache=True):
+    """Load ffprobe output (format and streams) of entered filepath.
+
+    Output is stored to `ffprobe_cache` so the same file is not probed
+    multiple times.
+    """
+    if use_cache:
+        data = ffprobe_cache.get(path_to_file)
+        if data is not None:
+            log.debug(
+                "Using cached ffprobe output of \"{}\".".format(path_to_file)
+            )
+            return data
+
+    data = _ffprobe(path_to_file)
+    if use_cache:
+        ffprobe_cache.set(path_to_file, data)
+    return data
+
+
+def ffprobe_streams(path_to_file, use_cache=True):
+    """Load streams from entered filepath via ffprobe."""
+    return ffprobe_data(path_to_file, use_cache)["streams"]
+
+
+def ffprobe_streams_batch(paths, max_workers=4, use_cache=True):
+    """Load streams of multiple files concurrently.
+
+    Each unique path is probed only once and files which are already
+    cached are not probed at all.
+
+    Returns:
+        dict: Streams by entered path.
+    """
+    unique_paths = list(collections.OrderedDict.fromkeys(paths))
+    if len(unique_paths) < 2 or max_workers < 2:
+        results = [
+            ffprobe_streams(path, use_cache) for path in unique_paths
+        ]
+    else:
+        pool = ThreadPool(min(max_workers, len(unique_paths)))
+        try:
+            results = pool.map(
+                lambda path: ffprobe_streams(path, use_cache),
+                unique_paths,
+                chunksize=1
+            )
+        finally:
+            pool.close()
+            pool.join()
+    return dict(zip(unique_paths, results))
 
 
 def source_hash(filepath, *args):
@@ -1408,6 +1960,586 @@ def source_hash(filepath, *args):
     return "|".join([file_name, time, size] + list(args)).replace(".", ",")
 
 
+class FileTransferError(Exception):
+    pass
+
+
+class FileTransfer(object):
+    """Copy and hardlink files with a bounded pool of worker threads.
+
+    Destination directories are created only once for each unique directory
+    before workers start. Every copied file is verified by comparing size of
+    source and destination and copy is retried `retries` times before
+    the transfer fails.
+
+    Args:
+        max_workers (int): Maximum number of files transferred at once.
+        retries (int): How many times is copy of a file repeated when
+            verification fails.
+        copy_function (callable): Function used to copy single file. Must
+            accept source and destination path. `shutil.copyfile` is used
+            when not set.
+        logger (logging.Logger): Logger used for reporting.
+
+    Example:
+        >>> transfer = FileTransfer(max_workers=4)
+        >>> transfer.add_copy("/staging/file.exr", "/publish/file.exr")
+        >>> transferred = transfer.process()
+        >>> transfer.report()
+    """
+
+    def __init__(
+        self, max_workers=8, retries=2, copy_function=None, logger=None
+    ):
+        self.max_workers = max(1, int(max_workers or 1))
+        self.retries = max(0, int(retries or 0))
+        self.copy_function = copy_function or shutil.copyfile
+        self.log = logger or log
+
+        # Destination path -> size in bytes of transferred files
+        self.transferred = {}
+        self.duration = 0.0
+
+        self._copies = []
+        self._hardlinks = []
+        self._lock = threading.Lock()
+
+    @property
+    def transferred_bytes(self):
+        return sum(self.transferred.values())
+
+    def add_copy(self, src, dst):
+        self._copies.append((os.path.normpath(src), os.path.normpath(dst)))
+
+    def add_hardlink(self, src, dst):
+        self._hardlinks.append((os.path.normpath(src), os.path.normpath(dst)))
+
+    def process(self):
+        """Transfer all queued files.
+
+        Files that were transferred before an error occurred are still
+        available in `transferred` so caller is able to clean them up.
+
+        Returns:
+            dict: Destination path and size of each transferred file.
+        """
+        copies = self._copies
+        hardlinks = self._hardlinks
+        self._copies = []
+        self._hardlinks = []
+
+        start = time.time()
+        try:
+            self._create_dirs(
+                [dst for _src, dst in copies]
+                + [dst for _src, dst in hardlinks]
+            )
+
+            # Hardlinks are cheap so there is no need to use pool for them
+            for src, dst in hardlinks:
+                self._hardlink(src, dst)
+
+            if len(copies) < 2 or self.max_workers == 1:
+                for item in copies:
+                    self._copy(item)
+            else:
+                pool = ThreadPool(min(self.max_workers, len(copies)))
+                try:
+                    # `map` re-raises first exception from workers
+                    pool.map(self._copy, copies, chunksize=1)
+                finally:
+                    pool.close()
+                    pool.join()
+        finally:
+            self.duration += time.time() - start
+
+        return dict(self.transferred)
+
+    def report(self):
+        """Log throughput of transferred files."""
+        file_count = len(self.transferred)
+        megabytes = self.transferred_bytes / (1024.0 * 1024.0)
+        duration = self.duration or 0.000001
+        self.log.info((
+            "Transferred {} files ({:.2f} MB) in {:.2f}s"
+            " - {:.2f} files/s, {:.2f} MB/s"
+        ).format(
+            file_count, megabytes, self.duration,
+            file_count / duration, megabytes / duration
+        ))
+
+    def _create_dirs(self, paths):
+        dirpaths = set(os.path.dirname(path) for path in paths)
+        for dirpath in dirpaths:
+            if not dirpath:
+                continue
+            try:
+                os.makedirs(dirpath)
+            except OSError as exc:
+                if exc.errno != errno.EEXIST:
+                    self.log.critical(
+                        "Unable to create directory \"{}\"".format(dirpath)
+                    )
+                    raise
+
+    def _hardlink(self, src, dst):
+        self.log.debug("Hardlinking file ... {} -> {}".format(src, dst))
+        if not os.path.exists(dst):
+            filelink.create(src, dst, filelink.HARDLINK)
+        self._store(dst, os.path.getsize(dst))
+
+    def _copy(self, item):
+        src, dst = item
+        self.log.debug("Copying file ... {} -> {}".format(src, dst))
+        src_size = os.path.getsize(src)
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                self.copy_function(src, dst)
+            except getattr(shutil, "SameFileError", shutil.Error):
+                self.log.warning(
+                    "Files are the same {} to {}".format(src, dst)
+                )
+                os.remove(dst)
+                shutil.copyfile(src, dst)
+
+            dst_size = os.path.getsize(dst)
+            if dst_size == src_size:
+                break
+
+            if attempt > self.retries:
+                raise FileTransferError((
+                    "Copy of \"{}\" to \"{}\" failed verification after {}"
+                    " attempts. Source size {}, destination size {}."
+                ).format(src, dst, attempt, src_size, dst_size))
+
+            self.log.warning((
+                "Size of copied file \"{}\" does not match source."
+                " Retrying ({}/{})."
+            ).format(dst, attempt, self.retries))
+
+        self._store(dst, dst_size)
+
+    def _store(self, dst, size):
+        with self._lock:
+            self.transferred[dst] = size
+
+
+def file_content_hash(filepath, algorithm="sha256", chunk_size=1048576):
+    """Return hex digest of file content.
+
+    File is read in chunks so memory usage does not depend on file size.
+
+    Args:
+        filepath (str): Path to file.
+        algorithm (str): Name of `hashlib` algorithm.
+        chunk_size (int): Size of chunk read at once in bytes.
+    """
+    hash_obj = hashlib.new(algorithm)
+    with open(filepath, "rb") as stream:
+        while True:
+            chunk = stream.read(chunk_size)
+            if not chunk:
+                break
+            hash_obj.update(chunk)
+    return hash_obj.hexdigest()
+
+
+class ContentStore(object):
+    """Content addressed storage of published files.
+
+    Each unique file content is stored only once as blob named by hash of
+    it's content (`<store root>/<hash[:2]>/<hash>`). Published files are
+    created as reflinks to blobs where filesystem supports them, hardlinks
+    otherwise and copied only when neither of them is possible (e.g. blob
+    store is on different volume than destination).
+
+    Republishing of unchanged file thus costs only reading of the file to
+    calculate it's hash.
+
+    Args:
+        root (str): Directory where blobs are stored.
+        algorithm (str): Name of `hashlib` algorithm used for content hash.
+        logger (logging.Logger): Logger used for reporting.
+    """
+
+    # Linux ioctl request code cloning file content (copy-on-write)
+    FICLONE = 0x40049409
+
+    def __init__(self, root, algorithm="sha256", logger=None):
+        self.root = os.path.normpath(root)
+        self.algorithm = algorithm
+        self.log = logger or log
+
+        # Destination path -> content hash of files created by `copy`
+        self.hashes = {}
+
+    @classmethod
+    def from_anatomy(cls, anatomy, template_name, dirname=".blobs", **kwargs):
+        """Create store in project directory of root used by template."""
+        root = anatomy.root_value_for_template(
+            anatomy.templates[template_name]["path"]
+        )
+        return cls(
+            os.path.join(str(root), anatomy.project_name, dirname), **kwargs
+        )
+
+    def format_hash(self, content_hash):
+        """Content hash as stored to `files[].hash` of representation."""
+        return "{}|{}".format(self.algorithm, content_hash)
+
+    def blob_path(self, content_hash):
+        return os.path.join(self.root, content_hash[:2], content_hash)
+
+    def store(self, src):
+        """Store content of source file if is not stored yet.
+
+        Returns:
+            str: Content hash of the file.
+        """
+        content_hash = file_content_hash(src, self.algorithm)
+        blob_path = self.blob_path(content_hash)
+        if os.path.exists(blob_path):
+            self.log.debug("Content of \"{}\" is already stored.".format(src))
+            return content_hash
+
+        blob_dir = os.path.dirname(blob_path)
+        try:
+            os.makedirs(blob_dir)
+        except OSError as exc:
+            if exc.errno != errno.EEXIST:
+                raise
+
+        # Copy to temporary file first so other processes never see
+        # incomplete blob
+        tmp_path = "{}.{}.tmp".format(blob_path, uuid.uuid4().hex)
+        shutil.copyfile(src, tmp_path)
+        try:
+            os.rename(tmp_path, blob_path)
+        except OSError:
+            # Same content was stored in the meantime (Windows does not
+            # allow to rename over existing file)
+            os.remove(tmp_path)
+            if not os.path.exists(blob_path):
+                raise
+        return content_hash
+
+    def link(self, content_hash, dst):
+        """Create destination file from stored blob."""
+        blob_path = self.blob_path(content_hash)
+        if os.path.lexists(dst):
+            os.remove(dst)
+
+        if self._reflink(blob_path, dst):
+            return
+
+        try:
+            os.link(blob_path, dst)
+            return
+        except (OSError, AttributeError):
+            self.log.debug((
+                "Hardlink of \"{}\" is not possible. Copying."
+            ).format(blob_path))
+        shutil.copyfile(blob_path, dst)
+
+    def copy(self, src, dst):
+        """Store source file and create destination linked to the blob.
+
+        Can be used as copy function of `FileTransfer`.
+        """
+        content_hash = self.store(src)
+        self.link(content_hash, dst)
+        self.hashes[os.path.normpath(dst)] = content_hash
+
+    def _reflink(self, src, dst):
+        if fcntl is None or not sys.platform.startswith("linux"):
+            return False
+
+        with open(src, "rb") as src_stream:
+            with open(dst, "wb") as dst_stream:
+                try:
+                    fcntl.ioctl(
+                        dst_stream.fileno(), self.FICLONE, src_stream.fileno()
+                    )
+                    return True
+                except (IOError, OSError):
+                    pass
+        os.remove(dst)
+        return False
+
+
+class FrameSequence(object):
+    """Image sequence found in a directory.
+
+    Frames are stored as sorted list of continuous `[start, end]` ranges and
+    file sizes in compact `array` so even sequences with many thousands of
+    frames don't keep file name for each frame.
+
+    Args:
+        directory (str): Directory of the sequence.
+        head (str): File name part before frame number.
+        padding (int): Padding of frame number (0 when not padded).
+        tail (str): File name part after frame number.
+    """
+
+    def __init__(self, directory, head, padding, tail):
+        self.directory = directory
+        self.head = head
+        self.padding = padding
+        self.tail = tail
+        self.ranges = []
+        self.sizes = array.array("q")
+
+    def __repr__(self):
+        return "<FrameSequence \"{}\" {}>".format(
+            self.format(), self.format_ranges(self.ranges)
+        )
+
+    def __len__(self):
+        return len(self.sizes)
+
+    def _set_frames(self, items):
+        """Set frames from unordered list of (frame, size) pairs."""
+        items.sort()
+        ranges = []
+        sizes = array.array("q")
+        for frame, size in items:
+            if ranges and ranges[-1][1] + 1 == frame:
+                ranges[-1][1] = frame
+            else:
+                ranges.append([frame, frame])
+            sizes.append(size)
+        self.ranges = ranges
+        self.sizes = sizes
+
+    @property
+    def start(self):
+        return self.ranges[0][0] if self.ranges else None
+
+    @property
+    def end(self):
+        return self.ranges[-1][1] if self.ranges else None
+
+    def frames(self):
+        """Iterate over existing frames."""
+        for start, end in self.ranges:
+            for frame in range(start, end + 1):
+                yield frame
+
+    def frame_sizes(self):
+        """Iterate over (frame, size) pairs of existing frames."""
+        return zip(self.frames(), self.sizes)
+
+    def filename(self, frame):
+        return "{}{:0>{}}{}".format(self.head, frame, self.padding, self.tail)
+
+    def path(self, frame):
+        return os.path.join(self.directory, self.filename(frame))
+
+    def format(self, placeholder="#"):
+        """File name with frame number replaced by placeholder."""
+        return "{}{}{}".format(
+            self.head, placeholder * max(self.padding, 1), self.tail
+        )
+
+    def missing(self, start=None, end=None):
+        """Ranges of frames missing in sequence.
+
+        Args:
+            start (int): First expected frame. First existing frame is used
+                when not set.
+            end (int): Last expected frame. Last existing frame is used when
+                not set.
+
+        Returns:
+            list: Missing `(start, end)` ranges.
+        """
+        if start is None:
+            start = self.start
+        if end is None:
+            end = self.end
+        if start is None or end is None:
+            return []
+
+        missing = []
+        expected = start
+        for range_start, range_end in self.ranges:
+            if range_end < expected:
+                continue
+            if range_start > end:
+                break
+            if range_start > expected:
+                missing.append((expected, range_start - 1))
+            expected = range_end + 1
+        if expected <= end:
+            missing.append((expected, end))
+        return missing
+
+    def zero_byte_frames(self):
+        """Frames with empty files."""
+        return [frame for frame, size in self.frame_sizes() if size == 0]
+
+    def truncated_frames(self, ratio=0.5):
+        """Frames with file size suspiciously smaller than other frames.
+
+        Frame is considered truncated when its size is smaller than `ratio`
+        of median size of non-empty frames. Empty frames are reported by
+        `zero_byte_frames`.
+        """
+        sizes = sorted(size for size in self.sizes if size > 0)
+        if len(sizes) < 3:
+            return []
+        threshold = sizes[len(sizes) // 2] * ratio
+        return [
+            frame
+            for frame, size in self.frame_sizes()
+            if 0 < size < threshold
+        ]
+
+    @staticmethod
+    def format_ranges(ranges):
+        """Format frame ranges to string e.g. "1001-1010, 1012"."""
+        return ", ".join(
+            str(start) if start == end else "{}-{}".format(start, end)
+            for start, end in ranges
+        )
+
+
+class SequenceScanner(object):
+    """Scan directories for image sequences in one pass.
+
+    Files are grouped by head, padding and tail of file name. Each directory
+    is scanned only once, results are cached on the scanner so multiple
+    collectors and validators can share one scanner (e.g. stored in
+    `context.data`).
+
+    Example:
+        >>> scanner = SequenceScanner()
+        >>> sequence = scanner.find_sequence("/renders/beauty.1001.exr")
+        >>> sequence.missing(1001, 1100)
+        [(1050, 1052)]
+    """
+
+    # Frame number is last group of digits before extension
+    frame_regex = re.compile(
+        r"^(?P<head>.*?)(?P<frame>\d+)(?P<tail>\.[^.\d]\w*)$"
+    )
+    # Minimum number of files to consider files a sequence
+    minimum_items = 2
+
+    def __init__(self):
+        self._scans = {}
+
+    def scan(self, directory, refresh=False):
+        """Sequences found in directory.
+
+        Args:
+            directory (str): Directory to scan.
+            refresh (bool): Scan directory again even if it was scanned.
+
+        Returns:
+            list: `FrameSequence` objects found in directory.
+        """
+        directory = os.path.normpath(directory)
+        if refresh or directory not in self._scans:
+            self._scans[directory] = self._scan(directory)
+        return self._scans[directory]
+
+    def find_sequence(self, path):
+        """Find sequence matching file path (or pattern) in its directory.
+
+        Path may contain any frame number or padding placeholder
+        (`#`, `%04d`), only head and tail of file name are compared.
+        """
+        directory, filename = os.path.split(os.path.normpath(path))
+        filename = re.sub(r"(#+|%0?\d*d)(?=\.[^.\d]\w*$)", "0", filename)
+        match = self.frame_regex.match(filename)
+        if not match:
+            return None
+        head = match.group("head")
+        tail = match.group("tail")
+        for sequence in self.scan(directory):
+            if sequence.head == head and sequence.tail == tail:
+                return sequence
+        return None
+
+    def clear(self):
+        self._scans.clear()
+
+    def _scan(self, directory):
+        groups = collections.defaultdict(list)
+        for filename, size in self._iter_files(directory):
+            match = self.frame_regex.match(filename)
+            if not match:
+                continue
+            frame_str = match.group("frame")
+            padding = len(frame_str) if frame_str.startswith("0") else 0
+            key = (match.group("head"), padding, match.group("tail"))
+            groups[key].append((int(frame_str), size))
+
+        # Unpadded frames (e.g. 1000) belong to padded sequence (0999) when
+        # frame number is at least as long as padding
+        for key in list(groups.keys()):
+            head, padding, tail = key
+            if padding:
+                continue
+            for other_key in groups:
+                other_head, other_padding, other_tail = other_key
+                if (
+                    other_padding
+                    and other_head == head
+                    and other_tail == tail
+                    and all(
+                        len(str(frame)) >= other_padding
+                        for frame, _ in groups[key]
+                    )
+                ):
+                    groups[other_key].extend(groups.pop(key))
+                    break
+
+        sequences = []
+        for key, items in groups.items():
+            if len(items) < self.minimum_items:
+                continue
+            head, padding, tail = key
+            sequence = FrameSequence(directory, head, padding, tail)
+            sequence._set_frames(items)
+            sequences.append(sequence)
+        return sequences
+
+    @staticmethod
+    def _iter_files(directory):
+        """Yield file names and sizes in directory."""
+        if not os.path.isdir(directory):
+            return
+
+        scandir = getattr(os, "scandir", None)
+        if scandir is None:
+            # Python 2
+            for filename in os.listdir(directory):
+                path = os.path.join(directory, filename)
+                if os.path.isfile(path):
+                    yield filename, os.path.getsize(path)
+            return
+
+        for entry in scandir(directory):
+            try:
+                if entry.is_file():
+                    yield entry.name, entry.stat().st_size
+            except OSError:
+                continue
+
+
+def get_sequence_scanner(context):
+    """Sequence scanner shared by plugins of publish context."""
+    scanner = context.data.get("sequenceScanner")
+    if scanner is None:
+        scanner = SequenceScanner()
+        context.data["sequenceScanner"] = scanner
+    return scanner
+
+
 def get_latest_version(asset_name, subset_name):
     """Retrieve latest version from `asset_name`, and `subset_name`.
 
@@ -1,13 +1,48 @@
-import os
-import re
 import json
+import hashlib
+import datetime
+
 import bson
 import bson.json_util
-from pype.modules.rest_api import RestApi, abort, CallbackResult
+from bson.objectid import ObjectId
+from pype.modules.rest_api import RestApi, abort, StreamResult
 from avalon.api import AvalonMongoDB
 
 
+class AvalonJSONEncoder(json.JSONEncoder):
+    """Encode MongoDB documents directly to JSON.
+
+    ObjectId is converted to string and datetime to ISO format, other bson
+    types are converted with `bson.json_util`.
+    """
+
+    def default(self, obj):
+        if isinstance(obj, ObjectId):
+            return str(obj)
+
+        if isinstance(obj, (datetime.datetime, datetime.date)):
+            return obj.isoformat()
+
+        return bson.json_util.default(obj)
+
+
 class AvalonRestApi(RestApi):
+    """Read only access to avalon database.
+
+    Listing of assets is streamed from cursor to client without creating
+    whole response in memory. Listing may be paged with url query keys
+    `limit` and `skip`, or `limit` and `after` where `after` is value of
+    `next` key from previous page. Returned fields can be limited with
+    `fields` key (e.g. `?fields=name,data.parents`).
+
+    Responses with known size (single documents and pages) have ETag
+    created from their content so clients can use "If-None-Match".
+    """
+
+    # Documents encoded and sent to client at once
+    stream_batch_size = 100
+
+    encoder = AvalonJSONEncoder(separators=(",", ":"))
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -17,20 +52,23 @@ class AvalonRestApi(RestApi):
     @RestApi.route("/projects/<project_name>", url_prefix="/avalon", methods="GET")
     def get_project(self, request):
         project_name = request.url_data["project_name"]
+        projection = self.query_projection(request)
         if not project_name:
             output = {}
             for project_name in self.dbcon.tables():
-                project = self.dbcon[project_name].find_one({
-                    "type": "project"
-                })
+                project = self.dbcon[project_name].find_one(
+                    {"type": "project"}, projection
+                )
                 output[project_name] = project
 
-            return CallbackResult(data=self.result_to_json(output))
+            return self.json_response(request, output)
 
-        project = self.dbcon[project_name].find_one({"type": "project"})
+        project = self.dbcon[project_name].find_one(
+            {"type": "project"}, projection
+        )
 
         if project:
-            return CallbackResult(data=self.result_to_json(project))
+            return self.json_response(request, project)
 
         abort(404, "Project \"{}\" was not found in database".format(
             project_name
@@ -46,40 +84,167 @@ class AvalonRestApi(RestApi):
                 _project_name
             ))
 
+        projection = self.query_projection(request)
         if not _asset:
-            assets = self.dbcon[_project_name].find({"type": "asset"})
-            output = self.result_to_json(assets)
-            return CallbackResult(data=output)
+            return self.documents_response(
+                request,
+                self.dbcon[_project_name],
+                {"type": "asset"},
+                projection
+            )
 
         # identificator can be specified with url query (default is `name`)
-        identificator = request.query.get("identificator", "name")
+        identificator = self.query_value(request, "identificator", "name")
 
-        asset = self.dbcon[_project_name].find_one({
-            "type": "asset",
-            identificator: _asset
-        })
+        asset = self.dbcon[_project_name].find_one(
+            {"type": "asset", identificator: _asset},
+            projection
+        )
         if asset:
-            id = asset["_id"]
-            asset["_id"] = str(id)
-            return asset
+            return self.json_response(request, asset)
 
         abort(404, "Asset \"{}\" with {} was not found in project {}".format(
             _asset, identificator, _project_name
         ))
 
+    @staticmethod
+    def query_value(request, key, default=None):
+        """First value of key in url query."""
+        values = request.query.get(key)
+        if not values:
+            return default
+        if isinstance(values, (list, tuple)):
+            return values[0]
+        return values
+
+    def query_int(self, request, key):
+        value = self.query_value(request, key)
+        if value is None:
+            return None
+        try:
+            value = int(value)
+        except ValueError:
+            value = -1
+
+        if value < 0:
+            abort(400, "Query \"{}\" must be positive integer".format(key))
+        return value
+
+    def query_projection(self, request):
+        """Projection of documents from comma separated `fields` query."""
+        fields = self.query_value(request, "fields")
+        if not fields:
+            return None
+
+        projection = {}
+        for field in fields.split(","):
+            field = field.strip()
+            if field:
+                projection[field] = True
+        return projection or None
+
+    def encode(self, data):
+        return self.encoder.encode(data)
+
+    def not_modified(self, request, etag):
+        """Check if client has the same content as response with etag."""
+        if_none_match = request.handler.headers.get("If-None-Match")
+        if not if_none_match:
+            return False
+
+        for value in if_none_match.split(","):
+            value = value.strip()
+            if value.startswith("W/"):
+                value = value[2:]
+            if value in ("*", etag):
+                return True
+        return False
+
+    def etag_response(self, request, chunks):
+        """Create response with ETag from already encoded body parts."""
+        content_hash = hashlib.sha1()
+        for chunk in chunks:
+            content_hash.update(chunk.encode())
+        etag = "\"{}\"".format(content_hash.hexdigest())
+
+        headers = {"ETag": etag}
+        if self.not_modified(request, etag):
+            return StreamResult(status_code=304, headers=headers)
+
+        return StreamResult(chunks, headers=headers)
+
+    def json_response(self, request, data):
+        """Response with single encoded object under "data" key."""
+        return self.etag_response(request, [
+            "{\"success\":true,\"data\":",
+            self.encode(data),
+            "}"
+        ])
+
+    def documents_response(self, request, collection, query, projection):
+        """Response with documents from query under "data" key.
+
+        Documents of page are encoded before response to be able create
+        ETag. When page is not requested documents are streamed from cursor
+        as they are received from database.
+        """
+        limit = self.query_int(request, "limit")
+        skip = self.query_int(request, "skip")
+        after = self.query_value(request, "after")
+        if after is not None:
+            if not ObjectId.is_valid(after):
+                abort(400, "Query \"after\" is not valid id")
+            query = dict(query)
+            query["_id"] = {"$gt": ObjectId(after)}
+
+        cursor = collection.find(query, projection)
+        cursor.batch_size(self.stream_batch_size)
+        if limit or skip or after is not None:
+            # Pages must have stable order
+            cursor.sort("_id", 1)
+        if skip:
+            cursor.skip(skip)
+
+        if not limit:
+            return StreamResult(self._stream_documents(cursor))
+
+        docs = list(cursor.limit(limit))
+        next_id = None
+        if len(docs) == limit:
+            next_id = docs[-1]["_id"]
+
+        chunks = ["{\"success\":true,\"data\":["]
+        chunks.append(",".join(self.encode(doc) for doc in docs))
+        chunks.append("],\"next\":{}}}".format(self.encode(next_id)))
+        return self.etag_response(request, chunks)
+
+    def _stream_documents(self, cursor):
+        yield "{\"success\":true,\"data\":["
+        try:
+            batch = []
+            first = True
+            for doc in cursor:
+                batch.append(self.encode(doc))
+                if len(batch) < self.stream_batch_size:
+                    continue
+
+                if not first:
+                    yield ","
+                yield ",".join(batch)
+                first = False
+                batch = []
+
+            if batch:
+                if not first:
+                    yield ","
+                yield ",".join(batch)
+        finally:
+            cursor.close()
+        yield "],\"next\":null}"
+
     def result_to_json(self, result):
-        """ Converts result of MongoDB query to dict without $oid (ObjectId)
-        keys with help of regex matching.
+        """Converts result of MongoDB query to json serializable objects.
 
-        ..note:
-            This will convert object type entries similar to ObjectId.
+        ObjectId values are converted to string and datetime to ISO format.
         """
-        bson_json = bson.json_util.dumps(result)
-        # Replace "{$oid: "{entity id}"}" with "{entity id}"
-        regex1 = '(?P<id>{\"\$oid\": \"[^\"]+\"})'
-        regex2 = '{\"\$oid\": (?P<id>\"[^\"]+\")}'
-        for value in re.findall(regex1, bson_json):
-            for substr in re.findall(regex2, value):
-                bson_json = bson_json.replace(value, substr)
-
-        return json.loads(bson_json)
+        return json.loads(self.encode(result))
@@ -9,6 +9,7 @@ import traceback
 
 from bson.objectid import ObjectId
 from pymongo import UpdateOne
+from pymongo.errors import PyMongoError
 
 from avalon import schema
 
@@ -22,9 +23,246 @@ from pype.modules.ftrack import BaseEvent
 from avalon.api import AvalonMongoDB
 
 
-class SyncToAvalonEvent(BaseEvent):
+class AvalonEntityIndex:
+    """Long lived index of avalon documents of one project.
+
+    Project, asset, archived asset and subset documents are loaded once and
+    kept between events. Changes made by other processes are detected at
+    the start of each event with change stream of project collection. When
+    change streams are not available (standalone MongoDB) documents of
+    entities related to event (and subsets under them) are queried again,
+    count and the biggest `_id` of each document type are compared to
+    detect created or removed documents and index is fully reloaded on
+    mismatch or after `max_age` seconds. Documents written by event handler
+    are re-queried with `refresh`.
+    """
+
+    doc_types = ("project", "asset", "archived_asset", "subset")
+    # Full reload interval in seconds when change streams are not available
+    max_age = 600
+
+    def __init__(self, dbcon, log):
+        self.dbcon = dbcon
+        self.log = log
+
+        self.project = None
+        self.assets = []
+        self.archived_by_id = {}
+        self.subsets_by_parents = collections.defaultdict(list)
+        self._subset_parents = {}
+
+        self._stream = None
+        self._signature = None
+        self._loaded_time = None
+
+    def validate(self, ftrack_ids=None):
+        """Make sure index match database before event is processed.
+
+        Args:
+            ftrack_ids (iterable): Ftrack ids of entities related to event.
+                Their documents are queried again when changes can't be
+                received with change stream.
+        """
+        if self._loaded_time is None:
+            self.load()
 
-    dbcon = AvalonMongoDB()
+        elif self._stream is not None:
+            self._apply_stream_changes()
+
+        elif (
+            time.time() - self._loaded_time > self.max_age
+            or self.signature() != self._signature
+        ):
+            self.log.debug("Avalon documents changed. Reloading index.")
+            self.load()
+
+        elif ftrack_ids:
+            # In-place updates are not visible in signature
+            self.refresh_by_ftrack_ids(ftrack_ids)
+
+    def load(self):
+        self.close()
+        # Open stream before query so changes made meanwhile are not lost
+        self._stream = self._open_stream()
+
+        self.project = None
+        self.assets = []
+        self.archived_by_id = {}
+        self.subsets_by_parents = collections.defaultdict(list)
+        self._subset_parents = {}
+        for doc in self.dbcon.find({"type": {"$in": list(self.doc_types)}}):
+            self._add(doc)
+
+        if self._stream is None:
+            self._signature = self.signature()
+        self._loaded_time = time.time()
+
+    def refresh(self, doc_ids):
+        """Replace documents by their current state in database."""
+        doc_ids = set(doc_ids)
+        if not doc_ids:
+            return
+
+        docs = self.dbcon.find({
+            "_id": {"$in": list(doc_ids)},
+            "type": {"$in": list(self.doc_types)}
+        })
+        self._replace(doc_ids, docs)
+        if self._stream is None:
+            self._signature = self.signature()
+
+    def refresh_by_ftrack_ids(self, ftrack_ids):
+        """Replace documents of ftrack entities and subsets under them."""
+        ftrack_ids = set(ftrack_ids)
+        docs = list(self.dbcon.find({
+            "type": {"$in": list(self.doc_types)},
+            "data.ftrackId": {"$in": list(ftrack_ids)}
+        }))
+
+        # Documents may have been removed or had ftrack id changed
+        doc_ids = set(doc["_id"] for doc in docs)
+        for doc in self.iter_docs():
+            if doc.get("data", {}).get("ftrackId") in ftrack_ids:
+                doc_ids.add(doc["_id"])
+
+        parent_ids = [
+            doc_id for doc_id in doc_ids
+            if doc_id not in self._subset_parents
+        ]
+        for parent_id in parent_ids:
+            for subset in self.subsets_by_parents.get(parent_id) or []:
+                doc_ids.add(subset["_id"])
+
+        for subset in self.dbcon.find({
+            "type": "subset",
+            "parent": {"$in": parent_ids}
+        }):
+            doc_ids.add(subset["_id"])
+            docs.append(subset)
+
+        self._replace(doc_ids, docs)
+
+    def iter_docs(self):
+        if self.project is not None:
+            yield self.project
+        for doc in self.assets:
+            yield doc
+        for doc in self.archived_by_id.values():
+            yield doc
+
+    def signature(self):
+        result = self.dbcon.aggregate([
+            {"$match": {"type": {"$in": list(self.doc_types)}}},
+            {"$group": {
+                "_id": "$type",
+                "count": {"$sum": 1},
+                "last_id": {"$max": "$_id"}
+            }}
+        ])
+        return sorted(
+            (item["_id"], item["count"], item["last_id"])
+            for item in result
+        )
+
+    def close(self):
+        if self._stream is not None:
+            try:
+                self._stream.close()
+            except PyMongoError:
+                pass
+        self._stream = None
+
+    def _open_stream(self):
+        pipeline = [{"$match": {"$or": [
+            {"operationType": {"$nin": ["insert", "update", "replace"]}},
+            {"fullDocument.type": {"$in": list(self.doc_types)}}
+        ]}}]
+        try:
+            return self.dbcon.watch(pipeline, full_document="updateLookup")
+        except PyMongoError:
+            self.log.debug(
+                "Change streams are not available. Index will be validated"
+                " by documents count."
+            )
+        return None
+
+    def _apply_stream_changes(self):
+        doc_ids = set()
+        docs_by_id = {}
+        try:
+            while True:
+                change = self._stream.try_next()
+                if change is None:
+                    break
+
+                operation = change["operationType"]
+                if operation not in ("insert", "update", "replace", "delete"):
+                    # Collection was dropped, renamed or stream invalidated
+                    self.load()
+                    return
+
+                doc_id = change["documentKey"]["_id"]
+                doc_ids.add(doc_id)
+                doc = change.get("fullDocument")
+                if doc is not None:
+                    docs_by_id[doc_id] = doc
+                else:
+                    docs_by_id.pop(doc_id, None)
+
+        except PyMongoError:
+            self.log.warning(
+                "Change stream failed. Reloading index.", exc_info=True
+            )
+            self.load()
+            return
+
+        if doc_ids:
+            docs = [
+                doc for doc in docs_by_id.values()
+                if doc.get("type") in self.doc_types
+            ]
+            self._replace(doc_ids, docs)
+
+    def _add(self, doc):
+        doc_type = doc["type"]
+        if doc_type == "project":
+            self.project = doc
+
+        elif doc_type == "asset":
+            self.assets.append(doc)
+
+        elif doc_type == "archived_asset":
+            self.archived_by_id[doc["_id"]] = doc
+
+        elif doc_type == "subset":
+            self.subsets_by_parents[doc["parent"]].append(doc)
+            self._subset_parents[doc["_id"]] = doc["parent"]
+
+    def _replace(self, doc_ids, docs):
+        # Lists are modified in place as they may be referenced by handler
+        self.assets[:] = [
+            doc for doc in self.assets if doc["_id"] not in doc_ids
+        ]
+        for doc_id in doc_ids:
+            self.archived_by_id.pop(doc_id, None)
+            parent_id = self._subset_parents.pop(doc_id, None)
+            if parent_id is None:
+                continue
+
+            subsets = [
+                doc for doc in self.subsets_by_parents[parent_id]
+                if doc["_id"] != doc_id
+            ]
+            if subsets:
+                self.subsets_by_parents[parent_id] = subsets
+            else:
+                self.subsets_by_parents.pop(parent_id)
+
+        for doc in docs:
+            self._add(doc)
+
+
+class SyncToAvalonEvent(BaseEvent):
 
     interest_entTypes = ["show", "task"]
     ignore_ent_types = ["Milestone"]
@@ -57,6 +295,11 @@ class SyncToAvalonEvent(BaseEvent):
         # - store synchronize entity types to be able to use
         #   only entityTypes in interest instead of filtering by ignored
         self.debug_sync_types = collections.defaultdict(list)
+        # Avalon documents indexes by project name kept between events
+        self.entity_indexes = {}
+        # Each handler has own connection as handlers of event worker
+        #   sessions may process events of different projects at once
+        self.dbcon = AvalonMongoDB()
 
         # Set processing session to not use global
         self.set_process_session(session)
@@ -108,16 +351,62 @@ class SyncToAvalonEvent(BaseEvent):
             )
         return self._avalon_cust_attrs
 
+    @property
+    def entity_index(self):
+        """Persistent index of avalon documents of current project."""
+        if self._entity_index is None:
+            project_name = self.cur_project["full_name"]
+            self.dbcon.install()
+            self.dbcon.Session["AVALON_PROJECT"] = project_name
+            index = self.entity_indexes.get(project_name)
+            if index is None:
+                index = AvalonEntityIndex(self.dbcon, self.log)
+                self.entity_indexes[project_name] = index
+            index.validate(self.event_ftrack_ids)
+            self._entity_index = index
+        return self._entity_index
+
+    @staticmethod
+    def collect_event_ftrack_ids(event):
+        """Ftrack ids of entities in event, their parents and new parents."""
+        ftrack_ids = set()
+        for ent_info in event["data"]["entities"]:
+            entity_id = ent_info.get("entityId")
+            if isinstance(entity_id, list):
+                ftrack_ids.update(entity_id)
+            elif entity_id:
+                ftrack_ids.add(entity_id)
+
+            for parent in ent_info.get("parents") or []:
+                parent_id = parent.get("entityId")
+                if parent_id:
+                    ftrack_ids.add(parent_id)
+
+            changes = ent_info.get("changes") or {}
+            parent_change = changes.get("parent_id") or {}
+            for key in ("new", "old"):
+                parent_id = parent_change.get(key)
+                if parent_id:
+                    ftrack_ids.add(parent_id)
+        return ftrack_ids
+
+    def drop_entity_index(self):
+        """Forget index of current project so it's loaded again."""
+        index = self._entity_index
+        if index is None:
+            return
+
+        for project_name, _index in tuple(self.entity_indexes.items()):
+            if _index is index:
+                self.entity_indexes.pop(project_name)
+        index.close()
+        self._entity_index = None
+
     @property
     def avalon_entities(self):
         if self._avalon_ents is None:
-            self.dbcon.install()
-            self.dbcon.Session["AVALON_PROJECT"] = (
-                self.cur_project["full_name"]
-            )
-            avalon_project = self.dbcon.find_one({"type": "project"})
-            avalon_entities = list(self.dbcon.find({"type": "asset"}))
-            self._avalon_ents = (avalon_project, avalon_entities)
+            index = self.entity_index
+            self._avalon_ents = (index.project, index.assets)
         return self._avalon_ents
 
     @property
@@ -170,27 +459,15 @@ class SyncToAvalonEvent(BaseEvent):
     @property
     def avalon_subsets_by_parents(self):
         if self._avalon_subsets_by_parents is None:
-            self._avalon_subsets_by_parents = collections.defaultdict(list)
-            self.dbcon.install()
-            self.dbcon.Session["AVALON_PROJECT"] = (
-                self.cur_project["full_name"]
+            self._avalon_subsets_by_parents = (
+                self.entity_index.subsets_by_parents
             )
-            for subset in self.dbcon.find({"type": "subset"}):
-                self._avalon_subsets_by_parents[subset["parent"]].append(
-                    subset
-                )
         return self._avalon_subsets_by_parents
 
     @property
     def avalon_archived_by_id(self):
         if self._avalon_archived_by_id is None:
-            self._avalon_archived_by_id = {}
-            self.dbcon.install()
-            self.dbcon.Session["AVALON_PROJECT"] = (
-                self.cur_project["full_name"]
-            )
-            for asset in self.dbcon.find({"type": "archived_asset"}):
-                self._avalon_archived_by_id[asset["_id"]] = asset
+            self._avalon_archived_by_id = self.entity_index.archived_by_id
         return self._avalon_archived_by_id
 
     @property
@@ -210,9 +487,13 @@ class SyncToAvalonEvent(BaseEvent):
             )
             avalon_project, avalon_entities = self.avalon_entities
             self._changeability_by_mongo_id[avalon_project["_id"]] = False
-            self._bubble_changeability(
-                list(self.avalon_subsets_by_parents.keys())
-            )
+            self._bubble_changeability([
+                parent_id
+                for parent_id, subsets in (
+                    self.avalon_subsets_by_parents.items()
+                )
+                if subsets
+            ])
 
         return self._changeability_by_mongo_id
 
@@ -373,6 +654,10 @@ class SyncToAvalonEvent(BaseEvent):
 
         self._avalon_cust_attrs = None
 
+        self._entity_index = None
+        self.touched_mongo_ids = set()
+        self.event_ftrack_ids = set()
+
         self._avalon_ents = None
         self._avalon_ents_by_id = None
         self._avalon_ents_by_parent_id = None
@@ -495,6 +780,7 @@ class SyncToAvalonEvent(BaseEvent):
         # Reset object values for each launch
         self.reset_variables()
         self._cur_event = event
+        self.event_ftrack_ids = self.collect_event_ftrack_ids(event)
 
         entities_by_action = {
             "remove": {},
@@ -703,8 +989,13 @@ class SyncToAvalonEvent(BaseEvent):
                 time_total, time_removed, time_renamed, time_added, time_moved,
                 time_updated, time_cleanup
             ))
+            # 7.) Apply written documents to persistent index
+            if self._entity_index is not None and self.touched_mongo_ids:
+                self._entity_index.refresh(self.touched_mongo_ids)
 
         except Exception:
+            # Cached documents may not match database
+            self.drop_entity_index()
             msg = "An error has happened during synchronization"
             self.report_items["error"][msg].append((
                 str(traceback.format_exc()).replace("\n", "<br>")
@@ -764,6 +1055,7 @@ class SyncToAvalonEvent(BaseEvent):
                 {"_id": {"$in": removable_ids}, "type": "asset"},
                 {"$set": {"type": "archived_asset"}}
             )
+            self.touched_mongo_ids.update(removable_ids)
             self.remove_cached_by_key("id", removable_ids)
 
         if recreate_ents:
@@ -1156,6 +1448,7 @@ class SyncToAvalonEvent(BaseEvent):
             self.dbcon.insert_one(final_entity)
             # TODO logging
             self.log.debug("Entity was synchronized <{}>".format(ent_path))
+        self.touched_mongo_ids.add(mongo_id)
 
         mongo_id_str = str(mongo_id)
         if mongo_id_str != ftrack_ent["custom_attributes"][CUST_ATTR_ID_KEY]:
@@ -1513,6 +1806,7 @@ class SyncToAvalonEvent(BaseEvent):
                             "data.entityType": entity_type
                         }
                     })
+                    self.touched_mongo_ids.add(avalon_ent_by_name["_id"])
 
                     avalon_ent_by_name["data"]["ftrackId"] = ftrack_id
                     avalon_ent_by_name["data"]["entityType"] = entity_type
@@ -2278,6 +2572,7 @@ class SyncToAvalonEvent(BaseEvent):
         if not mongo_changes_bulk:
             return
 
+        self.touched_mongo_ids.update(self.updates.keys())
         self.dbcon.bulk_write(mongo_changes_bulk)
         self.updates = collections.defaultdict(dict)
 
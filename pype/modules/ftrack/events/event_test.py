@@ -8,6 +8,7 @@ from pype.modules.ftrack import BaseEvent
 class TestEvent(BaseEvent):
 
     ignore_me = True
+    order_sensitive = False
 
     priority = 10000
 
@@ -37,7 +37,10 @@ class UserAssigmentEvent(BaseEvent):
         3) path to publish files of task user was (de)assigned to
     """
 
-    db_con = AvalonMongoDB()
+    def __init__(self, *args, **kwargs):
+        # Connection is not shared by handlers of event worker sessions
+        self.db_con = AvalonMongoDB()
+        super().__init__(*args, **kwargs)
 
     def error(self, *err):
         for e in err:
@@ -1,5 +1,5 @@
 from pype.modules.ftrack import BaseEvent
-from pype.api import config
+from pype.settings import get_presets
 
 
 class VersionToTaskStatus(BaseEvent):
@@ -50,7 +50,7 @@ class VersionToTaskStatus(BaseEvent):
 
             # Load status mapping from presets
             status_mapping = (
-                config.get_presets()
+                get_presets()
                 .get("ftrack", {})
                 .get("ftrack_config", {})
                 .get("status_version_to_task")
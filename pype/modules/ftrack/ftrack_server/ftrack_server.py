@@ -131,6 +131,28 @@ class FtrackServer:
                 )
                 log.warning(msg, exc_info=True)
 
+    def register_files(self, session):
+        """Register actions/events from paths in environment to session.
+
+        Returns:
+            bool: Paths are set in environment.
+        """
+        self.session = session
+
+        paths_str = os.environ.get(self.env_key)
+        if paths_str is None:
+            log.error((
+                "Env var \"{}\" is not set, \"{}\" server won\'t launch"
+            ).format(self.env_key, self.server_type))
+            return False
+
+        paths = paths_str.split(os.pathsep)
+        self.set_files(paths)
+
+        log.info(60*"*")
+        log.info('Registration of actions/events has finished!')
+        return True
+
     def run_server(self, session=None, load_files=True):
         if not session:
             session = ftrack_api.Session(auto_connect_event_hub=True)
@@ -138,18 +160,8 @@ class FtrackServer:
         self.session = session
 
         if load_files:
-            paths_str = os.environ.get(self.env_key)
-            if paths_str is None:
-                log.error((
-                    "Env var \"{}\" is not set, \"{}\" server won\'t launch"
-                ).format(self.env_key, self.server_type))
+            if not self.register_files(session):
                 return
 
-            paths = paths_str.split(os.pathsep)
-            self.set_files(paths)
-
-            log.info(60*"*")
-            log.info('Registration of actions/events has finished!')
-
         # keep event_hub on session running
         self.session.event_hub.wait()
@@ -8,6 +8,8 @@ import threading
 import datetime
 import time
 import queue
+import bisect
+import collections
 import pymongo
 
 import requests
@@ -150,6 +152,228 @@ class StorerEventHub(SocketBaseEventHub):
         )
 
 
+def get_event_project_id(event):
+    """Id of project which is event related to or None."""
+    data = event.get("data") or {}
+    for ent_info in data.get("entities") or []:
+        parents = [ent_info] + (ent_info.get("parents") or [])
+        for parent in parents:
+            if parent.get("entityType") == "show":
+                return str(parent.get("entityId"))
+
+    for selection in data.get("selection") or []:
+        if selection.get("entityType") == "show":
+            return str(selection.get("entityId"))
+    return None
+
+
+class WorkerEventHub(ftrack_api.event.hub.EventHub):
+    """Event hub of `EventDispatcher` worker session.
+
+    Events are passed to worker by dispatcher so events sent by server are
+    skipped. Hub is connected only to be able publish events.
+    """
+
+    def __init__(self, *args, **kwargs):
+        kwargs.pop("sock", None)
+        super(WorkerEventHub, self).__init__(*args, **kwargs)
+
+    def _handle_packet(self, code, packet_identifier, path, data):
+        code_name = self._code_name_mapping[code]
+        if code_name == "event":
+            return
+
+        return super(WorkerEventHub, self)._handle_packet(
+            code, packet_identifier, path, data
+        )
+
+
+class LatencyHistogram:
+    """Thread safe histogram of durations in seconds."""
+
+    bounds = (0.1, 0.5, 1, 5, 10, 30, 60)
+
+    def __init__(self):
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.lock = threading.Lock()
+
+    def add(self, duration):
+        with self.lock:
+            self.counts[bisect.bisect_right(self.bounds, duration)] += 1
+            self.count += 1
+            self.total += duration
+
+    def format(self):
+        with self.lock:
+            counts = list(self.counts)
+            count = self.count
+            total = self.total
+
+        labels = ["<{}s".format(bound) for bound in self.bounds]
+        labels.append(">={}s".format(self.bounds[-1]))
+        buckets = ", ".join(
+            "{}: {}".format(label, value)
+            for label, value in zip(labels, counts)
+            if value
+        )
+        return "{} events, avg {:.3f}s ({})".format(
+            count, total / max(count, 1), buckets
+        )
+
+
+class EventDispatcher:
+    """Dispatch events to worker threads.
+
+    Each worker has its own session with registered handlers. Events
+    related to one project are processed in order by the same worker if any
+    interested handler is order sensitive (`order_sensitive` attribute of
+    handler, True by default). Other events are processed by the least
+    loaded worker.
+
+    Args:
+        sessions (list): Sessions of workers with registered handlers. All
+            sessions must have registered the same handlers.
+    """
+
+    global_key = "__global__"
+
+    def __init__(self, sessions):
+        self.log = Logger().get_logger(self.__class__.__name__)
+        self.sessions = sessions
+        self.histograms = collections.defaultdict(LatencyHistogram)
+
+        self._lock = threading.Lock()
+        self._worker_by_key = {}
+        self._pending_by_key = collections.Counter()
+        self._loads = [0] * len(sessions)
+        self._queues = [queue.Queue() for _ in sessions]
+        self._threads = []
+
+        for session in sessions:
+            self._wrap_subscribers(session)
+
+        for idx in range(len(sessions)):
+            thread = threading.Thread(
+                target=self._worker,
+                args=(idx, ),
+                name="EventWorker{}".format(idx)
+            )
+            thread.daemon = True
+            thread.start()
+            self._threads.append(thread)
+
+    def _wrap_subscribers(self, session):
+        for subscriber in session.event_hub._subscribers:
+            callback = subscriber.callback
+            handler = getattr(callback, "__self__", None)
+            if handler is not None:
+                name = handler.__class__.__name__
+            else:
+                name = getattr(callback, "__name__", str(callback))
+
+            subscriber.callback = self._timed_callback(callback, name)
+            subscriber.callback.order_sensitive = getattr(
+                handler, "order_sensitive", True
+            )
+
+    def _timed_callback(self, callback, name):
+        histogram = self.histograms[name]
+
+        def timed_callback(event):
+            start = time.time()
+            try:
+                return callback(event)
+            finally:
+                histogram.add(time.time() - start)
+        return timed_callback
+
+    def dispatch(self, event, on_done):
+        """Pass event to worker.
+
+        Args:
+            event (ftrack_api.event.base.Event): Event to process.
+            on_done (callable): Called with event when event is processed.
+                May be called from worker thread.
+        """
+        subscribers = [
+            subscriber
+            for subscriber in self.sessions[0].event_hub._subscribers
+            if subscriber.interested_in(event)
+        ]
+        if not subscribers:
+            on_done(event)
+            return
+
+        key = None
+        for subscriber in subscribers:
+            if subscriber.callback.order_sensitive:
+                key = get_event_project_id(event) or self.global_key
+                break
+
+        with self._lock:
+            worker_idx = self._worker_by_key.get(key)
+            if worker_idx is None:
+                worker_idx = self._loads.index(min(self._loads))
+                if key is not None:
+                    self._worker_by_key[key] = worker_idx
+            if key is not None:
+                self._pending_by_key[key] += 1
+            self._loads[worker_idx] += 1
+
+        self._queues[worker_idx].put((key, event, on_done))
+
+    def _worker(self, idx):
+        event_hub = self.sessions[idx].event_hub
+        work_queue = self._queues[idx]
+        while True:
+            item = work_queue.get()
+            if item is None:
+                break
+
+            key, event, on_done = item
+            try:
+                event_hub._handle(event)
+            except Exception:
+                self.log.error("Event handling failed", exc_info=True)
+
+            # Event must be passed to `on_done` before the load is released
+            # so idle dispatcher has no event waiting for `on_done`
+            on_done(event)
+            with self._lock:
+                self._loads[idx] -= 1
+                if key is not None:
+                    self._pending_by_key[key] -= 1
+                    if self._pending_by_key[key] < 1:
+                        self._pending_by_key.pop(key)
+                        self._worker_by_key.pop(key)
+
+    def is_idle(self):
+        with self._lock:
+            return not any(self._loads)
+
+    def stop(self):
+        """Wait until dispatched events are processed and stop workers."""
+        for work_queue in self._queues:
+            work_queue.put(None)
+
+        for thread in self._threads:
+            thread.join()
+
+    def status_info(self):
+        with self._lock:
+            info = {
+                "Workers": len(self.sessions),
+                "Events in workers": sum(self._loads)
+            }
+
+        for name, histogram in sorted(self.histograms.items()):
+            if histogram.count:
+                info["{} latency".format(name)] = histogram.format()
+        return info
+
+
 class ProcessEventHub(SocketBaseEventHub):
 
     hearbeat_msg = b"processor"
@@ -158,6 +382,17 @@ class ProcessEventHub(SocketBaseEventHub):
     is_table_created = False
     pypelog = Logger().get_logger("Session Processor")
 
+    # Processed events are acknowledged in Mongo in batches
+    ack_batch_size = 50
+    ack_interval = 1.0
+    # Maximum time in seconds to wait for new events when queue is empty
+    poll_interval = 0.5
+    # Interval of removing old processed events and full reload of events
+    cleanup_interval = 600
+    processed_expiration_days = 3
+    # Optional `EventDispatcher` processing events in worker threads
+    dispatcher = None
+
     def __init__(self, *args, **kwargs):
         self.dbcon = CustomDbConnector(
             self.uri,
@@ -165,6 +400,21 @@ class ProcessEventHub(SocketBaseEventHub):
             self.port,
             self.table_name
         )
+        # Cursor of loaded events - stored date of last loaded event and ids
+        #   of events stored with same date
+        self._last_stored = None
+        self._last_stored_ids = set()
+        self._stored_by_id = {}
+
+        self._pending_acks = []
+        self._last_ack = time.time()
+        self._last_cleanup = None
+        self._change_stream = None
+
+        self._dispatched_events = queue.Queue()
+        self._processed_count = 0
+        self._last_lag = None
+        self._max_lag = None
         super(ProcessEventHub, self).__init__(*args, **kwargs)
 
     def prepare_dbcon(self):
@@ -188,56 +438,212 @@ class ProcessEventHub(SocketBaseEventHub):
             self.sock.sendall(b"MongoError")
             sys.exit(0)
 
+        try:
+            self.dbcon.create_index([
+                ("pype_data.is_processed", pymongo.ASCENDING),
+                ("pype_data.stored", pymongo.ASCENDING)
+            ])
+        except pymongo.errors.OperationFailure:
+            self.pypelog.warning(
+                "Couldn't create index of events collection.", exc_info=True
+            )
+
+        self._change_stream = self.open_change_stream()
+
+    def open_change_stream(self):
+        """Change stream used to wake up when new events are stored.
+
+        Returns None when change streams are not available (standalone
+        MongoDB) and polling is used instead.
+        """
+        try:
+            pipeline = [{"$match": {
+                "operationType": {"$in": ["insert", "replace"]}
+            }}]
+            return self.dbcon.watch(
+                pipeline, max_await_time_ms=int(self.poll_interval * 1000)
+            )
+        except pymongo.errors.PyMongoError:
+            self.pypelog.debug(
+                "Change streams are not available. Using polling."
+            )
+        return None
+
     def wait(self, duration=None):
         """Overriden wait
 
-        Event are loaded from Mongo DB when queue is empty. Handled event is
-        set as processed in Mongo DB.
+        Event are loaded from Mongo DB when queue is empty. Handled events
+        are set as processed in Mongo DB in batches.
         """
         started = time.time()
         self.prepare_dbcon()
         while True:
             try:
-                event = self._event_queue.get(timeout=0.1)
-            except queue.Empty:
-                if not self.load_events():
-                    time.sleep(0.5)
-            else:
+                self.collect_dispatched()
                 try:
+                    event = self._event_queue.get(timeout=0.1)
+                except queue.Empty:
+                    self.acknowledge_events()
+                    self.cleanup()
+                    if not self.load_events():
+                        self.wait_for_events()
+                else:
                     self._handle(event)
-                    self.dbcon.update_one(
-                        {"id": event["id"]},
-                        {"$set": {"pype_data.is_processed": True}}
-                    )
-                except pymongo.errors.AutoReconnect:
-                    self.pypelog.error((
-                        "Mongo server \"{}\" is not responding, exiting."
-                    ).format(os.environ["AVALON_MONGO"]))
-                    sys.exit(0)
-                # Additional special processing of events.
-                if event['topic'] == 'ftrack.meta.disconnected':
-                    break
+                    if self.dispatcher is None:
+                        self.processed(event)
+                    else:
+                        self.dispatcher.dispatch(
+                            event, self._dispatched_events.put
+                        )
+
+                    # Additional special processing of events.
+                    if event['topic'] == 'ftrack.meta.disconnected':
+                        if self.dispatcher is not None:
+                            self.dispatcher.stop()
+                            self.collect_dispatched()
+                        self.acknowledge_events()
+                        break
+
+            except pymongo.errors.AutoReconnect:
+                self.pypelog.error((
+                    "Mongo server \"{}\" is not responding, exiting."
+                ).format(os.environ["AVALON_MONGO"]))
+                sys.exit(0)
 
             if duration is not None:
                 if (time.time() - started) > duration:
+                    self.acknowledge_events()
                     break
 
-    def load_events(self):
-        """Load not processed events sorted by stored date"""
-        ago_date = datetime.datetime.now() - datetime.timedelta(days=3)
+    def wait_for_events(self):
+        """Wait until new event is stored or poll interval passed."""
+        if self._change_stream is not None:
+            try:
+                # Blocks for `poll_interval` at most
+                self._change_stream.try_next()
+                return
+
+            except pymongo.errors.PyMongoError:
+                self.pypelog.warning(
+                    "Change stream failed. Using polling.", exc_info=True
+                )
+                self._change_stream = None
+
+        time.sleep(self.poll_interval)
+
+    def collect_dispatched(self):
+        """Process events finished by dispatcher workers."""
+        while True:
+            try:
+                event = self._dispatched_events.get_nowait()
+            except queue.Empty:
+                return
+            self.processed(event)
+
+    def processed(self, event):
+        """Store information about handled event."""
+        self._processed_count += 1
+        stored = self._stored_by_id.pop(event["id"], None)
+        if stored is not None:
+            lag = (datetime.datetime.utcnow() - stored).total_seconds()
+            self._last_lag = lag
+            if self._max_lag is None or lag > self._max_lag:
+                self._max_lag = lag
+
+        self._pending_acks.append(event["id"])
+        if (
+            len(self._pending_acks) >= self.ack_batch_size
+            or time.time() - self._last_ack > self.ack_interval
+        ):
+            self.acknowledge_events()
+
+    def acknowledge_events(self):
+        """Set handled events as processed in Mongo DB."""
+        self._last_ack = time.time()
+        if not self._pending_acks:
+            return
+
+        self.dbcon.update_many(
+            {"id": {"$in": self._pending_acks}},
+            {"$set": {"pype_data.is_processed": True}}
+        )
+        self._pending_acks = []
+
+    def cleanup(self):
+        """Remove old processed events in `cleanup_interval`.
+
+        Cursor of loaded events is also reset so events stored out of order
+        are not missed. Must be called with empty queue and acknowledged
+        events.
+        """
+        if (
+            self._last_cleanup is not None
+            and time.time() - self._last_cleanup < self.cleanup_interval
+        ):
+            return
+
+        if self.dispatcher is not None:
+            if not self.dispatcher.is_idle():
+                return
+
+            # Events finished by workers since last collection must be
+            # acknowledged before cursor is reset or they would be loaded
+            # and processed again
+            self.collect_dispatched()
+            self.acknowledge_events()
+
+        self._last_cleanup = time.time()
+        ago_date = datetime.datetime.utcnow() - datetime.timedelta(
+            days=self.processed_expiration_days
+        )
         self.dbcon.delete_many({
             "pype_data.stored": {"$lte": ago_date},
             "pype_data.is_processed": True
         })
+        self._last_stored = None
+        self._last_stored_ids = set()
+        self._stored_by_id = {}
 
-        not_processed_events = self.dbcon.find(
+    def status_info(self):
+        """Metrics of events processing for status action."""
+        not_processed = self.dbcon.count_documents(
             {"pype_data.is_processed": False}
-        ).sort(
+        )
+        info = {
+            "Processed events": self._processed_count,
+            "Events in queue": self._event_queue.qsize(),
+            "Not processed events": not_processed
+        }
+        if self._last_lag is not None:
+            info["Last event lag"] = "{:.2f}s".format(self._last_lag)
+            info["Max event lag"] = "{:.2f}s".format(self._max_lag)
+
+        if self.dispatcher is not None:
+            info.update(self.dispatcher.status_info())
+        return info
+
+    def load_events(self):
+        """Load not processed events stored after last loaded event."""
+        query = {"pype_data.is_processed": False}
+        if self._last_stored is not None:
+            query["pype_data.stored"] = {"$gte": self._last_stored}
+
+        not_processed_events = self.dbcon.find(query).sort(
             [("pype_data.stored", pymongo.ASCENDING)]
         )
 
         found = False
         for event_data in not_processed_events:
+            event_id = event_data.get("id")
+            stored = event_data["pype_data"]["stored"]
+            if stored == self._last_stored:
+                if event_id in self._last_stored_ids:
+                    continue
+            else:
+                self._last_stored = stored
+                self._last_stored_ids = set()
+            self._last_stored_ids.add(event_id)
+
             new_event_data = {
                 k: v for k, v in event_data.items()
                 if k not in ["_id", "pype_data"]
@@ -251,6 +657,7 @@ class ProcessEventHub(SocketBaseEventHub):
                 ))
                 continue
             found = True
+            self._stored_by_id[event_id] = stored
             self._event_queue.put(event)
 
         return found
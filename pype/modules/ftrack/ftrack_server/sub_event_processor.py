@@ -6,7 +6,11 @@ import datetime
 
 from ftrack_server import FtrackServer
 from pype.modules.ftrack.ftrack_server.lib import (
-    SocketSession, ProcessEventHub, TOPIC_STATUS_SERVER
+    SocketSession,
+    ProcessEventHub,
+    WorkerEventHub,
+    EventDispatcher,
+    TOPIC_STATUS_SERVER
 )
 import ftrack_api
 from pype.api import Logger, config
@@ -39,6 +43,12 @@ def send_status(event):
             "created_at": subprocess_started.strftime("%Y.%m.%d %H:%M:%S")
         }
     }
+    try:
+        new_event_data["status_info"].update(
+            session.event_hub.status_info()
+        )
+    except Exception:
+        log.warning("Failed to collect processing info.", exc_info=True)
 
     new_event = ftrack_api.event.base.Event(
         topic="pype.event.server.status.result",
@@ -91,6 +101,19 @@ def clockify_module_registration():
     return True
 
 
+def create_dispatcher(workers):
+    """Dispatcher with worker sessions with registered event handlers."""
+    sessions = []
+    for _ in range(workers):
+        session = SocketSession(
+            auto_connect_event_hub=True, Eventhub=WorkerEventHub
+        )
+        if not FtrackServer("event").register_files(session):
+            return None
+        sessions.append(session)
+    return EventDispatcher(sessions)
+
+
 def main(args):
     port = int(args[-1])
     # Create a TCP/IP socket
@@ -115,8 +138,22 @@ def main(args):
         SessionFactory.session = session
 
         server = FtrackServer("event")
-        log.debug("Launched Ftrack Event processor")
-        server.run_server(session)
+        # Events are processed in main thread by default. Each worker has
+        #   own handler objects, handlers must not share state between them.
+        workers = int(os.environ.get("PYPE_FTRACK_EVENT_WORKERS") or 1)
+        if workers > 1:
+            dispatcher = create_dispatcher(workers)
+            if dispatcher is None:
+                return
+            session.event_hub.dispatcher = dispatcher
+            log.debug("Launched Ftrack Event processor ({} workers)".format(
+                workers
+            ))
+            server.run_server(session, load_files=False)
+
+        else:
+            log.debug("Launched Ftrack Event processor")
+            server.run_server(session)
 
     except Exception:
         log.error("Event server crashed. See traceback below", exc_info=True)
@@ -2,8 +2,10 @@ import os
 import re
 import queue
 import json
+import time
 import collections
 import copy
+from multiprocessing.pool import ThreadPool
 
 from avalon.api import AvalonMongoDB
 
@@ -239,9 +241,36 @@ def get_hierarchical_attributes(session, entity, attr_names, attr_defaults={}):
     return hier_values
 
 
-class SyncEntitiesFactory:
-    dbcon = AvalonMongoDB()
+def query_all(session, expression, page_size=None):
+    """Query all items of expression following server pagination.
+
+    Items are returned as received from server without creating entities
+    in session cache.
+    """
+    if hasattr(session, "call"):
+        call = session.call
+    else:
+        call = session._call
+
+    items = []
+    offset = None
+    while True:
+        _expression = expression
+        if offset is not None:
+            _expression += " offset {}".format(offset)
+        if page_size is not None:
+            _expression += " limit {}".format(page_size)
 
+        [result] = call([{"action": "query", "expression": _expression}])
+        items.extend(result["data"])
+
+        metadata = result.get("metadata") or {}
+        offset = (metadata.get("next") or {}).get("offset")
+        if offset is None:
+            return items
+
+
+class SyncEntitiesFactory:
     project_query = (
         "select full_name, name, custom_attributes"
         ", project_schema._task_type_schema.types.name"
@@ -251,6 +280,16 @@ class SyncEntitiesFactory:
         "select id, name, parent_id, link"
         " from TypedContext where project_id is \"{}\""
     )
+    cust_attr_values_query = (
+        "select value, entity_id, configuration_id"
+        " from ContextCustomAttributeValue"
+        " where entity_id in ({}) and configuration_id in ({})"
+    )
+    # Number of entity ids in one custom attribute values query
+    cust_attr_values_chunk_size = 500
+    # Maximum number of custom attribute values queries sent at once
+    cust_attr_values_workers = 4
+
     ignore_custom_attr_key = "avalon_ignore_sync"
     ignore_entity_types = ["milestone"]
 
@@ -258,22 +297,97 @@ class SyncEntitiesFactory:
 
     def __init__(self, log_obj, session):
         self.log = log_obj
+        # Each factory has own connection as project of connection is changed
+        # during synchronization
+        self.dbcon = AvalonMongoDB()
         self._server_url = session.server_url
         self._api_key = session.api_key
         self._api_user = session.api_user
 
+    def create_session(self, auto_connect_event_hub=True):
+        return ftrack_api.Session(
+            server_url=self._server_url,
+            api_key=self._api_key,
+            api_user=self._api_user,
+            auto_connect_event_hub=auto_connect_event_hub
+        )
+
+    def query_cust_attr_values(self, entity_ids, configuration_ids):
+        """Query values of custom attributes for entities.
+
+        Entity ids are split to chunks of `cust_attr_values_chunk_size` so
+        query expression does not hit server limits. Chunks are queried
+        concurrently by `cust_attr_values_workers` threads where each thread
+        has it's own session.
+
+        Returns:
+            list: Value items with "value", "entity_id" and
+                "configuration_id" keys.
+        """
+        entity_ids = list(entity_ids)
+        if not entity_ids or not configuration_ids:
+            return []
+
+        attributes_joined = ", ".join([
+            "\"{}\"".format(attr_id) for attr_id in configuration_ids
+        ])
+        chunk_size = max(1, self.cust_attr_values_chunk_size)
+        expressions = []
+        for idx in range(0, len(entity_ids), chunk_size):
+            entity_ids_joined = ", ".join([
+                "\"{}\"".format(entity_id)
+                for entity_id in entity_ids[idx:idx + chunk_size]
+            ])
+            expressions.append(self.cust_attr_values_query.format(
+                entity_ids_joined, attributes_joined
+            ))
+
+        workers = min(self.cust_attr_values_workers, len(expressions))
+        if workers < 2:
+            return self._query_expressions(self.session, expressions)
+
+        def process(worker_idx):
+            worker_expressions = expressions[worker_idx::workers]
+            # Session is not thread safe so first worker use current session
+            #   and other workers create their own
+            if worker_idx == 0:
+                return self._query_expressions(
+                    self.session, worker_expressions
+                )
+
+            session = self.create_session(False)
+            try:
+                return self._query_expressions(session, worker_expressions)
+            finally:
+                session.close()
+
+        pool = ThreadPool(workers)
+        try:
+            results = pool.map(process, range(workers), chunksize=1)
+        finally:
+            pool.close()
+            pool.join()
+
+        output = []
+        for items in results:
+            output.extend(items)
+        return output
+
+    def _query_expressions(self, session, expressions):
+        output = []
+        for expression in expressions:
+            output.extend(query_all(session, expression))
+        return output
+
     def launch_setup(self, project_full_name):
+        time_start = time.time()
         try:
             self.session.close()
         except Exception:
             pass
 
-        self.session = ftrack_api.Session(
-            server_url=self._server_url,
-            api_key=self._api_key,
-            api_user=self._api_user,
-            auto_connect_event_hub=True
-        )
+        self.session = self.create_session()
+        time_session = time.time()
 
         self.duplicates = {}
         self.failed_regex = {}
@@ -322,6 +436,7 @@ class SyncEntitiesFactory:
             self.project_query.format(project_full_name)
         ).one()
         ft_project_id = ft_project["id"]
+        time_project = time.time()
 
         # Skip if project is ignored
         if ft_project["custom_attributes"].get(
@@ -367,6 +482,7 @@ class SyncEntitiesFactory:
         all_project_entities = self.session.query(
             self.entities_query.format(ft_project_id)
         ).all()
+        time_entities = time.time()
 
         # Store entities by `id` and `parent_id`
         entities_dict = collections.defaultdict(lambda: {
@@ -414,6 +530,19 @@ class SyncEntitiesFactory:
         self.ft_project_id = ft_project_id
         self.entities_dict = entities_dict
 
+        time_end = time.time()
+        self.log.debug((
+            "Setup time: {} <session: {}, project: {}, entities query: {},"
+            " entities prepare: {}> ({} entities)"
+        ).format(
+            time_end - time_start,
+            time_session - time_start,
+            time_project - time_session,
+            time_entities - time_project,
+            time_end - time_entities,
+            len(all_project_entities)
+        ))
+
     @property
     def avalon_ents_by_id(self):
         if self._avalon_ents_by_id is None:
@@ -701,6 +830,7 @@ class SyncEntitiesFactory:
 
     def set_cutom_attributes(self):
         self.log.debug("* Preparing custom attributes")
+        time_start = time.time()
         # Get custom attributes and values
         custom_attrs, hier_attrs = get_pype_attr(self.session)
         ent_types = self.session.query("select id, name from ObjectType").all()
@@ -770,47 +900,36 @@ class SyncEntitiesFactory:
             prepared_avalon_attr = avalon_attrs.get(attr_key)
             prepared_attrs_ca_id = attrs_per_entity_type_ca_id.get(attr_key)
             prepared_avalon_attr_ca_id = avalon_attrs_ca_id.get(attr_key)
+            # Shallow copies are enough as values are only replaced
             if prepared_attrs:
                 self.entities_dict[entity_id]["custom_attributes"] = (
-                    copy.deepcopy(prepared_attrs)
+                    dict(prepared_attrs)
                 )
             if prepared_attrs_ca_id:
                 self.entities_dict[entity_id]["custom_attributes_id"] = (
-                    copy.deepcopy(prepared_attrs_ca_id)
+                    dict(prepared_attrs_ca_id)
                 )
             if prepared_avalon_attr:
                 self.entities_dict[entity_id]["avalon_attrs"] = (
-                    copy.deepcopy(prepared_avalon_attr)
+                    dict(prepared_avalon_attr)
                 )
             if prepared_avalon_attr_ca_id:
                 self.entities_dict[entity_id]["avalon_attrs_id"] = (
-                    copy.deepcopy(prepared_avalon_attr_ca_id)
+                    dict(prepared_avalon_attr_ca_id)
                 )
 
-        # TODO query custom attributes by entity_id
-        entity_ids_joined = ", ".join([
-            "\"{}\"".format(id) for id in sync_ids
-        ])
-        attributes_joined = ", ".join([
-            "\"{}\"".format(attr_id) for attr_id in attribute_key_by_id.keys()
-        ])
-
-        cust_attr_query = (
-            "select value, entity_id from ContextCustomAttributeValue "
-            "where entity_id in ({}) and configuration_id in ({})"
+        time_prepare = time.time()
+        values = self.query_cust_attr_values(
+            sync_ids, list(attribute_key_by_id.keys())
         )
-        call_expr = [{
-            "action": "query",
-            "expression": cust_attr_query.format(
-                entity_ids_joined, attributes_joined
-            )
-        }]
-        if hasattr(self.session, "call"):
-            [values] = self.session.call(call_expr)
-        else:
-            [values] = self.session._call(call_expr)
+        time_query = time.time()
+        self.log.debug((
+            "Custom attributes prepare: {}, query: {} ({} values)"
+        ).format(
+            time_prepare - time_start, time_query - time_prepare, len(values)
+        ))
 
-        for item in values["data"]:
+        for item in values:
             entity_id = item["entity_id"]
             key = attribute_key_by_id[item["configuration_id"]]
             store_key = "custom_attributes"
@@ -868,31 +987,18 @@ class SyncEntitiesFactory:
             # Skip project because has stored defaults at the moment
             if entity_dict["entity_type"] == "project":
                 continue
-            entity_dict["hier_attrs"] = copy.deepcopy(prepare_dict)
+            entity_dict["hier_attrs"] = dict(prepare_dict)
             for key, val in prepare_dict_avalon.items():
                 entity_dict["avalon_attrs"][key] = val
 
-        # Prepare values to query
-        entity_ids_joined = ", ".join([
-            "\"{}\"".format(id) for id in sync_ids
-        ])
-        attributes_joined = ", ".join([
-            "\"{}\"".format(attr_id) for attr_id in attribute_key_by_id.keys()
-        ])
-        avalon_hier = []
-        call_expr = [{
-            "action": "query",
-            "expression": (
-                "select value, entity_id from ContextCustomAttributeValue "
-                "where entity_id in ({}) and configuration_id in ({})"
-            ).format(entity_ids_joined, attributes_joined)
-        }]
-        if hasattr(self.session, "call"):
-            [values] = self.session.call(call_expr)
-        else:
-            [values] = self.session._call(call_expr)
+        time_start = time.time()
+        values = self.query_cust_attr_values(
+            sync_ids, list(attribute_key_by_id.keys())
+        )
+        time_query = time.time()
 
-        for item in values["data"]:
+        avalon_hier = []
+        for item in values:
             value = item["value"]
             # WARNING It is not possible to propage enumerate hierachical
             # attributes with multiselection 100% right. Unseting all values
@@ -925,24 +1031,38 @@ class SyncEntitiesFactory:
             if value is not None:
                 project_values[key] = value
 
-        hier_down_queue = queue.Queue()
-        hier_down_queue.put((project_values, top_id))
-
-        while not hier_down_queue.empty():
-            hier_values, parent_id = hier_down_queue.get()
+        store_keys = []
+        for key in attributes_by_key.keys():
+            if key.startswith("avalon_"):
+                store_keys.append((key, "avalon_attrs"))
+            else:
+                store_keys.append((key, "hier_attrs"))
+
+        # Inherited values are not copied. Children without own values share
+        #   parent's dictionary which must not be modified.
+        hier_down_queue = collections.deque()
+        hier_down_queue.append((project_values, top_id))
+        while hier_down_queue:
+            hier_values, parent_id = hier_down_queue.popleft()
             for child_id in self.entities_dict[parent_id]["children"]:
-                _hier_values = copy.deepcopy(hier_values)
-                for key in attributes_by_key.keys():
-                    if key.startswith("avalon_"):
-                        store_key = "avalon_attrs"
-                    else:
-                        store_key = "hier_attrs"
-                    value = self.entities_dict[child_id][store_key][key]
-                    if value is not None:
-                        _hier_values[key] = value
+                child_dict = self.entities_dict[child_id]
+                _hier_values = hier_values
+                for key, store_key in store_keys:
+                    value = child_dict[store_key][key]
+                    if value is None:
+                        continue
+                    if _hier_values is hier_values:
+                        _hier_values = dict(hier_values)
+                    _hier_values[key] = value
 
-                self.entities_dict[child_id]["hier_attrs"].update(_hier_values)
-                hier_down_queue.put((_hier_values, child_id))
+                child_dict["hier_attrs"].update(_hier_values)
+                hier_down_queue.append((_hier_values, child_id))
+
+        self.log.debug((
+            "Hierarchical attributes query: {}, inheritance: {} ({} values)"
+        ).format(
+            time_query - time_start, time.time() - time_query, len(values)
+        ))
 
     def remove_from_archived(self, mongo_id):
         entity = self.avalon_archived_by_id.pop(mongo_id, None)
@@ -35,6 +35,9 @@ class BaseHandler(object):
     type = 'No-type'
     ignore_me = False
     preactions = []
+    # Events of one project are processed in order by this handler when
+    #   event server dispatch events to multiple workers
+    order_sensitive = True
 
     def __init__(self, session, plugins_presets=None):
         '''Expects a ftrack_api.Session instance'''
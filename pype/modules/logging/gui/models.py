@@ -1,4 +1,6 @@
+import os
 import collections
+import pymongo
 from Qt import QtCore, QtGui
 from pype.api import Logger
 from pypeapp.lib.log import _bootstrap_mongo_log, LOG_COLLECTION_NAME
@@ -7,13 +9,22 @@ log = Logger().get_logger("LogModel", "LoggingModule")
 
 
 class LogModel(QtGui.QStandardItemModel):
+    """Model of processes with logs stored in Mongo.
+
+    Per process summaries are aggregated on server once on refresh and
+    pulled from aggregation cursor by pages of `page_size` processes when
+    view needs more items. Logs of a process are queried only when requested
+    with `get_logs`.
+    """
+
     COLUMNS = (
         "process_name",
         "hostname",
         "hostip",
         "username",
         "system_name",
-        "started"
+        "started",
+        "log_count"
     )
     colums_mapping = {
         "process_name": "Process Name",
@@ -22,7 +33,8 @@ class LogModel(QtGui.QStandardItemModel):
         "hostip": "Host IP",
         "username": "Username",
         "system_name": "System name",
-        "started": "Started at"
+        "started": "Started at",
+        "log_count": "Logs"
     }
     process_keys = (
         "process_id", "hostname", "hostip",
@@ -34,19 +46,67 @@ class LogModel(QtGui.QStandardItemModel):
     )
     default_value = "- Not set -"
 
+    # Number of processes loaded at once
+    page_size = 200
+    # Number of processes with cached logs
+    cached_logs_limit = 20
+    # Logs older than retention days are removed by Mongo (disabled if 0)
+    retention_days = int(os.environ.get("PYPE_LOG_RETENTION_DAYS") or 0)
+
     ROLE_LOGS = QtCore.Qt.UserRole + 2
     ROLE_PROCESS_ID = QtCore.Qt.UserRole + 3
 
     def __init__(self, parent=None):
         super(LogModel, self).__init__(parent)
 
-        self.log_by_process = None
         self.dbcon = None
+        self._summary_cursor = None
+        self._loaded_count = 0
+        self._can_fetch_more = False
+        self._logs_by_process = collections.OrderedDict()
 
         # Crash if connection is not possible to skip this module
         database = _bootstrap_mongo_log()
         if LOG_COLLECTION_NAME in database.list_collection_names():
             self.dbcon = database[LOG_COLLECTION_NAME]
+            self.ensure_indexes()
+
+    def ensure_indexes(self):
+        """Create indexes used by model and TTL index for retention."""
+        try:
+            self.dbcon.create_index([
+                ("process_id", pymongo.ASCENDING),
+                ("timestamp", pymongo.ASCENDING)
+            ])
+            self.dbcon.create_index([("username", pymongo.ASCENDING)])
+            self.dbcon.create_index([("level", pymongo.ASCENDING)])
+        except pymongo.errors.PyMongoError:
+            log.warning("Failed to create log indexes", exc_info=True)
+
+        if not self.retention_days:
+            return
+
+        expire_seconds = self.retention_days * 24 * 60 * 60
+        try:
+            self.dbcon.create_index(
+                [("timestamp", pymongo.ASCENDING)],
+                expireAfterSeconds=expire_seconds
+            )
+        except pymongo.errors.OperationFailure:
+            # Index exists with different expiration
+            try:
+                self.dbcon.database.command(
+                    "collMod",
+                    self.dbcon.name,
+                    index={
+                        "keyPattern": {"timestamp": 1},
+                        "expireAfterSeconds": expire_seconds
+                    }
+                )
+            except pymongo.errors.PyMongoError:
+                log.warning("Failed to set logs retention", exc_info=True)
+        except pymongo.errors.PyMongoError:
+            log.warning("Failed to set logs retention", exc_info=True)
 
     def headerData(self, section, orientation, role):
         if (
@@ -67,50 +127,150 @@ class LogModel(QtGui.QStandardItemModel):
             item = QtGui.QStandardItem(display_value)
             if first_item:
                 first_item = False
-                item.setData(process_logs["_logs"], self.ROLE_LOGS)
                 item.setData(process_logs["process_id"], self.ROLE_PROCESS_ID)
             items.append(item)
         self.appendRow(items)
 
+    def summary_pipeline(self, skip=0):
+        """Aggregation of process summaries sorted by start of process."""
+        first_values = {
+            key: {"$first": "${}".format(key)}
+            for key in self.process_keys
+            if key != "process_id"
+        }
+        by_level = {
+            "_id": {"process_id": "$process_id", "level": "$level"},
+            "started": {"$min": "$timestamp"},
+            "count": {"$sum": 1}
+        }
+        by_level.update(first_values)
+
+        by_process = {
+            "_id": "$_id.process_id",
+            "started": {"$min": "$started"},
+            "log_count": {"$sum": "$count"},
+            "levels": {"$push": {"level": "$_id.level", "count": "$count"}}
+        }
+        by_process.update({
+            key: {"$first": "${}".format(key)}
+            for key in first_values
+        })
+
+        pipeline = [
+            # backwards (in)compatibility
+            {"$match": {"process_id": {"$nin": [None, ""]}}},
+            {"$group": by_level},
+            {"$group": by_process},
+            {"$sort": {"started": pymongo.DESCENDING}}
+        ]
+        if skip:
+            pipeline.append({"$skip": skip})
+        return pipeline
+
+    def _open_summary_cursor(self, skip=0):
+        self._summary_cursor = self.dbcon.aggregate(
+            self.summary_pipeline(skip),
+            allowDiskUse=True,
+            batchSize=self.page_size
+        )
+
+    def _close_summary_cursor(self):
+        if self._summary_cursor is not None:
+            self._summary_cursor.close()
+            self._summary_cursor = None
+
     def refresh(self):
-        self.log_by_process = collections.defaultdict(list)
-        self.process_info = {}
+        self._logs_by_process.clear()
+        self._loaded_count = 0
+        self._close_summary_cursor()
+        self._can_fetch_more = self.dbcon is not None
+        if self._can_fetch_more:
+            self._open_summary_cursor()
 
         self.clear()
         self.beginResetModel()
-        if self.dbcon:
-            result = self.dbcon.find({})
-            for item in result:
-                process_id = item.get("process_id")
-                # backwards (in)compatibility
-                if not process_id:
-                    continue
-
-                if process_id not in self.process_info:
-                    proc_dict = {"_logs": []}
-                    for key in self.process_keys:
-                        proc_dict[key] = (
-                            item.get(key) or self.default_value
-                        )
-                    self.process_info[process_id] = proc_dict
+        self._fetch_page()
+        self.endResetModel()
+
+    def canFetchMore(self, parent):
+        if parent.isValid():
+            return False
+        return self._can_fetch_more
+
+    def fetchMore(self, parent):
+        if not parent.isValid():
+            self._fetch_page()
 
+    def _fetch_page(self):
+        if not self._can_fetch_more:
+            return
+
+        try:
+            items = self._next_summaries()
+        except pymongo.errors.CursorNotFound:
+            # Server closed idle cursor, aggregate again from loaded count
+            self._open_summary_cursor(self._loaded_count)
+            items = self._next_summaries()
+
+        for item in items:
+            proc_dict = {"process_id": item["_id"]}
+            for key in self.process_keys:
+                if key != "process_id":
+                    proc_dict[key] = item.get(key) or self.default_value
+            proc_dict["started"] = item["started"]
+
+            levels = sorted(
+                item["levels"], key=lambda level: str(level["level"])
+            )
+            proc_dict["log_count"] = "{} ({})".format(
+                item["log_count"],
+                ", ".join(
+                    "{}: {}".format(level["level"], level["count"])
+                    for level in levels
+                )
+            )
+            self.add_process_logs(proc_dict)
+
+        self._loaded_count += len(items)
+        self._can_fetch_more = self._summary_cursor.alive
+        if not self._can_fetch_more:
+            self._close_summary_cursor()
+
+    def _next_summaries(self):
+        """Next page of process summaries from aggregation cursor."""
+        items = []
+        for item in self._summary_cursor:
+            items.append(item)
+            if len(items) == self.page_size:
+                break
+        return items
+
+    def get_logs(self, process_id):
+        """Logs of process sorted by timestamp."""
+        if process_id in self._logs_by_process:
+            self._logs_by_process.move_to_end(process_id)
+            return self._logs_by_process[process_id]
+
+        logs = []
+        if self.dbcon is not None:
+            projection = {key: True for key in self.log_keys}
+            projection["exception"] = True
+            result = self.dbcon.find(
+                {"process_id": process_id}, projection
+            ).sort([("timestamp", pymongo.ASCENDING)])
+            for item in result:
                 log_item = {}
                 for key in self.log_keys:
                     log_item[key] = item.get(key) or self.default_value
 
                 if "exception" in item:
                     log_item["exception"] = item["exception"]
+                logs.append(log_item)
 
-                self.process_info[process_id]["_logs"].append(log_item)
-
-        for item in self.process_info.values():
-            item["_logs"] = sorted(
-                item["_logs"], key=lambda item: item["timestamp"]
-            )
-            item["started"] = item["_logs"][0]["timestamp"]
-            self.add_process_logs(item)
-
-        self.endResetModel()
+        self._logs_by_process[process_id] = logs
+        while len(self._logs_by_process) > self.cached_logs_limit:
+            self._logs_by_process.popitem(last=False)
+        return logs
 
 
 class LogsFilterProxy(QtCore.QSortFilterProxyModel):
@@ -190,7 +190,9 @@ class LogsWidget(QtWidgets.QWidget):
     def _on_index_change(self, to_index, from_index):
         index = self._selected_log()
         if index:
-            logs = index.data(self.model.ROLE_LOGS)
+            logs = self.model.get_logs(
+                index.data(self.model.ROLE_PROCESS_ID)
+            )
         else:
             logs = []
         self.detail_widget.set_detail(logs)
@@ -1,6 +1,6 @@
 from .rest_api import RestApiServer
 from .base_class import RestApi, abort, route, register_statics
-from .lib import RestMethods, CallbackResult
+from .lib import RestMethods, CallbackResult, StreamResult
 
 CLASS_DEFINIION = RestApiServer
 
@@ -1,5 +1,7 @@
 from .exceptions import ObjAlreadyExist, AbortException
-from .lib import RestMethods, CallbackResult, RequestInfo, Splitter
+from .lib import (
+    RestMethods, CallbackResult, StreamResult, RequestInfo, Splitter
+)
 from .factory import _RestApiFactory
 
 RestApiFactory = _RestApiFactory()
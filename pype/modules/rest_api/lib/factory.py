@@ -3,6 +3,7 @@ import re
 import inspect
 import collections
 from .lib import RestMethods
+from .router import Router
 from queue import Queue
 
 from pype.api import Logger
@@ -215,6 +216,7 @@ class _RestApiFactory:
         method: collections.defaultdict(list) for method in RestMethods
     }
     prepared_statics = {}
+    router = None
 
     has_routes = False
 
@@ -278,6 +280,11 @@ class _RestApiFactory:
                 "callback_info": callback_info
             })
 
+    def compile_router(self):
+        """Compile prepared routes and statics for request handling."""
+        self.router = Router(self.prepared_routes, self.prepared_statics)
+        return self.router
+
     def prepare_registered(self):
         """Iter through all registered callbacks and statics to prepare them.
 
@@ -285,6 +292,9 @@ class _RestApiFactory:
         registered objects. Remaining callbacks are filtered, it is checked if
         methods has `__self__` or are defined in <locals> (it is expeted they
         do not requise access to object)
+
+        Prepared routes and statics are compiled to router at the end so
+        requests are not matched against each registered route separately.
         """
 
         while not self.unprocessed_statics.empty():
@@ -355,3 +365,5 @@ class _RestApiFactory:
                 continue
 
             self._prepare_route(route)
+
+        self.compile_router()
@@ -1,5 +1,4 @@
 import os
-import re
 import json
 import datetime
 import traceback
@@ -7,7 +6,7 @@ import http.server
 from http import HTTPStatus
 from urllib.parse import urlparse
 
-from .lib import RestMethods, CallbackResult, RequestInfo
+from .lib import RestMethods, CallbackResult, StreamResult, RequestInfo
 from .exceptions import AbortException
 from . import RestApiFactory, Splitter
 
@@ -23,6 +22,11 @@ class Handler(http.server.SimpleHTTPRequestHandler):
         HTTPStatus.NOT_FOUND: "Not found"
     }
 
+    # Size of chunks when static file can't be sent with `sendfile`
+    statics_chunk_size = 64 * 1024
+    # Minimal size of data written at once when streaming response
+    stream_chunk_size = 64 * 1024
+
     statuses = {
         "POST": {
             "OK": 200,
@@ -63,43 +67,18 @@ class Handler(http.server.SimpleHTTPRequestHandler):
         parsed_url = urlparse(self.path)
         path = parsed_url.path
 
+        router = RestApiFactory.router
+        if router is None:
+            router = RestApiFactory.compile_router()
+
         if rest_method is RestMethods.GET:
-            for prefix, dirpath in RestApiFactory.prepared_statics.items():
-                if not path.startswith(prefix):
-                    continue
-                _path = path[len(prefix):]
+            dirpath, _path = router.match_statics(path)
+            if dirpath is not None:
                 return self._handle_statics(dirpath, _path)
 
-        matching_item = None
-        found_prefix = None
-        url_prefixes = RestApiFactory.prepared_routes[rest_method]
-        for url_prefix, items in url_prefixes.items():
-            if matching_item is not None:
-                break
-
-            if url_prefix is not None:
-                if not path.startswith(url_prefix):
-                    continue
-
-                found_prefix = url_prefix
-
-            for item in items:
-                regex = item["regex"]
-                item_full_path = item["fullpath"]
-                if regex is None:
-                    if path == item_full_path:
-                        item["url_data"] = None
-                        matching_item = item
-                        break
-
-                else:
-                    found = re.match(regex, path)
-                    if found:
-                        item["url_data"] = found.groupdict()
-                        matching_item = item
-                        break
-
+        matching_item, url_data = router.match(rest_method, path)
         if not matching_item:
+            found_prefix = router.match_prefix(rest_method, path)
             if found_prefix is not None:
                 _path = path.replace(found_prefix, "")
                 if _path:
@@ -121,7 +100,7 @@ class Handler(http.server.SimpleHTTPRequestHandler):
             log.debug("Triggering callback for path \"{}\"".format(path))
 
             result = self._handle_callback(
-                matching_item, parsed_url, rest_method
+                matching_item, parsed_url, rest_method, url_data
             )
 
             return self._handle_callback_result(result, rest_method)
@@ -160,7 +139,7 @@ class Handler(http.server.SimpleHTTPRequestHandler):
     def _handle_callback_result(self, result, rest_method):
         """Send response to request based on result of callback.
         :param result: Result returned by callback.
-        :type result: None, bool, dict, list, CallbackResult
+        :type result: None, bool, dict, list, CallbackResult, StreamResult
         :param rest_method: Rest api method (GET, POST, etc.).
         :type rest_method: RestMethods
 
@@ -169,7 +148,11 @@ class Handler(http.server.SimpleHTTPRequestHandler):
         - False - It is expected callback was not successful, status 400
         - dict, list - Result is send under "data" key of body, status 200
         - CallbackResult - object specify status and data
+        - StreamResult - body is sent in parts yielded by the object
         """
+        if isinstance(result, StreamResult):
+            return self._send_stream(result)
+
         content_type = "application/json"
         status = HTTPStatus.OK
         success = True
@@ -201,7 +184,7 @@ class Handler(http.server.SimpleHTTPRequestHandler):
             status = HTTPStatus.OK
             data = result
 
-        if status == HTTPStatus.NO_CONTENT:
+        if status in (HTTPStatus.NO_CONTENT, HTTPStatus.NOT_MODIFIED):
             self.send_response(status)
             self.end_headers()
             return
@@ -225,7 +208,69 @@ class Handler(http.server.SimpleHTTPRequestHandler):
         self.wfile.write(body.encode())
         return body
 
-    def _handle_callback(self, item, parsed_url, rest_method):
+    def _send_stream(self, result):
+        """Send body of StreamResult in chunks as they are created."""
+        status = result.status_code
+        self.send_response(status)
+        for key, value in result.headers.items():
+            self.send_header(key, value)
+
+        if status in (HTTPStatus.NO_CONTENT, HTTPStatus.NOT_MODIFIED):
+            self.end_headers()
+            return
+
+        chunked = (
+            self.request_version == "HTTP/1.1"
+            and self.protocol_version == "HTTP/1.1"
+        )
+        self.send_header("Content-type", result.content_type)
+        if chunked:
+            self.send_header("Transfer-Encoding", "chunked")
+        else:
+            self.close_connection = True
+        self.end_headers()
+
+        try:
+            buffer = []
+            buffer_size = 0
+            for chunk in result:
+                buffer.append(chunk)
+                buffer_size += len(chunk)
+                if buffer_size >= self.stream_chunk_size:
+                    self._write_chunk(b"".join(buffer), chunked)
+                    buffer = []
+                    buffer_size = 0
+
+            if buffer:
+                self._write_chunk(b"".join(buffer), chunked)
+
+            if chunked:
+                self.wfile.write(b"0\r\n\r\n")
+
+        except (BrokenPipeError, ConnectionResetError):
+            log.debug("Connection closed while streaming \"{}\"".format(
+                self.path
+            ))
+            self.close_connection = True
+
+        except Exception:
+            # Headers were already sent so client can only find out about
+            #   failure from incomplete body
+            log.error(
+                "Streaming of response for \"{}\" failed".format(self.path),
+                exc_info=True
+            )
+            self.close_connection = True
+
+    def _write_chunk(self, data, chunked):
+        if chunked:
+            self.wfile.write("{:x}\r\n".format(len(data)).encode())
+            self.wfile.write(data)
+            self.wfile.write(b"\r\n")
+        else:
+            self.wfile.write(data)
+
+    def _handle_callback(self, item, parsed_url, rest_method, url_data=None):
         """Prepare data from request and trigger callback.
 
         Data are loaded from body of request if there are any.
@@ -236,15 +281,17 @@ class Handler(http.server.SimpleHTTPRequestHandler):
         :type parsed_url: ParseResult
         :param rest_method: Rest api method (GET, POST, etc.).
         :type rest_method: RestMethods
+        :param url_data: Values of dynamic keys from matched path.
+        :type url_data: dict, None
         """
         regex_keys = item["regex_keys"]
 
-        url_data = None
+        _url_data = None
         if regex_keys:
-            url_data = {key: None for key in regex_keys}
-            if item["url_data"]:
-                for key, value in item["url_data"].items():
-                    url_data[key] = value
+            _url_data = {key: None for key in regex_keys}
+            if url_data:
+                for key, value in url_data.items():
+                    _url_data[key] = value
 
         in_data = None
         cont_len = self.headers.get("Content-Length")
@@ -261,7 +308,7 @@ class Handler(http.server.SimpleHTTPRequestHandler):
                     raise Exception("Invalid JSON recieved") from e
 
         request_info = RequestInfo(
-            url_data=url_data,
+            url_data=_url_data,
             request_data=in_data,
             query=parsed_url.query,
             fragment=parsed_url.fragment,
@@ -290,8 +337,17 @@ class Handler(http.server.SimpleHTTPRequestHandler):
         return callback(*args, **kwargs)
 
     def _handle_statics(self, dirpath, path):
-        """Return static file in response when file exist in destination."""
+        """Stream static file in response when file exist in destination.
+
+        File is not loaded to memory but sent in chunks (with `sendfile` when
+        connection allows it). Response has ETag so clients can validate
+        their cache with "If-None-Match" and single byte range requested with
+        "Range" header is responded with partial content.
+        """
         path = os.path.normpath(dirpath + path)
+        if os.path.commonpath([dirpath, path]) != dirpath:
+            self.send_error(HTTPStatus.NOT_FOUND, "File not found")
+            return None
 
         ctype = self.guess_type(path)
         try:
@@ -302,44 +358,60 @@ class Handler(http.server.SimpleHTTPRequestHandler):
 
         try:
             file_stat = os.fstat(file_obj.fileno())
-            # Use browser cache if possible
-            if ("If-Modified-Since" in self.headers
-                    and "If-None-Match" not in self.headers):
-                # compare If-Modified-Since and time of last file modification
-                try:
-                    ims = http.server.email.utils.parsedate_to_datetime(
-                        self.headers["If-Modified-Since"])
-                except (TypeError, IndexError, OverflowError, ValueError):
-                    # ignore ill-formed values
-                    pass
-                else:
-                    if ims.tzinfo is None:
-                        # obsolete format with no timezone, cf.
-                        # https://tools.ietf.org/html/rfc7231#section-7.1.1.1
-                        ims = ims.replace(tzinfo=datetime.timezone.utc)
-                    if ims.tzinfo is datetime.timezone.utc:
-                        # compare to UTC datetime of last modification
-                        last_modif = datetime.datetime.fromtimestamp(
-                            file_stat.st_mtime, datetime.timezone.utc)
-                        # remove microseconds, like in If-Modified-Since
-                        last_modif = last_modif.replace(microsecond=0)
-
-                        if last_modif <= ims:
-                            self.send_response(HTTPStatus.NOT_MODIFIED)
-                            self.end_headers()
-                            file_obj.close()
-                            return None
-
-            self.send_response(HTTPStatus.OK)
+            file_size = file_stat.st_size
+            etag = "\"{:x}-{:x}\"".format(file_stat.st_mtime_ns, file_size)
+            last_modified = self.date_time_string(file_stat.st_mtime)
+
+            if self._is_not_modified(file_stat, etag):
+                self.send_response(HTTPStatus.NOT_MODIFIED)
+                self.send_header("ETag", etag)
+                self.send_header("Last-Modified", last_modified)
+                self.end_headers()
+                return None
+
+            byte_range = None
+            if_range = self.headers.get("If-Range")
+            if not if_range or if_range in (etag, last_modified):
+                byte_range = self._parse_range(
+                    self.headers.get("Range"), file_size
+                )
+
+            if byte_range is False:
+                self.send_response(
+                    HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE
+                )
+                self.send_header(
+                    "Content-Range", "bytes */{}".format(file_size)
+                )
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return None
+
+            if byte_range is None:
+                offset = 0
+                count = file_size
+                self.send_response(HTTPStatus.OK)
+            else:
+                offset, end = byte_range
+                count = end - offset + 1
+                self.send_response(HTTPStatus.PARTIAL_CONTENT)
+                self.send_header("Content-Range", "bytes {}-{}/{}".format(
+                    offset, end, file_size
+                ))
+
             self.send_header("Content-type", ctype)
-            self.send_header("Content-Length", str(file_stat[6]))
-            self.send_header(
-                "Last-Modified",
-                self.date_time_string(file_stat.st_mtime)
-            )
+            self.send_header("Content-Length", str(count))
+            self.send_header("Accept-Ranges", "bytes")
+            self.send_header("ETag", etag)
+            self.send_header("Last-Modified", last_modified)
             self.end_headers()
-            self.wfile.write(file_obj.read())
+            self._send_file(file_obj, offset, count)
             return file_obj
+
+        except (BrokenPipeError, ConnectionResetError):
+            log.debug(
+                "Connection closed while sending file \"{}\"".format(path)
+            )
         except Exception:
             log.error(
                 "Failed to read data from file \"{}\"".format(path),
@@ -347,3 +419,101 @@ class Handler(http.server.SimpleHTTPRequestHandler):
             )
         finally:
             file_obj.close()
+
+    def _is_not_modified(self, file_stat, etag):
+        """Check cache validators of request against static file."""
+        if_none_match = self.headers.get("If-None-Match")
+        if if_none_match:
+            if if_none_match.strip() == "*":
+                return True
+            for value in if_none_match.split(","):
+                value = value.strip()
+                if value.startswith("W/"):
+                    value = value[2:]
+                if value == etag:
+                    return True
+            return False
+
+        if "If-Modified-Since" not in self.headers:
+            return False
+
+        # compare If-Modified-Since and time of last file modification
+        try:
+            ims = http.server.email.utils.parsedate_to_datetime(
+                self.headers["If-Modified-Since"])
+        except (TypeError, IndexError, OverflowError, ValueError):
+            # ignore ill-formed values
+            return False
+
+        if ims.tzinfo is None:
+            # obsolete format with no timezone, cf.
+            # https://tools.ietf.org/html/rfc7231#section-7.1.1.1
+            ims = ims.replace(tzinfo=datetime.timezone.utc)
+        if ims.tzinfo is not datetime.timezone.utc:
+            return False
+
+        # compare to UTC datetime of last modification
+        last_modif = datetime.datetime.fromtimestamp(
+            file_stat.st_mtime, datetime.timezone.utc)
+        # remove microseconds, like in If-Modified-Since
+        last_modif = last_modif.replace(microsecond=0)
+        return last_modif <= ims
+
+    @staticmethod
+    def _parse_range(value, file_size):
+        """Parse "Range" header with single byte range.
+
+        :return: Inclusive first and last byte of range, None when whole file
+            should be sent or False when range is not satisfiable.
+        :rtype: tuple(int, int), None, bool
+        """
+        if not value:
+            return None
+
+        unit, _, ranges = value.partition("=")
+        # Multiple ranges are not supported, whole file is sent instead
+        if unit.strip().lower() != "bytes" or "," in ranges:
+            return None
+
+        start, sep, end = ranges.strip().partition("-")
+        if not sep:
+            return None
+
+        try:
+            if not start:
+                # Suffix range "-500" means last 500 bytes
+                suffix = int(end)
+                if suffix <= 0:
+                    return False
+                return max(file_size - suffix, 0), file_size - 1
+
+            start = int(start)
+            end = int(end) if end else file_size - 1
+        except ValueError:
+            return None
+
+        if start >= file_size:
+            return False
+
+        if start > end:
+            return None
+        return start, min(end, file_size - 1)
+
+    def _send_file(self, file_obj, offset, count):
+        """Send part of file to client without loading it to memory."""
+        if count <= 0:
+            return
+
+        self.wfile.flush()
+        sendfile = getattr(self.connection, "sendfile", None)
+        if sendfile is not None:
+            sendfile(file_obj, offset, count)
+            return
+
+        file_obj.seek(offset)
+        while count > 0:
+            chunk = file_obj.read(min(self.statics_chunk_size, count))
+            if not chunk:
+                break
+            self.wfile.write(chunk)
+            count -= len(chunk)
@@ -195,3 +195,37 @@ class CallbackResult:
 
     def items(self):
         return self._data.items()
+
+
+class StreamResult:
+    """Can be used as return value of callback to send body in parts.
+
+    Body is not created in memory but chunks are sent to client as they are
+    yielded from iterable. Response is sent with chunked transfer encoding
+    for HTTP/1.1 connections otherwise connection is closed after body.
+
+    :param chunks: Parts of body.
+    :type chunks: iterable of str or bytes
+    :param status_code: Status code of result.
+    :type status_code: int
+    :param content_type: Content type of body.
+    :type content_type: str
+    :param headers: Additional headers of response (e.g. "ETag").
+    :type headers: dict, None
+    """
+
+    def __init__(
+        self, chunks=None, status_code=HTTPStatus.OK,
+        content_type="application/json", headers=None
+    ):
+        self.chunks = chunks or []
+        self.status_code = status_code
+        self.content_type = content_type
+        self.headers = headers or {}
+
+    def __iter__(self):
+        for chunk in self.chunks:
+            if isinstance(chunk, str):
+                chunk = chunk.encode()
+            if chunk:
+                yield chunk
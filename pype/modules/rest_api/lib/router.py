@@ -0,0 +1,156 @@
+import re
+
+
+class PrefixTrie:
+    """Character trie of url prefixes.
+
+    Lookup walks requested path once and returns registered prefixes the
+    path starts with (same test as `str.startswith`).
+    """
+
+    def __init__(self):
+        self._root = {}
+
+    def __bool__(self):
+        return bool(self._root)
+
+    def insert(self, prefix, value):
+        node = self._root
+        for char in prefix:
+            node = node.setdefault(char, {})
+        node.setdefault(None, []).append((prefix, value))
+
+    def matches(self, path):
+        """Yield (prefix, value) of matching prefixes from the shortest."""
+        node = self._root
+        for item in node.get(None, ()):
+            yield item
+
+        for char in path:
+            node = node.get(char)
+            if node is None:
+                break
+            for item in node.get(None, ()):
+                yield item
+
+    def longest_match(self, path):
+        """Return tuple (prefix, value) of longest matching prefix or None."""
+        found = None
+        for item in self.matches(path):
+            found = item
+        return found
+
+
+def route_literal_head(item):
+    """Part of route full path which must be at start of matching path.
+
+    Registered paths are not escaped for regex and character before dynamic
+    key is optional when route is not strict so last character before first
+    dynamic key or special character is not part of the head.
+    """
+    fullpath = item["fullpath"]
+    if item["regex"] is None:
+        return fullpath
+
+    head = fullpath.split("<", 1)[0]
+    special = re.search(r"[.^$*+?{}\[\]\\|()]", head)
+    if special:
+        head = head[:special.start()]
+    return head[:-1]
+
+
+class MethodRoutes:
+    """Routes of one rest method indexed by literal heads of their paths.
+
+    Only routes with literal head matching requested path are tried and they
+    are tried in order of registration so the first registered matching route
+    wins as with sequential matching of all routes.
+    """
+
+    def __init__(self, items):
+        self.items = list(items)
+        self.heads = PrefixTrie()
+        for idx, item in enumerate(self.items):
+            self.heads.insert(route_literal_head(item), idx)
+
+    def match(self, path):
+        """Find route matching path.
+
+        :return: Matching route item and values of dynamic keys.
+        :rtype: tuple(dict, dict), tuple(None, None)
+        """
+        candidates = [idx for _, idx in self.heads.matches(path)]
+        if len(candidates) > 1:
+            candidates.sort()
+
+        for idx in candidates:
+            item = self.items[idx]
+            regex = item["regex"]
+            if regex is None:
+                if path == item["fullpath"]:
+                    return item, None
+                continue
+
+            found = regex.match(path)
+            if found:
+                return item, found.groupdict()
+        return None, None
+
+
+class Router:
+    """Routes and statics of RestApiFactory compiled for fast lookup.
+
+    Created once when registered callbacks are prepared so handling of
+    request does not iterate through all registered prefixes and routes.
+
+    :param prepared_routes: Prepared route items by method and url prefix.
+    :type prepared_routes: dict
+    :param prepared_statics: Statics directories by url prefix.
+    :type prepared_statics: dict
+    """
+
+    def __init__(self, prepared_routes, prepared_statics):
+        self.statics = PrefixTrie()
+        for prefix, dirpath in prepared_statics.items():
+            self.statics.insert(prefix or "", dirpath)
+
+        self.routes = {}
+        self.prefixes = {}
+        for method, url_prefixes in prepared_routes.items():
+            items = []
+            prefixes = PrefixTrie()
+            for url_prefix, prefix_items in url_prefixes.items():
+                items.extend(prefix_items)
+                if url_prefix is not None:
+                    prefixes.insert(url_prefix, None)
+            self.routes[method] = MethodRoutes(items)
+            self.prefixes[method] = prefixes
+
+    def match_statics(self, path):
+        """Return tuple (directory, rest of path) when path is for statics."""
+        found = self.statics.longest_match(path)
+        if found is None:
+            return None, None
+        prefix, dirpath = found
+        return dirpath, path[len(prefix):]
+
+    def match(self, rest_method, path):
+        """Find route item and url data of callback for path and method.
+
+        :return: Matching route item and values of dynamic keys.
+        :rtype: tuple(dict, dict), tuple(None, None)
+        """
+        method_routes = self.routes.get(rest_method)
+        if method_routes is None:
+            return None, None
+        return method_routes.match(path)
+
+    def match_prefix(self, rest_method, path):
+        """Registered url prefix of method routes the path starts with."""
+        prefixes = self.prefixes.get(rest_method)
+        if not prefixes:
+            return None
+        found = prefixes.longest_match(path)
+        if found is None:
+            return None
+        return found[0]
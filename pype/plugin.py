@@ -1,8 +1,16 @@
 import tempfile
 import os
+import sys
+import logging
+import threading
+import contextlib
+from multiprocessing.pool import ThreadPool
+
 import pyblish.api
+import pyblish.logic
+import pyblish.plugin
 
-from pype.api import config
+from pype.settings import get_presets, thaw
 import inspect
 
 ValidatePipelineOrder = pyblish.api.ValidatorOrder + 0.05
@@ -24,7 +32,7 @@ def imprint_attributes(plugin):
     plugin_host = file.split(os.path.sep)[-3:-2][0]
     plugin_name = type(plugin).__name__
     try:
-        config_data = config.get_presets()['plugins'][plugin_host][plugin_kind][plugin_name]  # noqa: E501
+        config_data = get_presets()['plugins'][plugin_host][plugin_kind][plugin_name]  # noqa: E501
     except KeyError:
         print("preset not found")
         return
@@ -33,7 +41,7 @@ def imprint_attributes(plugin):
         if option == "enabled" and value is False:
             setattr(plugin, "active", False)
         else:
-            setattr(plugin, option, value)
+            setattr(plugin, option, thaw(value))
             print("setting {}: {} on {}".format(option, value, plugin_name))
 
 
@@ -114,3 +122,241 @@ def contextplugin_should_run(plugin, context):
 
 class ValidationException(Exception):
     pass
+
+
+def is_parallel_validator(plugin):
+    """Validator may be processed concurrently with other validators.
+
+    Plugins opt in with `thread_safe = True` class attribute. Such
+    validators must only read scene state, database or files and must not
+    change context or instances data.
+    """
+    return (
+        getattr(plugin, "thread_safe", False) is True
+        and pyblish.api.ValidatorOrder - 0.5
+        <= plugin.order
+        < pyblish.api.ValidatorOrder + 0.5
+    )
+
+
+def parallel_validators_run(plugins, index):
+    """Consecutive parallel validators with same order starting at `index`.
+
+    Order of plugins is kept, only validators with exactly same order are
+    processed at once so registered test stops publishing at same place.
+    """
+    run = []
+    first = plugins[index]
+    for plugin in plugins[index:]:
+        if plugin.order != first.order or not is_parallel_validator(plugin):
+            break
+        run.append(plugin)
+    return run
+
+
+class ThreadRecordsHandler(logging.Handler):
+    """Collect log records by thread which emitted them.
+
+    Records are stored only for threads registered in `records_by_thread`.
+    """
+
+    def __init__(self):
+        logging.Handler.__init__(self)
+        self.records_by_thread = {}
+
+    def emit(self, record):
+        records = self.records_by_thread.get(record.thread)
+        if records is not None:
+            records.append(record)
+
+
+_parallel_lock = threading.Lock()
+
+
+def process_parallel(pairs, context, max_workers=4):
+    """Process plugin/instance pairs in pool of threads.
+
+    `pyblish.plugin.process` sets root logger level to DEBUG for each call
+    and restores previous level when finished, which breaks when calls
+    overlap. Root logger level is set once for whole pool instead, capturing
+    of `pyblish.plugin.process` is skipped in worker threads and records are
+    collected by one handler routing them to result of pair processed by
+    the thread which emitted them.
+
+    Returns:
+        list: Results in the same order as pairs.
+    """
+    pairs = list(pairs)
+    workers = min(max(1, int(max_workers)), len(pairs))
+    if workers < 2:
+        return [
+            pyblish.plugin.process(plugin, context, instance)
+            for plugin, instance in pairs
+        ]
+
+    handler = ThreadRecordsHandler()
+    pyblish_logger = pyblish.plugin.logger
+
+    @contextlib.contextmanager
+    def worker_logger(_handler):
+        if threading.current_thread().ident in handler.records_by_thread:
+            yield
+        else:
+            with pyblish_logger(_handler):
+                yield
+
+    def _process(pair):
+        plugin, instance = pair
+        thread_id = threading.current_thread().ident
+        records = []
+        handler.records_by_thread[thread_id] = records
+        try:
+            result = pyblish.plugin.process(plugin, context, instance)
+        finally:
+            handler.records_by_thread.pop(thread_id, None)
+        result["records"] = records
+        return result
+
+    root_logger = logging.getLogger()
+    with _parallel_lock:
+        level = root_logger.level
+        root_logger.addHandler(handler)
+        root_logger.setLevel(logging.DEBUG)
+        pyblish.plugin.logger = worker_logger
+        pool = ThreadPool(workers)
+        try:
+            return pool.map(_process, pairs, chunksize=1)
+        finally:
+            pool.close()
+            pool.join()
+            pyblish.plugin.logger = pyblish_logger
+            root_logger.removeHandler(handler)
+            root_logger.setLevel(level)
+
+
+class ParallelProcessing(object):
+    """Process pairs with `process_parallel` in background thread.
+
+    Used by UI which can't wait for results in main thread.
+    """
+
+    def __init__(self, pairs, context, max_workers=4):
+        self.pairs = list(pairs)
+        self.results = None
+        self.error = None
+        self._thread = threading.Thread(
+            target=self._run, args=(context, max_workers)
+        )
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _run(self, context, max_workers):
+        try:
+            self.results = process_parallel(self.pairs, context, max_workers)
+        except Exception:
+            self.error = sys.exc_info()
+
+    def wait(self, timeout=None):
+        """Wait for results.
+
+        Returns:
+            bool: Processing has finished.
+        """
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+
+def plugin_pairs(plugin, context):
+    """Pairs of plugin and instances (or None for context) to process.
+
+    Returns:
+        tuple: Plugin should be skipped and list of pairs.
+    """
+    if plugin.__instanceEnabled__:
+        instances = pyblish.logic.instances_by_plugin(context, plugin)
+        if not instances:
+            return True, []
+
+        pairs = []
+        for instance in instances:
+            if instance.data.get("publish") is False:
+                pyblish.logic.log.debug(
+                    "%s was inactive, skipping.." % instance
+                )
+                continue
+            pairs.append((plugin, instance))
+        return False, pairs
+
+    families = set()
+    for instance in context:
+        if instance.data.get("publish") is False:
+            continue
+        family = instance.data.get("family")
+        if family:
+            families.add(family)
+        families.update(instance.data.get("families") or [])
+    if not pyblish.logic.plugins_by_families([plugin], list(families)):
+        return True, []
+    return False, [(plugin, None)]
+
+
+def publish(context=None, plugins=None, targets=None, max_workers=None):
+    """Headless publish with parallel processing of thread safe validators.
+
+    Equivalent of `pyblish.util.publish` which processes validators with
+    `thread_safe` attribute concurrently.
+
+    Args:
+        context (pyblish.api.Context): Context to publish. New is created
+            when not passed.
+        plugins (list): Plugins to process. Discovered when not passed.
+        targets (list): Targets of plugins. Registered targets are used
+            when not passed.
+        max_workers (int): Number of validators processed at once. Value of
+            `PYPE_VALIDATION_WORKERS` environment variable or 4 by default.
+
+    Returns:
+        pyblish.api.Context: Published context.
+    """
+    if context is None:
+        context = pyblish.api.Context()
+    if plugins is None:
+        plugins = pyblish.api.discover()
+    if targets is None:
+        targets = pyblish.logic.registered_targets() or ["default"]
+    if max_workers is None:
+        max_workers = int(os.environ.get("PYPE_VALIDATION_WORKERS") or 4)
+
+    plugins = pyblish.logic.plugins_by_targets(plugins, targets)
+    test = pyblish.logic.registered_test()
+    state = {"nextOrder": None, "ordersWithError": set()}
+
+    index = 0
+    while index < len(plugins):
+        plugin = plugins[index]
+        state["nextOrder"] = plugin.order
+        if test(**state):
+            break
+
+        run = parallel_validators_run(plugins, index) or [plugin]
+        index += len(run)
+
+        pairs = []
+        for _plugin in run:
+            if not _plugin.active:
+                continue
+            pairs.extend(plugin_pairs(_plugin, context)[1])
+
+        if is_parallel_validator(plugin):
+            results = process_parallel(pairs, context, max_workers)
+        else:
+            results = [
+                pyblish.plugin.process(_plugin, context, instance)
+                for _plugin, instance in pairs
+            ]
+
+        for result in results:
+            if result["error"] is not None:
+                state["ordersWithError"].add(result["plugin"].order)
+
+    return context
@@ -12,6 +12,7 @@ import json
 
 import pyblish.api
 from avalon import api
+from pype.lib import FrameSequence, get_sequence_scanner
 
 
 class CollectRenderedFiles(pyblish.api.ContextPlugin):
@@ -47,6 +48,41 @@ class CollectRenderedFiles(pyblish.api.ContextPlugin):
         if staging_dir:
             data_object["stagingDir"] = anatomy.fill_root(staging_dir)
 
+    def _check_sequence(self, repre_data):
+        """Report missing and empty frames of rendered sequence.
+
+        Staging directory is scanned with scanner shared in context so
+        validators don't have to list it again.
+        """
+        files = repre_data.get("files")
+        staging_dir = repre_data.get("stagingDir")
+        if not isinstance(files, (list, tuple)) or not staging_dir:
+            return
+
+        scanner = get_sequence_scanner(self._context)
+        sequence = scanner.find_sequence(os.path.join(staging_dir, files[0]))
+        if sequence is None:
+            self.log.warning(
+                "Rendered sequence \"{}\" was not found in \"{}\"".format(
+                    files[0], staging_dir
+                )
+            )
+            return
+
+        missing = sequence.missing(
+            repre_data.get("frameStart"), repre_data.get("frameEnd")
+        )
+        if missing:
+            self.log.warning("Missing rendered frames of {}: {}".format(
+                sequence.format(), FrameSequence.format_ranges(missing)
+            ))
+
+        zero_byte = sequence.zero_byte_frames()
+        if zero_byte:
+            self.log.warning("Empty rendered frames of {}: {}".format(
+                sequence.format(), zero_byte
+            ))
+
     def _process_path(self, data, anatomy):
         # validate basic necessary data
         data_err = "invalid json file - missing data"
@@ -95,6 +131,7 @@ class CollectRenderedFiles(pyblish.api.ContextPlugin):
             representations = []
             for repre_data in instance_data.get("representations") or []:
                 self._fill_staging_dir(repre_data, anatomy)
+                self._check_sequence(repre_data)
                 representations.append(repre_data)
 
             instance.data["representations"] = representations
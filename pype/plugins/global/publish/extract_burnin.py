@@ -1,7 +1,9 @@
 import os
 import re
+import sys
 import json
 import copy
+from multiprocessing.pool import ThreadPool
 
 import pype.api
 import pyblish
@@ -49,6 +51,11 @@ class ExtractBurnin(pype.api.Extractor):
     options = None
     fields = None
 
+    # Render burnins without Python subprocess when possible
+    burnin_in_process = True
+    # Number of burnins rendered at once
+    burnin_workers = 4
+
     def process(self, instance):
         # ffmpeg doesn't support multipart exrs
         if instance.data.get("multipartExr") is True:
@@ -67,6 +74,7 @@ class ExtractBurnin(pype.api.Extractor):
             raise RuntimeError("Burnin needs already created mov to work on.")
 
         if self.use_legacy_code(instance):
+            self.encode_deferred_reviews(instance)
             return self.legacy_process(instance)
         self.main_process(instance)
 
@@ -127,9 +135,11 @@ class ExtractBurnin(pype.api.Extractor):
         _burnin_data, _temp_data = self.prepare_basic_data(instance)
 
         anatomy = instance.context.data["anatomy"]
-        scriptpath = self.burnin_script_path()
-        executable = self.python_executable_path()
 
+        # Burnins of all representations are rendered at once after all
+        # are prepared
+        burnin_jobs = []
+        processed_repres = []
         for idx, repre in enumerate(tuple(instance.data["representations"])):
             self.log.debug("repre ({}): `{}`".format(idx + 1, repre["name"]))
             if not self.repres_is_valid(repre):
@@ -160,9 +170,15 @@ class ExtractBurnin(pype.api.Extractor):
 
             first_output = True
 
+            new_repres = []
             files_to_delete = []
+            # Review was not encoded yet (`merge_burnins` of ExtractReview)
+            # - burnins are rendered during the review encode
+            review_encode = repre.get("reviewEncode")
+
             for filename_suffix, burnin_def in repre_burnin_defs.items():
                 new_repre = copy.deepcopy(repre)
+                new_repre.pop("reviewEncode", None)
 
                 # Keep "ftrackreview" tag only on first output
                 if first_output:
@@ -212,29 +228,28 @@ class ExtractBurnin(pype.api.Extractor):
                     "options": burnin_options,
                     "values": burnin_values
                 }
+                if review_encode:
+                    script_data["review_encode"] = review_encode
 
                 self.log.debug(
                     "script_data: {}".format(json.dumps(script_data, indent=4))
                 )
-
-                # Dump data to string
-                dumped_script_data = json.dumps(script_data)
-
-                # Prepare subprocess arguments
-                args = [executable, scriptpath, dumped_script_data]
-                self.log.debug("Executing: {}".format(args))
-
-                # Run burnin script
-                output = pype.api.subprocess(args, shell=True)
-                self.log.debug("Output: {}".format(output))
+                burnin_jobs.append(script_data)
 
                 for filepath in temp_data["full_input_paths"]:
                     filepath = filepath.replace("\\", "/")
                     if filepath not in files_to_delete:
                         files_to_delete.append(filepath)
 
-                # Add new representation to instance
-                instance.data["representations"].append(new_repre)
+                new_repres.append(new_repre)
+
+            processed_repres.append((repre, new_repres, files_to_delete))
+
+        self.run_burnin_jobs(burnin_jobs)
+
+        for repre, new_repres, files_to_delete in processed_repres:
+            # Add new representations to instance
+            instance.data["representations"].extend(new_repres)
 
             # Remove source representation
             # NOTE we maybe can keep source representation if necessary
@@ -246,6 +261,79 @@ class ExtractBurnin(pype.api.Extractor):
                     os.remove(filepath)
                     self.log.debug("Removed: \"{}\"".format(filepath))
 
+    def run_burnin_jobs(self, burnin_jobs):
+        """Render burnins with pool of `burnin_workers` threads.
+
+        Burnins are rendered in-process with `pype.scripts.otio_burnin` when
+        it can be imported (Python 3 with OpenTimelineIO) otherwise burnin
+        script is launched in Python 3 subprocess for each job.
+
+        Args:
+            burnin_jobs (list): Data for burnin script for each output.
+        """
+        if not burnin_jobs:
+            return
+
+        burnin_module = self.burnin_module()
+        if burnin_module is not None:
+            self.log.debug("Rendering burnins in-process.")
+            job_function = burnin_module.process_script_data
+        else:
+            job_function = self.run_burnin_script
+
+        workers = min(self.burnin_workers, len(burnin_jobs))
+        if workers < 2:
+            for script_data in burnin_jobs:
+                job_function(script_data)
+            return
+
+        pool = ThreadPool(workers)
+        try:
+            # `map` re-raises first exception from workers
+            pool.map(job_function, burnin_jobs, chunksize=1)
+        finally:
+            pool.close()
+            pool.join()
+
+    def burnin_module(self):
+        """Burnin module if burnins can be rendered in-process."""
+        if not self.burnin_in_process or sys.version_info[0] < 3:
+            return None
+
+        try:
+            from pype.scripts import otio_burnin
+        except ImportError:
+            self.log.debug(
+                "Burnin module can't be imported.", exc_info=True
+            )
+            return None
+        return otio_burnin
+
+    def run_burnin_script(self, script_data):
+        """Render burnins with burnin script in Python 3 subprocess."""
+        # Prepare subprocess arguments
+        args = [
+            self.python_executable_path(),
+            self.burnin_script_path(),
+            json.dumps(script_data)
+        ]
+        self.log.debug("Executing: {}".format(args))
+
+        # Run burnin script
+        output = pype.api.subprocess(args, shell=True)
+        self.log.debug("Output: {}".format(output))
+
+    def encode_deferred_reviews(self, instance):
+        """Encode reviews deferred by ExtractReview without burnins."""
+        for repre in instance.data["representations"]:
+            review_encode = repre.pop("reviewEncode", None)
+            if not review_encode:
+                continue
+
+            self.log.debug("Executing: {}".format(review_encode["command"]))
+            output = pype.api.subprocess(review_encode["command"], shell=True)
+            self.log.debug("Output: {}".format(output))
+
     def prepare_basic_data(self, instance):
         """Pick data from instance for processing and for burnin strings.
 
@@ -1,9 +1,16 @@
+import copy
+
 import pyblish.api
 from avalon import io
+from pymongo import InsertOne, UpdateOne, ReplaceOne
 
 
 class ExtractHierarchyToAvalon(pyblish.api.ContextPlugin):
-    """Create entities in Avalon based on collected data."""
+    """Create entities in Avalon based on collected data.
+
+    Existing and archived assets of whole hierarchy are queried at once,
+    changes are resolved in memory and written with one bulk write.
+    """
 
     order = pyblish.api.ExtractorOrder - 0.01
     label = "Extract Hierarchy To Avalon"
@@ -19,7 +26,67 @@ class ExtractHierarchyToAvalon(pyblish.api.ContextPlugin):
 
         input_data = context.data["hierarchyContext"]
         self.project = None
+        self.bulk_writes = []
+        self.prefetch_assets(input_data)
         self.import_to_avalon(input_data)
+        self.commit_bulk_writes()
+
+    def collect_asset_names(self, input_data, names=None):
+        """Names of all non-project entities in hierarchy."""
+        if names is None:
+            names = set()
+
+        for name, entity_data in input_data.items():
+            if entity_data["entity_type"].lower() != "project":
+                names.add(name)
+
+            if "childs" in entity_data:
+                self.collect_asset_names(entity_data["childs"], names)
+        return names
+
+    def prefetch_assets(self, input_data):
+        """Query existing and archived assets named in hierarchy at once."""
+        self.assets_by_name = {}
+        self.archived_by_name = {}
+
+        names = self.collect_asset_names(input_data)
+        if not names:
+            return
+
+        asset_docs = io.find({
+            "type": {"$in": ["asset", "archived_asset"]},
+            "name": {"$in": list(names)}
+        })
+        for asset_doc in asset_docs:
+            name = asset_doc["name"]
+            if asset_doc["type"] == "archived_asset":
+                self.archived_by_name.setdefault(name, []).append(asset_doc)
+            elif name not in self.assets_by_name:
+                self.assets_by_name[name] = asset_doc
+
+    def find_asset(self, name):
+        # Copy is returned as from database so changes of entity data
+        #   are not propagated to cached document
+        asset_doc = self.assets_by_name.get(name)
+        if asset_doc is not None:
+            asset_doc = copy.deepcopy(asset_doc)
+        return asset_doc
+
+    def store_asset(self, asset_doc):
+        self.assets_by_name[asset_doc["name"]] = copy.deepcopy(asset_doc)
+
+    def commit_bulk_writes(self):
+        """Write all collected changes to database in one ordered batch."""
+        if not self.bulk_writes:
+            return
+
+        io._database[io.Session["AVALON_PROJECT"]].bulk_write(
+            self.bulk_writes, ordered=True
+        )
+        self.log.debug(
+            "Stored {} database changes.".format(len(self.bulk_writes))
+        )
+        self.bulk_writes = []
 
     def import_to_avalon(self, input_data, parent=None):
         for name in input_data:
@@ -74,7 +141,7 @@ class ExtractHierarchyToAvalon(pyblish.api.ContextPlugin):
                 )
             # Else process assset
             else:
-                entity = io.find_one({"type": "asset", "name": name})
+                entity = self.find_asset(name)
                 if entity:
                     # Do not override data, only update
                     cur_entity_data = entity.get("data") or {}
@@ -89,10 +156,7 @@ class ExtractHierarchyToAvalon(pyblish.api.ContextPlugin):
                     # Skip updating data
                     update_data = False
 
-                    archived_entities = io.find({
-                        "type": "archived_asset",
-                        "name": name
-                    })
+                    archived_entities = self.archived_by_name.get(name, [])
                     unarchive_entity = None
                     for archived_entity in archived_entities:
                         archived_parents = (
@@ -109,14 +173,18 @@ class ExtractHierarchyToAvalon(pyblish.api.ContextPlugin):
                         entity = self.create_avalon_asset(name, data)
                     else:
                         # Unarchive if entity was archived
+                        archived_entities.remove(unarchive_entity)
                         entity = self.unarchive_entity(unarchive_entity, data)
 
             if update_data:
                 # Update entity data with input data
-                io.update_many(
+                self.bulk_writes.append(UpdateOne(
                     {"_id": entity["_id"]},
                     {"$set": {"data": data}}
-                )
+                ))
+                if entity_type.lower() != "project":
+                    entity["data"] = data
+                    self.store_asset(entity)
 
             if "childs" in entity_data:
                 self.import_to_avalon(entity_data["childs"], entity)
@@ -131,14 +199,16 @@ class ExtractHierarchyToAvalon(pyblish.api.ContextPlugin):
             "type": "asset",
             "data": data
         }
-        io.replace_one(
+        self.bulk_writes.append(ReplaceOne(
             {"_id": entity["_id"]},
             new_entity
-        )
+        ))
+        self.store_asset(new_entity)
         return new_entity
 
     def create_avalon_asset(self, name, data):
         item = {
+            "_id": io.ObjectId(),
             "schema": "avalon-core:asset-3.0",
             "name": name,
             "parent": self.project["_id"],
@@ -146,6 +216,7 @@ class ExtractHierarchyToAvalon(pyblish.api.ContextPlugin):
             "data": data
         }
         self.log.debug("Creating asset: {}".format(item))
-        entity_id = io.insert_one(item).inserted_id
+        self.bulk_writes.append(InsertOne(item))
+        self.store_asset(item)
 
-        return io.find_one({"_id": entity_id})
+        return item
@@ -2,6 +2,7 @@ import os
 import re
 import copy
 import json
+import fractions
 import pyblish.api
 import clique
 import pype.api
@@ -42,6 +43,14 @@ class ExtractReview(pyblish.api.InstancePlugin):
 
     # Preset attributes
     profiles = None
+    # Encode all outputs of a representation which share the same input
+    # arguments in one ffmpeg process with `split` filter so input is decoded
+    # only once
+    single_pass_outputs = False
+    # Outputs with "burnin" tag are not encoded here but their prepared
+    # encode is stored to representation so ExtractBurnin can render
+    # burnins in the same ffmpeg process as review
+    merge_burnins = False
 
     # Legacy attributes
     outputs = {}
@@ -117,6 +126,10 @@ class ExtractReview(pyblish.api.InstancePlugin):
             definition["filename_suffix"] = filename_suffix
             profile_outputs.append(definition)
 
+        # Probe all inputs at once, results are cached so each input is
+        # probed only once for all output definitions
+        self.prefetch_input_streams(instance)
+
         # Loop through representations
         for repre in tuple(instance.data["representations"]):
             tags = repre.get("tags") or []
@@ -148,6 +161,7 @@ class ExtractReview(pyblish.api.InstancePlugin):
                 ).format(str(tags)))
                 continue
 
+            output_jobs = []
             for _output_def in outputs:
                 output_def = copy.deepcopy(_output_def)
                 # Make sure output definition has "tags" key
@@ -172,16 +186,20 @@ class ExtractReview(pyblish.api.InstancePlugin):
 
                 temp_data = self.prepare_temp_data(instance, repre, output_def)
 
-                ffmpeg_args = self._ffmpeg_arguments(
+                ffmpeg_parts = self._ffmpeg_arguments_parts(
                     output_def, instance, new_repre, temp_data
                 )
-                subprcs_cmd = " ".join(ffmpeg_args)
+                output_jobs.append(
+                    (output_def, new_repre, temp_data, ffmpeg_parts)
+                )
 
-                # run subprocess
-                self.log.debug("Executing: {}".format(subprcs_cmd))
-                output = pype.api.subprocess(subprcs_cmd, shell=True)
-                self.log.debug("Output: {}".format(output))
+            self.process_output_jobs([
+                job
+                for job in output_jobs
+                if not self.defer_output_job(job)
+            ])
 
+            for output_def, new_repre, temp_data, _ in output_jobs:
                 output_name = output_def["filename_suffix"]
                 if temp_data["without_handles"]:
                     output_name += "_noHandles"
@@ -206,6 +224,25 @@ class ExtractReview(pyblish.api.InstancePlugin):
                 )
                 instance.data["representations"].append(new_repre)
 
+    def prefetch_input_streams(self, instance):
+        """Probe first files of all review representations concurrently."""
+        input_paths = []
+        for repre in instance.data["representations"]:
+            tags = repre.get("tags") or []
+            if "review" not in tags or "thumbnail" in tags:
+                continue
+
+            filename = repre["files"]
+            if isinstance(filename, (tuple, list)):
+                filename = filename[0]
+            input_paths.append(os.path.join(repre["stagingDir"], filename))
+
+        try:
+            pype.lib.ffprobe_streams_batch(input_paths)
+        except Exception:
+            # Failing inputs are probed and reported again during process
+            self.log.debug("Failed to probe input files.", exc_info=True)
+
     def input_is_sequence(self, repre):
         """Deduce from representation data if input is sequence."""
         # TODO GLOBAL ISSUE - Find better way how to find out if input
@@ -277,6 +314,164 @@ class ExtractReview(pyblish.api.InstancePlugin):
             "without_handles": without_handles
         }
 
+    def process_output_jobs(self, output_jobs):
+        """Run ffmpeg for prepared outputs of one representation.
+
+        When `single_pass_outputs` is enabled, outputs with the same input
+        arguments are encoded by one ffmpeg process. Outputs which can't be
+        merged (e.g. with audio inputs or complex filters) are processed
+        one by one.
+
+        Args:
+            output_jobs (list): Tuples with output definition, new
+                representation, temp data and ffmpeg argument parts.
+        """
+        groups = []
+        groups_by_key = {}
+        for job in output_jobs:
+            key = None
+            if self.single_pass_outputs:
+                key = self.single_pass_key(job[3])
+
+            if key is None:
+                groups.append([job])
+            elif key in groups_by_key:
+                groups_by_key[key].append(job)
+            else:
+                group = [job]
+                groups_by_key[key] = group
+                groups.append(group)
+
+        for group in groups:
+            if len(group) == 1:
+                ffmpeg_args = self.ffmpeg_full_args(**group[0][3])
+            else:
+                self.log.info((
+                    "Encoding {} outputs with single ffmpeg process."
+                ).format(len(group)))
+                ffmpeg_args = self.ffmpeg_multi_output_args(group)
+
+            subprcs_cmd = " ".join(ffmpeg_args)
+
+            # run subprocess
+            self.log.debug("Executing: {}".format(subprcs_cmd))
+            output = pype.api.subprocess(subprcs_cmd, shell=True)
+            self.log.debug("Output: {}".format(output))
+
+    def defer_output_job(self, output_job):
+        """Store review encode to representation for burnins.
+
+        Encode of outputs with "burnin" tag is skipped when `merge_burnins`
+        is enabled. Prepared ffmpeg arguments are stored to representation
+        under "reviewEncode" key and ExtractBurnin renders the output with
+        burnins appended to the same filters. Representations which were
+        not processed by ExtractBurnin are encoded by
+        ExtractReviewDeferred.
+
+        Returns:
+            bool: Output was deferred.
+        """
+        output_def, new_repre, temp_data, ffmpeg_parts = output_job
+        if (
+            not self.merge_burnins
+            or "burnin" not in new_repre["tags"]
+            or temp_data["output_ext_is_image"]
+        ):
+            return False
+
+        stream = copy.deepcopy(pype.lib.ffprobe_streams(
+            temp_data["full_input_path_single_file"]
+        )[0])
+        fps = fractions.Fraction(temp_data["fps"]).limit_denominator(1001)
+        stream.update({
+            "codec_type": "video",
+            "width": new_repre["resolutionWidth"],
+            "height": new_repre["resolutionHeight"],
+            "r_frame_rate": "{}/{}".format(fps.numerator, fps.denominator)
+        })
+
+        new_repre["reviewEncode"] = {
+            "command": " ".join(self.ffmpeg_full_args(
+                **copy.deepcopy(ffmpeg_parts)
+            )),
+            "input_args": ffmpeg_parts["input_args"],
+            "video_filters": ffmpeg_parts["video_filters"],
+            "audio_filters": ffmpeg_parts["audio_filters"],
+            "output_args": ffmpeg_parts["output_args"],
+            "stream": stream
+        }
+        self.log.debug((
+            "Encode of output \"{}\" is deferred to burnins."
+        ).format(output_def["filename_suffix"]))
+        return True
+
+    def single_pass_key(self, ffmpeg_parts):
+        """Key of outputs which can be encoded by one ffmpeg process.
+
+        Returns:
+            tuple: Input arguments or None if output must be encoded
+                separately.
+        """
+        input_args = ffmpeg_parts["input_args"]
+        input_paths = [arg for arg in input_args if arg.startswith("-i ")]
+        if len(input_paths) != 1 or ffmpeg_parts["audio_filters"]:
+            return None
+
+        for video_filter in ffmpeg_parts["video_filters"]:
+            if any(char in video_filter for char in "[];\""):
+                return None
+
+        for arg in ffmpeg_parts["output_args"]:
+            if arg.startswith(("-filter_complex", "-lavfi", "-map")):
+                return None
+
+        return tuple(input_args)
+
+    def ffmpeg_multi_output_args(self, output_jobs):
+        """Arguments encoding all outputs with one decode of input.
+
+        Decoded input is split with `split` filter and each branch has
+        filters of one output.
+
+        Args:
+            output_jobs (list): Jobs with the same input arguments.
+
+        Returns:
+            list: Containing all arguments ready to run in subprocess.
+        """
+        input_args = output_jobs[0][3]["input_args"]
+        outputs_count = len(output_jobs)
+
+        filter_graph = ["[0:v]split={}{}".format(
+            outputs_count,
+            "".join("[s{}]".format(idx) for idx in range(outputs_count))
+        )]
+        output_args = []
+        for idx, job in enumerate(output_jobs):
+            _output_def, _new_repre, temp_data, ffmpeg_parts = job
+            video_filters = ffmpeg_parts["video_filters"] or ["null"]
+            filter_graph.append(
+                "[s{0}]{1}[v{0}]".format(idx, ",".join(video_filters))
+            )
+
+            output_args.append("-map \"[v{}]\"".format(idx))
+            # Keep audio of video input as output without maps would
+            if not temp_data["output_ext_is_image"]:
+                output_args.append("-map 0:a?")
+
+            for arg in ffmpeg_parts["output_args"]:
+                if arg != "-y":
+                    output_args.append(arg)
+
+        all_args = [self.ffmpeg_path, "-y"]
+        all_args.extend(input_args)
+        all_args.append(
+            "-filter_complex \"{}\"".format(";".join(filter_graph))
+        )
+        all_args.extend(output_args)
+
+        return all_args
+
     def _ffmpeg_arguments(self, output_def, instance, new_repre, temp_data):
         """Prepares ffmpeg arguments for expected extraction.
 
@@ -290,6 +485,19 @@ class ExtractReview(pyblish.api.InstancePlugin):
                 process.
             temp_data (dict): Base data for successfull process.
         """
+        return self.ffmpeg_full_args(**self._ffmpeg_arguments_parts(
+            output_def, instance, new_repre, temp_data
+        ))
+
+    def _ffmpeg_arguments_parts(
+        self, output_def, instance, new_repre, temp_data
+    ):
+        """Prepares ffmpeg arguments for expected extraction by their type.
+
+        Returns:
+            dict: Input arguments, video filters, audio filters and output
+                arguments with output filepath.
+        """
 
         # Get FFmpeg arguments from profile presets
         out_def_ffmpeg_args = output_def.get("ffmpeg_args") or {}
@@ -379,13 +587,17 @@ class ExtractReview(pyblish.api.InstancePlugin):
             "\"{}\"".format(temp_data["full_output_path"])
         )
 
-        return self.ffmpeg_full_args(
-            ffmpeg_input_args,
-            ffmpeg_video_filters,
-            ffmpeg_audio_filters,
-            ffmpeg_output_args
+        ffmpeg_output_args = self.move_filters_from_output_args(
+            ffmpeg_video_filters, ffmpeg_audio_filters, ffmpeg_output_args
         )
 
+        return {
+            "input_args": ffmpeg_input_args,
+            "video_filters": ffmpeg_video_filters,
+            "audio_filters": ffmpeg_audio_filters,
+            "output_args": ffmpeg_output_args
+        }
+
     def split_ffmpeg_args(self, in_args):
         """Makes sure all entered arguments are separated in individual items.
 
@@ -427,6 +639,31 @@ class ExtractReview(pyblish.api.InstancePlugin):
         Returns:
             list: Containing all arguments ready to run in subprocess.
         """
+        output_args = self.move_filters_from_output_args(
+            video_filters, audio_filters, output_args
+        )
+
+        all_args = []
+        all_args.append(self.ffmpeg_path)
+        all_args.extend(input_args)
+        if video_filters:
+            all_args.append("-filter:v {}".format(",".join(video_filters)))
+
+        if audio_filters:
+            all_args.append("-filter:a {}".format(",".join(audio_filters)))
+
+        all_args.extend(output_args)
+
+        return all_args
+
+    def move_filters_from_output_args(
+        self, video_filters, audio_filters, output_args
+    ):
+        """Move filters found in output arguments to filter lists.
+
+        Returns:
+            list: Output arguments without filters.
+        """
         output_args = self.split_ffmpeg_args(output_args)
 
         video_args_dentifiers = ["-vf", "-filter:v"]
@@ -444,18 +681,7 @@ class ExtractReview(pyblish.api.InstancePlugin):
                     arg = arg.replace(identifier, "").strip()
                     audio_filters.append(arg)
 
-        all_args = []
-        all_args.append(self.ffmpeg_path)
-        all_args.extend(input_args)
-        if video_filters:
-            all_args.append("-filter:v {}".format(",".join(video_filters)))
-
-        if audio_filters:
-            all_args.append("-filter:a {}".format(",".join(audio_filters)))
-
-        all_args.extend(output_args)
-
-        return all_args
+        return output_args
 
     def input_output_paths(self, new_repre, output_def, temp_data):
         """Deduce input nad output file paths based on entered data.
@@ -0,0 +1,37 @@
+import pype.api
+import pyblish.api
+
+
+class ExtractReviewDeferred(pype.api.Extractor):
+    """
+    Encode review outputs deferred by ExtractReview for burnins.
+
+    ExtractReview with `merge_burnins` enabled does not encode outputs with
+    "burnin" tag and ExtractBurnin renders them with burnins in one ffmpeg
+    process. Outputs which were not processed by ExtractBurnin (e.g. no
+    matching burnin definition or burnins are disabled) are encoded here
+    without burnins.
+    """
+
+    label = "Extract Deferred Review"
+    order = pyblish.api.ExtractorOrder + 0.0305
+    families = ["review", "burnin"]
+    hosts = [
+        "nuke",
+        "maya",
+        "shell",
+        "nukestudio",
+        "premiere",
+        "standalonepublisher",
+        "harmony"
+    ]
+
+    def process(self, instance):
+        for repre in instance.data.get("representations") or []:
+            review_encode = repre.pop("reviewEncode", None)
+            if not review_encode:
+                continue
+
+            self.log.debug("Executing: {}".format(review_encode["command"]))
+            output = pype.api.subprocess(review_encode["command"], shell=True)
+            self.log.debug("Output: {}".format(output))
@@ -2,6 +2,7 @@ import os
 from os.path import getsize
 import logging
 import sys
+import collections
 import copy
 import clique
 import errno
@@ -9,11 +10,16 @@ import six
 import re
 import shutil
 
-from pymongo import DeleteOne, InsertOne
+from pymongo import InsertOne, UpdateOne, DeleteMany
 import pyblish.api
 from avalon import io
 from avalon.vendor import filelink
 import pype.api
+from pype.lib import (
+    FileTransfer,
+    ContentStore,
+    container_version_status
+)
 from datetime import datetime
 
 # this is needed until speedcopy for linux is fixed
@@ -105,8 +111,24 @@ class IntegrateAssetNew(pyblish.api.InstancePlugin):
 
     TMP_FILE_EXT = 'tmp'  # suffix to denote temporary files, use without '.'
 
+    # number of files copied at once and number of retries of a copy
+    # when size of destination file does not match source
+    transfer_workers = 8
+    transfer_retries = 2
+
+    # store published files in content addressed store under project
+    # directory and hardlink (or reflink) them into version directories
+    content_store_enabled = False
+    content_store_dirname = ".blobs"
+    content_store = None
+
+    # key in context data where are stored prefetched documents
+    context_docs_key = "integrateNewDocs"
+
     def process(self, instance):
         self.integrated_file_sizes = {}
+        self.content_store = None
+        self.bulk_writes = []
         if [ef for ef in self.exclude_families
                 if instance.data["family"] in ef]:
             return
@@ -133,16 +155,14 @@ class IntegrateAssetNew(pyblish.api.InstancePlugin):
 
         project_entity = instance.data["projectEntity"]
 
+        context_docs = self.get_context_docs(context)
+
         context_asset_name = context.data["assetEntity"]["name"]
 
         asset_name = instance.data["asset"]
         asset_entity = instance.data.get("assetEntity")
         if not asset_entity or asset_entity["name"] != context_asset_name:
-            asset_entity = io.find_one({
-                "type": "asset",
-                "name": asset_name,
-                "parent": project_entity["_id"]
-            })
+            asset_entity = context_docs["assets"].get(asset_name)
             assert asset_entity, (
                 "No asset found by the name \"{0}\" in project \"{1}\""
             ).format(asset_name, project_entity["name"])
@@ -184,7 +204,7 @@ class IntegrateAssetNew(pyblish.api.InstancePlugin):
             )
         )
 
-        subset = self.get_subset(asset_entity, instance)
+        subset = self.get_subset(asset_entity, instance, context_docs)
         instance.data["subsetEntity"] = subset
 
         version_number = instance.data["version"]
@@ -208,65 +228,56 @@ class IntegrateAssetNew(pyblish.api.InstancePlugin):
 
         new_repre_names_low = [_repre["name"].lower() for _repre in repres]
 
-        existing_version = io.find_one({
-            'type': 'version',
-            'parent': subset["_id"],
-            'name': version_number
-        })
+        existing_version = context_docs["versions"].get(
+            (subset["_id"], version_number)
+        )
+        version_repres = context_docs["representations"].get(
+            existing_version["_id"] if existing_version else None, []
+        )
 
+        # Representations which stay untouched under the version
+        kept_repres = []
+        # Representations which are replaced by new representations
+        # - new representations reuse their ids
+        existing_repres = []
         if existing_version is None:
-            version_id = io.insert_one(version).inserted_id
+            version["_id"] = io.ObjectId()
+            version_id = version["_id"]
+            self.bulk_writes.append(InsertOne(version))
         else:
             # Check if instance have set `append` mode which cause that
             # only replicated representations are set to archive
             append_repres = instance.data.get("append", False)
 
+            version_id = existing_version["_id"]
             # Update version data
-            # TODO query by _id and
-            io.update_many({
-                'type': 'version',
-                'parent': subset["_id"],
-                'name': version_number
-            }, {
-                '$set': version
-            })
-            version_id = existing_version['_id']
-
-            # Find representations of existing version and archive them
-            current_repres = list(io.find({
-                "type": "representation",
-                "parent": version_id
-            }))
-            bulk_writes = []
-            for repre in current_repres:
+            self.bulk_writes.append(
+                UpdateOne({"_id": version_id}, {"$set": version})
+            )
+            version = dict(existing_version, **version)
+
+            # Representations of existing version are archived and
+            # archived representations are replaced by new representations
+            # - archived documents are removed when new representations are
+            #   stored so archived documents are never stored to database
+            for repre in version_repres:
+                if repre["type"] == "archived_representation":
+                    existing_repres.append(repre)
+                    continue
+
                 if append_repres:
                     # archive only duplicated representations
                     if repre["name"].lower() not in new_repre_names_low:
+                        kept_repres.append(repre)
                         continue
-                # Representation must change type,
-                # `_id` must be stored to other key and replaced with new
-                # - that is because new representations should have same ID
-                repre_id = repre["_id"]
-                bulk_writes.append(DeleteOne({"_id": repre_id}))
-
-                repre["orig_id"] = repre_id
-                repre["_id"] = io.ObjectId()
-                repre["type"] = "archived_representation"
-                bulk_writes.append(InsertOne(repre))
-
-            # bulk updates
-            if bulk_writes:
-                io._database[io.Session["AVALON_PROJECT"]].bulk_write(
-                    bulk_writes
-                )
 
-        version = io.find_one({"_id": version_id})
-        instance.data["versionEntity"] = version
+                archived_repre = copy.deepcopy(repre)
+                archived_repre["orig_id"] = repre["_id"]
+                archived_repre["_id"] = repre["_id"]
+                archived_repre["type"] = "archived_representation"
+                existing_repres.append(archived_repre)
 
-        existing_repres = list(io.find({
-            "parent": version_id,
-            "type": "archived_representation"
-        }))
+        instance.data["versionEntity"] = version
 
         instance.data['version'] = version['name']
 
@@ -292,6 +303,17 @@ class IntegrateAssetNew(pyblish.api.InstancePlugin):
 
         template_name = self.template_name_from_instance(instance)
 
+        if self.content_store_enabled:
+            self.content_store = ContentStore.from_anatomy(
+                anatomy,
+                template_name,
+                dirname=self.content_store_dirname,
+                logger=self.log
+            )
+            self.log.debug(
+                "Using content store \"{}\"".format(self.content_store.root)
+            )
+
         published_representations = {}
         for idx, repre in enumerate(instance.data["representations"]):
             # reset transfers for next representation
@@ -541,13 +563,29 @@ class IntegrateAssetNew(pyblish.api.InstancePlugin):
             repre_ids_to_remove = []
             for repre in existing_repres:
                 repre_ids_to_remove.append(repre["_id"])
-            io.delete_many({"_id": {"$in": repre_ids_to_remove}})
+            self.bulk_writes.append(
+                DeleteMany({"_id": {"$in": repre_ids_to_remove}})
+            )
 
         self.log.debug("__ representations: {}".format(representations))
         for rep in instance.data["representations"]:
             self.log.debug("__ represNAME: {}".format(rep['name']))
             self.log.debug("__ represPATH: {}".format(rep['published_path']))
-        io.insert_many(representations)
+        for representation in representations:
+            self.bulk_writes.append(InsertOne(representation))
+
+        # Subset, version and representations are stored at once
+        self.commit_bulk_writes()
+        # Loaded containers of this subset may be outdated now
+        container_version_status.invalidate([subset["_id"]])
+
+        context_docs["subsets"][(subset["parent"], subset["name"])] = subset
+        context_docs["versions"][(version["parent"], version["name"])] = (
+            version
+        )
+        context_docs["representations"][version_id] = (
+            kept_repres + representations
+        )
         instance.data["published_representations"] = (
             published_representations
         )
@@ -559,21 +597,40 @@ class IntegrateAssetNew(pyblish.api.InstancePlugin):
 
             Through `instance.data["transfers"]`
 
+            Files are copied with `FileTransfer` which uses pool of
+            `transfer_workers` threads and verifies size of each copied
+            file. Destination files which were already integrated during
+            processing of this instance are skipped.
+
             Args:
                 instance: the instance to integrate
             Returns:
                 integrated_file_sizes: dictionary of destination file url and
                 its size in bytes
         """
+        copy_function = copyfile
+        if self.content_store is not None:
+            copy_function = self.content_store.copy
+
+        file_transfer = FileTransfer(
+            max_workers=self.transfer_workers,
+            retries=self.transfer_retries,
+            copy_function=copy_function,
+            logger=self.log
+        )
+
         # store destination url and size for reporting and rollback
         integrated_file_sizes = {}
         transfers = list(instance.data.get("transfers", list()))
         for src, dest in transfers:
             if os.path.normpath(src) != os.path.normpath(dest):
                 dest = self.get_dest_temp_url(dest)
-                self.copy_file(src, dest)
-                # TODO needs to be updated during site implementation
-                integrated_file_sizes[dest] = os.path.getsize(dest)
+                if dest in self.integrated_file_sizes:
+                    integrated_file_sizes[dest] = (
+                        self.integrated_file_sizes[dest]
+                    )
+                    continue
+                file_transfer.add_copy(src, dest)
 
         # Produce hardlinked copies
         # Note: hardlink can only be produced between two files on the same
@@ -583,12 +640,16 @@ class IntegrateAssetNew(pyblish.api.InstancePlugin):
         hardlinks = instance.data.get("hardlinks", list())
         for src, dest in hardlinks:
             dest = self.get_dest_temp_url(dest)
-            self.log.debug("Hardlinking file ... {} -> {}".format(src, dest))
-            if not os.path.exists(dest):
-                self.hardlink_file(src, dest)
+            file_transfer.add_hardlink(src, dest)
 
+        try:
             # TODO needs to be updated during site implementation
-            integrated_file_sizes[dest] = os.path.getsize(dest)
+            integrated_file_sizes.update(file_transfer.process())
+        finally:
+            # make sure already transferred files are removed on failure
+            self.integrated_file_sizes.update(file_transfer.transferred)
+
+        file_transfer.report()
 
         return integrated_file_sizes
 
@@ -616,7 +677,6 @@ class IntegrateAssetNew(pyblish.api.InstancePlugin):
 
         # copy file with speedcopy and check if size of files are simetrical
         while True:
-            import shutil
             try:
                 copyfile(src, dst)
             except shutil.SameFileError:
@@ -647,21 +707,115 @@ class IntegrateAssetNew(pyblish.api.InstancePlugin):
 
         filelink.create(src, dst, filelink.HARDLINK)
 
-    def get_subset(self, asset, instance):
+    def get_context_docs(self, context):
+        """Prefetch documents of all instances in context.
+
+        Assets, subsets, versions and representations related to all
+        instances of the context are queried at once with few `$in` queries
+        when first instance is integrated. Documents are stored to context
+        data and kept up to date by each integrated instance.
+
+        Returns:
+            dict: Assets by name, subsets by parent id and name, versions by
+                parent id and name and representations (including archived)
+                by version id.
+        """
+        context_docs = context.data.get(self.context_docs_key)
+        if context_docs is not None:
+            return context_docs
+
+        asset_names = set()
+        subset_names = set()
+        version_numbers = set()
+        for instance in context:
+            if instance.data.get("asset"):
+                asset_names.add(instance.data["asset"])
+            if instance.data.get("subset"):
+                subset_names.add(instance.data["subset"])
+            if instance.data.get("version") is not None:
+                version_numbers.add(instance.data["version"])
+
+        project_entity = context.data["projectEntity"]
+        assets = {}
+        if asset_names:
+            for asset in io.find({
+                "type": "asset",
+                "name": {"$in": list(asset_names)},
+                "parent": project_entity["_id"]
+            }):
+                assets[asset["name"]] = asset
+
+        subsets = {}
+        if assets and subset_names:
+            for subset in io.find({
+                "type": "subset",
+                "parent": {"$in": [asset["_id"] for asset in assets.values()]},
+                "name": {"$in": list(subset_names)}
+            }):
+                subsets[(subset["parent"], subset["name"])] = subset
+
+        versions = {}
+        if subsets and version_numbers:
+            for version in io.find({
+                "type": "version",
+                "parent": {
+                    "$in": [subset["_id"] for subset in subsets.values()]
+                },
+                "name": {"$in": list(version_numbers)}
+            }):
+                versions[(version["parent"], version["name"])] = version
+
+        representations = collections.defaultdict(list)
+        if versions:
+            for repre in io.find({
+                "type": {"$in": [
+                    "representation", "archived_representation"
+                ]},
+                "parent": {
+                    "$in": [version["_id"] for version in versions.values()]
+                }
+            }):
+                representations[repre["parent"]].append(repre)
+
+        self.log.debug((
+            "Prefetched {} assets, {} subsets and {} versions for context."
+        ).format(len(assets), len(subsets), len(versions)))
+
+        context_docs = {
+            "assets": assets,
+            "subsets": subsets,
+            "versions": versions,
+            "representations": representations
+        }
+        context.data[self.context_docs_key] = context_docs
+        return context_docs
+
+    def commit_bulk_writes(self):
+        """Write all collected changes to database in one ordered batch."""
+        if not self.bulk_writes:
+            return
+
+        io._database[io.Session["AVALON_PROJECT"]].bulk_write(
+            self.bulk_writes, ordered=True
+        )
+        self.log.debug(
+            "Stored {} database changes.".format(len(self.bulk_writes))
+        )
+        self.bulk_writes = []
+
+    def get_subset(self, asset, instance, context_docs):
         subset_name = instance.data["subset"]
-        subset = io.find_one({
-            "type": "subset",
-            "parent": asset["_id"],
-            "name": subset_name
-        })
+        subset = context_docs["subsets"].get((asset["_id"], subset_name))
 
+        subset_group = instance.data.get("subsetGroup")
         if subset is None:
             self.log.info("Subset '%s' not found, creating ..." % subset_name)
             self.log.debug("families.  %s" % instance.data.get('families'))
             self.log.debug(
                 "families.  %s" % type(instance.data.get('families')))
 
-            _id = io.insert_one({
+            subset = {
+                "_id": io.ObjectId(),
                 "schema": "pype:subset-3.0",
                 "type": "subset",
                 "name": subset_name,
@@ -669,18 +823,19 @@ class IntegrateAssetNew(pyblish.api.InstancePlugin):
                     "families": instance.data.get("families", [])
                 },
                 "parent": asset["_id"]
-            }).inserted_id
-
-            subset = io.find_one({"_id": _id})
+            }
+            # add group if available
+            if subset_group:
+                subset["data"]["subsetGroup"] = subset_group
+            self.bulk_writes.append(InsertOne(subset))
 
         # add group if available
-        if instance.data.get("subsetGroup"):
-            io.update_many({
-                'type': 'subset',
-                '_id': io.ObjectId(subset["_id"])
-            }, {'$set': {'data.subsetGroup':
-                instance.data.get('subsetGroup')}}
-            )
+        elif subset_group:
+            self.bulk_writes.append(UpdateOne(
+                {"_id": subset["_id"]},
+                {"$set": {"data.subsetGroup": subset_group}}
+            ))
+            subset.setdefault("data", {})["subsetGroup"] = subset_group
 
         return subset
 
@@ -879,7 +1034,16 @@ class IntegrateAssetNew(pyblish.api.InstancePlugin):
         for _src, dest in resources:
             path = self.get_rootless_path(anatomy, dest)
             dest = self.get_dest_temp_url(dest)
-            file_hash = pype.api.source_hash(dest)
+            content_hash = None
+            if self.content_store is not None:
+                content_hash = self.content_store.hashes.get(
+                    os.path.normpath(dest)
+                )
+
+            if content_hash:
+                file_hash = self.content_store.format_hash(content_hash)
+            else:
+                file_hash = pype.api.source_hash(dest)
             if self.TMP_FILE_EXT and \
                ',{}'.format(self.TMP_FILE_EXT) in file_hash:
                 file_hash = file_hash.replace(',{}'.format(self.TMP_FILE_EXT),
@@ -971,6 +1135,14 @@ class IntegrateAssetNew(pyblish.api.InstancePlugin):
                             file_url
                         )
 
+                        # Published file may be linked to a blob in
+                        # content store so it must not be overwritten
+                        if (
+                            os.path.exists(new_name)
+                            and os.stat(new_name).st_nlink > 1
+                        ):
+                            os.remove(new_name)
+
                         if os.path.exists(new_name):
                             self.log.debug(
                                 "Overwriting file {} to {}".format(
@@ -10,6 +10,7 @@ from avalon import api, io
 from avalon.vendor import requests, clique
 
 import pyblish.api
+from pype.lib import FileTransfer
 
 
 def _get_script(path):
@@ -62,6 +63,10 @@ def get_latest_version(asset_name, subset_name, family):
         "name": True,
         "data.startFrame": True,
         "data.endFrame": True,
+        "data.frameStart": True,
+        "data.frameEnd": True,
+        "data.handleStart": True,
+        "data.handleEnd": True,
         "parent": True,
     }
 
@@ -97,6 +102,120 @@ def get_resources(version, extension=None):
     return resources
 
 
+def get_published_frames(version, representation, first_file):
+    """Get published frames of sequence representation from its metadata.
+
+    Frames are computed from frame range of version and filtered by file
+    names stored in representation's "files" so published directory doesn't
+    have to be listed. Directory is listed only for representations
+    published without "files" information.
+
+    Arguments:
+        version (dict): Version document.
+        representation (dict): Representation document.
+        first_file (str): Path to first published file of sequence.
+
+    Returns:
+        list of int: Sorted published frames.
+
+    """
+    version_data = version.get("data") or {}
+    frame_start = version_data.get("frameStart")
+    frame_end = version_data.get("frameEnd")
+    if frame_start is None or frame_end is None:
+        frame_start = version_data.get("startFrame")
+        frame_end = version_data.get("endFrame")
+    assert frame_start is not None and frame_end is not None, (
+        "Version doesn't have frame range stored"
+    )
+    frame_start = int(frame_start) - int(version_data.get("handleStart") or 0)
+    frame_end = int(frame_end) + int(version_data.get("handleEnd") or 0)
+
+    repre_files = representation.get("files") or []
+    if repre_files:
+        filenames = set(
+            os.path.basename(file_info["path"]) for file_info in repre_files
+        )
+    else:
+        filenames = set(os.listdir(os.path.dirname(first_file)))
+
+    head, padding, tail = split_frame_filename(os.path.basename(first_file))
+    return [
+        frame
+        for frame in range(frame_start, frame_end + 1)
+        if format_frame_filename(head, frame, padding, tail) in filenames
+    ]
+
+
+def split_frame_filename(filename):
+    """Split file name of a frame to head, frame padding and tail."""
+    match = ProcessSubmittedJobOnFarm.R_FRAME_NUMBER.search(filename)
+    assert match is not None, "padding string wasn't found"
+    return (
+        filename[:match.start("frame")],
+        len(match.group("frame")),
+        filename[match.end("frame"):]
+    )
+
+
+def format_frame_filename(head, frame, padding, tail):
+    return "{}{:0>{}}{}".format(head, frame, padding, tail)
+
+
+def get_frame_ranges(frames):
+    """Collapse frames to list of continuous (start, end) ranges.
+
+    Example:
+        >>> get_frame_ranges([1, 2, 3, 7, 9, 10])
+        [(1, 3), (7, 7), (9, 10)]
+
+    """
+    ranges = []
+    for frame in sorted(frames):
+        if ranges and ranges[-1][1] + 1 == frame:
+            ranges[-1][1] = frame
+        else:
+            ranges.append([frame, frame])
+    return [tuple(frame_range) for frame_range in ranges]
+
+
+def plan_extend_frames(published_frames, render_start, render_end, override):
+    """Plan which published frames are transferred to render directory.
+
+    Frames in rendered range are always copied because renderer writes to
+    them and writing to a hardlink would change published file. Frames
+    outside of rendered range can be hardlinked.
+
+    Arguments:
+        published_frames (list): Frames available in published version.
+        render_start (int): First rendered frame.
+        render_end (int): Last rendered frame.
+        override (bool): Rendered frames should not be transferred.
+
+    Returns:
+        (list, list): Ranges of frames outside and inside of rendered
+            range.
+
+    """
+    outside = []
+    inside = []
+    for frame in published_frames:
+        if render_start <= frame <= render_end:
+            if not override:
+                inside.append(frame)
+        else:
+            outside.append(frame)
+    return get_frame_ranges(outside), get_frame_ranges(inside)
+
+
+def is_same_volume(path_a, path_b):
+    """Paths are on the same device so they can be hardlinked."""
+    try:
+        return os.stat(path_a).st_dev == os.stat(path_b).st_dev
+    except OSError:
+        return False
+
+
 def get_resource_files(resources, frame_range=None):
     """Get resource files at given path.
 
@@ -206,6 +325,9 @@ class ProcessSubmittedJobOnFarm(pyblish.api.InstancePlugin):
     # poor man exclusion
     skip_integration_repre_list = []
 
+    # number of files copied at once when extending frames
+    extend_frames_workers = 8
+
     def _create_metadata_path(self, instance):
         ins_data = instance.data
         # Ensure output dir exists
@@ -332,73 +454,91 @@ class ProcessSubmittedJobOnFarm(pyblish.api.InstancePlugin):
         This will copy all existing frames from subset's latest version back
         to render directory and rename them to what renderer is expecting.
 
+        Published frames are resolved from version and representation
+        documents, only ranges missing in render are transferred. Frames
+        outside of rendered range are hardlinked when published files are
+        on the same volume, other frames are copied in parallel.
+
         Arguments:
-            instance (pyblish.plugin.Instance): instance to get required
-                data from
+            instance (dict): instance data to get required data from
             representation (dict): presentation to operate on
 
         """
         import speedcopy
 
         self.log.info("Preparing to copy ...")
-        start = instance.data.get("startFrame")
-        end = instance.data.get("endFrame")
+        start = int(instance.get("frameStartHandle"))
+        end = int(instance.get("frameEndHandle"))
 
         # get latest version of subset
         # this will stop if subset wasn't published yet
         version = get_latest_version(
-            instance.data.get("asset"),
-            instance.data.get("subset"), "render")
-        # get its files based on extension
-        subset_resources = get_resources(version, representation.get("ext"))
-        r_col, _ = clique.assemble(subset_resources)
-
-        # if override remove all frames we are expecting to be rendered
-        # so we'll copy only those missing from current render
-        if instance.data.get("overrideExistingFrame"):
-            for frame in range(start, end + 1):
-                if frame not in r_col.indexes:
-                    continue
-                r_col.indexes.remove(frame)
+            instance.get("asset"),
+            instance.get("subset"), "render")
+
+        query = {"type": "representation", "parent": version["_id"]}
+        if representation.get("ext"):
+            query["name"] = representation["ext"]
+        published_repre = io.find_one(query)
+        assert published_repre, "This is a bug"
+
+        # path filled with context of representation is first frame
+        first_file = api.get_representation_path(published_repre)
+        published_frames = get_published_frames(
+            version, published_repre, first_file
+        )
+        outside_ranges, inside_ranges = plan_extend_frames(
+            published_frames, start, end,
+            instance.get("overrideExistingFrame")
+        )
+        self.log.debug("Frames to link: {}, frames to copy: {}".format(
+            outside_ranges, inside_ranges
+        ))
 
         # now we need to translate published names from represenation
         # back. This is tricky, right now we'll just use same naming
         # and only switch frame numbers
-        resource_files = []
-        r_filename = os.path.basename(
-            representation.get("files")[0])  # first file
-        op = re.search(self.R_FRAME_NUMBER, r_filename)
-        pre = r_filename[:op.start("frame")]
-        post = r_filename[op.end("frame"):]
-        assert op is not None, "padding string wasn't found"
-        for frame in list(r_col):
-            fn = re.search(self.R_FRAME_NUMBER, frame)
-            # silencing linter as we need to compare to True, not to
-            # type
-            assert fn is not None, "padding string wasn't found"
-            # list of tuples (source, destination)
-            staging = representation.get("stagingDir")
-            staging = self.anatomy.fill_roots(staging)
-            resource_files.append(
-                (frame,
-                 os.path.join(staging,
-                              "{}{}{}".format(pre,
-                                              fn.group("frame"),
-                                              post)))
-            )
+        r_filename = representation.get("files")
+        if isinstance(r_filename, (list, tuple)):
+            r_filename = r_filename[0]  # first file
+        pre, _, post = split_frame_filename(os.path.basename(r_filename))
+        src_dir = os.path.dirname(first_file)
+        src_head, padding, src_tail = split_frame_filename(
+            os.path.basename(first_file)
+        )
+        staging = self.anatomy.fill_roots(representation.get("stagingDir"))
 
-        # test if destination dir exists and create it if not
-        output_dir = os.path.dirname(representation.get("files")[0])
-        if not os.path.isdir(output_dir):
-            os.makedirs(output_dir)
+        if not os.path.isdir(staging):
+            os.makedirs(staging)
+        hardlink = is_same_volume(src_dir, staging)
 
-        # copy files
-        for source in resource_files:
-            speedcopy.copy(source[0], source[1])
-            self.log.info("  > {}".format(source[1]))
+        transfer = FileTransfer(
+            max_workers=self.extend_frames_workers,
+            copy_function=speedcopy.copy,
+            logger=self.log
+        )
+        for frame_ranges, allow_link in (
+            (outside_ranges, hardlink),
+            (inside_ranges, False)
+        ):
+            add_func = transfer.add_copy
+            if allow_link:
+                add_func = transfer.add_hardlink
+            for range_start, range_end in frame_ranges:
+                for frame in range(range_start, range_end + 1):
+                    add_func(
+                        os.path.join(src_dir, format_frame_filename(
+                            src_head, frame, padding, src_tail
+                        )),
+                        os.path.join(staging, format_frame_filename(
+                            pre, frame, padding, post
+                        ))
+                    )
 
+        transfer.process()
+        transfer.report()
         self.log.info(
-            "Finished copying %i files" % len(resource_files))
+            "Finished copying %i files" % len(transfer.transferred))
 
     def _create_instances_for_aov(self, instance_data, exp_files):
         """Create instance for each AOV found.
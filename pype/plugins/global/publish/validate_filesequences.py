@@ -7,6 +7,7 @@ class ValidateFileSequences(pyblish.api.ContextPlugin):
     order = pyblish.api.ValidatorOrder
     targets = ["filesequence"]
     label = "Validate File Sequences"
+    thread_safe = True
 
     def process(self, context):
         assert context, "Nothing collected."
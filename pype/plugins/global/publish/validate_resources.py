@@ -19,6 +19,7 @@ class ValidateResources(pyblish.api.InstancePlugin):
 
     order = pype.api.ValidateContentsOrder
     label = "Resources"
+    thread_safe = True
 
     def process(self, instance):
 
@@ -1,4 +1,5 @@
 import pyblish.api
+from pype.lib import FrameSequence, get_sequence_scanner
 
 
 class ValidateSequenceFrames(pyblish.api.InstancePlugin):
@@ -7,6 +8,11 @@ class ValidateSequenceFrames(pyblish.api.InstancePlugin):
     The files found in the folder are checked against the startFrame and
     endFrame of the instance. If the first or last file is not
     corresponding with the first or last frame it is flagged as invalid.
+    Empty files are flagged as invalid, files much smaller than other
+    frames are reported as possibly truncated.
+
+    Directory of the sequence is scanned once per publish with scanner
+    shared in context.
     """
 
     order = pyblish.api.ValidatorOrder
@@ -14,14 +20,23 @@ class ValidateSequenceFrames(pyblish.api.InstancePlugin):
     families = ["imagesequence"]
     hosts = ["shell"]
 
+    # Frame smaller than this ratio of median frame size is truncated
+    truncated_ratio = 0.5
+
     def process(self, instance):
 
         collection = instance[0]
         self.log.info(collection)
 
-        frames = list(collection.indexes)
+        scanner = get_sequence_scanner(instance.context)
+        sequence = scanner.find_sequence(
+            collection.format("{head}{padding}{tail}")
+        )
+        assert sequence is not None, (
+            "Sequence not found on disk: {}".format(collection)
+        )
 
-        current_range = (frames[0], frames[-1])
+        current_range = (sequence.start, sequence.end)
         required_range = (instance.data["frameStart"],
                           instance.data["frameEnd"])
 
@@ -30,5 +45,17 @@ class ValidateSequenceFrames(pyblish.api.InstancePlugin):
                              "expected: {1}".format(current_range,
                                                     required_range))
 
-        missing = collection.holes().indexes
-        assert not missing, "Missing frames: %s" % (missing,)
+        missing = sequence.missing()
+        assert not missing, (
+            "Missing frames: %s" % FrameSequence.format_ranges(missing)
+        )
+
+        zero_byte = sequence.zero_byte_frames()
+        assert not zero_byte, "Empty frames: %s" % (zero_byte,)
+
+        truncated = sequence.truncated_frames(self.truncated_ratio)
+        if truncated:
+            # Frames may be legitimately small (e.g. black frames)
+            self.log.warning(
+                "Possibly truncated frames: {}".format(truncated)
+            )
@@ -36,6 +36,7 @@ from avalon import api
 import pyblish.api
 
 from pype.hosts.maya import lib
+from pype.deadline import DeadlineRestClient
 
 # Documentation for keys available at:
 # https://docs.thinkboxsoftware.com
@@ -262,6 +263,8 @@ class MayaSubmitDeadline(pyblish.api.InstancePlugin):
 
     use_published = True
     tile_assembler_plugin = "PypeTileAssembler"
+    # number of jobs submitted to Deadline at once
+    submission_workers = 8
 
     def process(self, instance):
         """Plugin entry point."""
@@ -586,7 +589,12 @@ class MayaSubmitDeadline(pyblish.api.InstancePlugin):
             file_index = 1
             for file in files:
                 frame = re.search(R_FRAME_NUMBER, file).group("frame")
-                new_payload = copy.deepcopy(payload)
+                # only top level sections are modified per frame
+                new_payload = {
+                    "JobInfo": dict(payload["JobInfo"]),
+                    "PluginInfo": dict(payload["PluginInfo"]),
+                    "AuxFiles": list(payload["AuxFiles"])
+                }
                 new_payload["JobInfo"]["Name"] = \
                     "{} (Frame {} - {} tiles)".format(
                         payload["JobInfo"]["Name"],
@@ -620,7 +628,11 @@ class MayaSubmitDeadline(pyblish.api.InstancePlugin):
             file_index = 1
             for file in assembly_files:
                 frame = re.search(R_FRAME_NUMBER, file).group("frame")
-                new_assembly_payload = copy.deepcopy(assembly_payload)
+                new_assembly_payload = {
+                    "JobInfo": dict(assembly_payload["JobInfo"]),
+                    "PluginInfo": dict(assembly_payload["PluginInfo"]),
+                    "AuxFiles": list(assembly_payload["AuxFiles"])
+                }
                 new_assembly_payload["JobInfo"]["Name"] = \
                     "{} (Frame {})".format(
                         assembly_payload["JobInfo"]["Name"],
@@ -638,80 +650,79 @@ class MayaSubmitDeadline(pyblish.api.InstancePlugin):
             self.log.info(
                 "Submitting tile job(s) [{}] ...".format(len(frame_payloads)))
 
-            url = "{}/api/jobs".format(self._deadline_url)
-            tiles_count = instance.data.get("tilesX") * instance.data.get("tilesY")  # noqa: E501
+            with DeadlineRestClient(
+                self._deadline_url, max_workers=self.submission_workers
+            ) as client:
+                tiles_count = instance.data.get("tilesX") * instance.data.get("tilesY")  # noqa: E501
 
-            for tile_job in frame_payloads:
-                response = self._requests_post(url, json=tile_job)
-                if not response.ok:
-                    raise Exception(response.text)
-
-                job_id = response.json()["_id"]
-                hash = response.json()["Props"]["Ex0"]
+                tile_jobs = client.submit_jobs(frame_payloads)
 
+                # wire assembly jobs to tile jobs by returned job ids
+                job_ids_by_hash = {
+                    tile_payload["JobInfo"]["ExtraInfo0"]: tile_job["_id"]
+                    for tile_payload, tile_job in zip(
+                        frame_payloads, tile_jobs
+                    )
+                }
                 for assembly_job in assembly_payloads:
-                    if assembly_job["JobInfo"]["ExtraInfo0"] == hash:
-                        assembly_job["JobInfo"]["JobDependency0"] = job_id
+                    assembly_job["JobInfo"]["JobDependency0"] = \
+                        job_ids_by_hash[assembly_job["JobInfo"]["ExtraInfo0"]]
 
-            for assembly_job in assembly_payloads:
-                file = assembly_job["JobInfo"]["ExtraInfo1"]
                 # write assembly job config files
                 now = datetime.now()
-
-                config_file = os.path.join(
-                    os.path.dirname(output_filename_0),
-                    "{}_config_{}.txt".format(
-                        os.path.splitext(file)[0],
-                        now.strftime("%Y_%m_%d_%H_%M_%S")
+                created_dirs = set()
+                for assembly_job in assembly_payloads:
+                    file = assembly_job["JobInfo"]["ExtraInfo1"]
+
+                    config_file = os.path.join(
+                        os.path.dirname(output_filename_0),
+                        "{}_config_{}.txt".format(
+                            os.path.splitext(file)[0],
+                            now.strftime("%Y_%m_%d_%H_%M_%S")
+                        )
                     )
-                )
 
-                try:
-                    if not os.path.isdir(os.path.dirname(config_file)):
-                        os.makedirs(os.path.dirname(config_file))
-                except OSError:
-                    # directory is not available
-                    self.log.warning(
-                        "Path is unreachable: `{}`".format(
-                            os.path.dirname(config_file)))
-
-                # add config file as job auxFile
-                assembly_job["AuxFiles"] = [config_file]
-
-                with open(config_file, "w") as cf:
-                    print("TileCount={}".format(tiles_count), file=cf)
-                    print("ImageFileName={}".format(file), file=cf)
-                    print("ImageWidth={}".format(
-                        instance.data.get("resolutionWidth")), file=cf)
-                    print("ImageHeight={}".format(
-                        instance.data.get("resolutionHeight")), file=cf)
-
-                    tiles = _format_tiles(
-                        file, 0,
-                        instance.data.get("tilesX"),
-                        instance.data.get("tilesY"),
-                        instance.data.get("resolutionWidth"),
-                        instance.data.get("resolutionHeight"),
-                        payload["PluginInfo"]["OutputFilePrefix"]
-                    )[1]
-                    sorted(tiles)
-                    for k, v in tiles.items():
-                        print("{}={}".format(k, v), file=cf)
-
-            job_idx = 1
-            instance.data["assemblySubmissionJobs"] = []
-            for ass_job in assembly_payloads:
-                self.log.info("submitting assembly job {} of {}".format(
-                    job_idx, len(assembly_payloads)
+                    config_dir = os.path.dirname(config_file)
+                    if config_dir not in created_dirs:
+                        created_dirs.add(config_dir)
+                        try:
+                            if not os.path.isdir(config_dir):
+                                os.makedirs(config_dir)
+                        except OSError:
+                            # directory is not available
+                            self.log.warning(
+                                "Path is unreachable: `{}`".format(config_dir))
+
+                    # add config file as job auxFile
+                    assembly_job["AuxFiles"] = [config_file]
+
+                    with open(config_file, "w") as cf:
+                        print("TileCount={}".format(tiles_count), file=cf)
+                        print("ImageFileName={}".format(file), file=cf)
+                        print("ImageWidth={}".format(
+                            instance.data.get("resolutionWidth")), file=cf)
+                        print("ImageHeight={}".format(
+                            instance.data.get("resolutionHeight")), file=cf)
+
+                        tiles = _format_tiles(
+                            file, 0,
+                            instance.data.get("tilesX"),
+                            instance.data.get("tilesY"),
+                            instance.data.get("resolutionWidth"),
+                            instance.data.get("resolutionHeight"),
+                            payload["PluginInfo"]["OutputFilePrefix"]
+                        )[1]
+                        sorted(tiles)
+                        for k, v in tiles.items():
+                            print("{}={}".format(k, v), file=cf)
+
+                self.log.info("Submitting assembly job(s) [{}] ...".format(
+                    len(assembly_payloads)
                 ))
-                self.log.debug(json.dumps(ass_job, indent=4, sort_keys=True))
-                response = self._requests_post(url, json=ass_job)
-                if not response.ok:
-                    raise Exception(response.text)
-
-                instance.data["assemblySubmissionJobs"].append(
-                    response.json()["_id"])
-                job_idx += 1
+                assembly_jobs = client.submit_jobs(assembly_payloads)
+                instance.data["assemblySubmissionJobs"] = [
+                    assembly_job["_id"] for assembly_job in assembly_jobs
+                ]
 
             instance.data["jobBatchName"] = payload["JobInfo"]["BatchName"]
             self.log.info("Setting batch name on instance: {}".format(
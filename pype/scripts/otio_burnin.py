@@ -3,6 +3,7 @@ import sys
 import re
 import subprocess
 import json
+import copy
 import opentimelineio_contrib.adapters.ffmpeg_burnins as ffmpeg_burnins
 from pype.api import Logger, config
 import pype.lib
@@ -11,17 +12,12 @@ log = Logger().get_logger("BurninWrapper", "burninwrap")
 
 
 ffmpeg_path = pype.lib.get_ffmpeg_tool_path("ffmpeg")
-ffprobe_path = pype.lib.get_ffmpeg_tool_path("ffprobe")
 
 
 FFMPEG = (
     '{} -loglevel panic -i %(input)s %(filters)s %(args)s%(output)s'
 ).format(ffmpeg_path)
 
-FFPROBE = (
-    '{} -v quiet -print_format json -show_format -show_streams "%(source)s"'
-).format(ffprobe_path)
-
 DRAWTEXT = (
     "drawtext=text=\\'%(text)s\\':x=%(x)s:y=%(y)s:fontcolor="
     "%(color)s@%(opacity).1f:fontsize=%(size)d:fontfile='%(font)s'"
@@ -41,15 +37,13 @@ SOURCE_TIMECODE_KEY = "{source_timecode}"
 
 def _streams(source):
     """Reimplemented from otio burnins to be able use full path to ffprobe
+
+    Uses ffprobe cache of `pype.lib` so source already probed by publish
+    plugins is not probed again.
     :param str source: source media file
     :rtype: [{}, ...]
     """
-    command = FFPROBE % {'source': source}
-    proc = subprocess.Popen(command, shell=True, stdout=subprocess.PIPE)
-    out = proc.communicate()[0]
-    if proc.returncode != 0:
-        raise RuntimeError("Failed to run: %s" % command)
-    return json.loads(out)['streams']
+    return pype.lib.ffprobe_streams(source)
 
 
 def get_fps(str_value):
@@ -128,6 +122,9 @@ class ModifiedBurnins(ffmpeg_burnins.Burnins):
 
         super().__init__(source, streams)
 
+        # Copy class defaults so burnins created in one process don't
+        # affect each other
+        self.options_init = dict(self.options_init)
         if options_init:
             self.options_init.update(options_init)
 
@@ -393,13 +390,67 @@ def burnins_from_data(
     }
     """
 
+    burnin = prepare_burnins(input_path, data, options, burnin_values)
+
+    ffmpeg_args = []
+    if codec_data:
+        # Use codec definition from method arguments
+        ffmpeg_args = codec_data
+
+    else:
+        codec_name = burnin._streams[0].get("codec_name")
+        if codec_name:
+            ffmpeg_args.append("-codec:v {}".format(codec_name))
+
+        profile_name = burnin._streams[0].get("profile")
+        if profile_name:
+            # lower profile name and repalce spaces with underscore
+            profile_name = profile_name.replace(" ", "_").lower()
+            ffmpeg_args.append("-profile:v {}".format(profile_name))
+
+        bit_rate = burnin._streams[0].get("bit_rate")
+        if bit_rate:
+            ffmpeg_args.append("-b:v {}".format(bit_rate))
+
+        pix_fmt = burnin._streams[0].get("pix_fmt")
+        if pix_fmt:
+            ffmpeg_args.append("-pix_fmt {}".format(pix_fmt))
+
+    # Use group one (same as `-intra` argument, which is deprecated)
+    ffmpeg_args.append("-g 1")
+
+    ffmpeg_args_str = " ".join(ffmpeg_args)
+    burnin.render(
+        output_path, args=ffmpeg_args_str, overwrite=overwrite, **data
+    )
+
+
+def prepare_burnins(
+    input_path, data, options=None, burnin_values=None, streams=None
+):
+    """Create burnins object with all texts from presets added.
+
+    Args:
+        input_path (str): Full path to input file. May be `None` when
+            `streams` are entered.
+        data (dict): Data required for burnin settings (more info in
+            `burnins_from_data`).
+        options (dict): Options for burnins.
+        burnin_values (dict): Contain positioned values.
+        streams (list): Streams of input. Input is probed when not entered.
+            Resolution and frame rate of first video stream are used to
+            place texts.
+
+    Returns:
+        ModifiedBurnins: Burnins with filled drawtext filters.
+    """
     # Use legacy processing when options are not set
     if options is None or burnin_values is None:
         presets = config.get_presets().get("tools", {}).get("burnins", {})
         options = presets.get("options")
         burnin_values = presets.get("burnins") or {}
 
-    burnin = ModifiedBurnins(input_path, options_init=options)
+    burnin = ModifiedBurnins(input_path, streams, options_init=options)
 
     frame_start = data.get("frame_start")
     frame_end = data.get("frame_end")
@@ -508,41 +559,108 @@ def burnins_from_data(
         text = value.format(**data)
         burnin.add_text(text, align, frame_start, frame_end)
 
-    ffmpeg_args = []
-    if codec_data:
-        # Use codec definition from method arguments
-        ffmpeg_args = codec_data
+    return burnin
 
-    else:
-        codec_name = burnin._streams[0].get("codec_name")
-        if codec_name:
-            ffmpeg_args.append("-codec:v {}".format(codec_name))
 
-        profile_name = burnin._streams[0].get("profile")
-        if profile_name:
-            # lower profile name and repalce spaces with underscore
-            profile_name = profile_name.replace(" ", "_").lower()
-            ffmpeg_args.append("-profile:v {}".format(profile_name))
+def burnin_filter_string(
+    data, options=None, burnin_values=None, streams=None, input_path=None
+):
+    """Drawtext filter chain of burnins defined by presets.
 
-        bit_rate = burnin._streams[0].get("bit_rate")
-        if bit_rate:
-            ffmpeg_args.append("-b:v {}".format(bit_rate))
+    Filter chain can be appended to video filters of other ffmpeg command
+    so burnins are rendered without additional transcode.
 
-        pix_fmt = burnin._streams[0].get("pix_fmt")
-        if pix_fmt:
-            ffmpeg_args.append("-pix_fmt {}".format(pix_fmt))
+    Args:
+        data (dict): Data required for burnin settings.
+        options (dict): Options for burnins.
+        burnin_values (dict): Contain positioned values.
+        streams (list): Streams describing output of filters before burnins
+            (resolution and frame rate). Input is probed when not entered.
+        input_path (str): Full path to input file. Required only when
+            `streams` are not entered.
 
-    # Use group one (same as `-intra` argument, which is deprecated)
-    ffmpeg_args.append("-g 1")
+    Returns:
+        str: Comma separated drawtext filters.
+    """
+    burnin = prepare_burnins(
+        input_path, data, options, burnin_values, streams
+    )
+    return burnin.filter_string
 
-    ffmpeg_args_str = " ".join(ffmpeg_args)
-    burnin.render(
-        output_path, args=ffmpeg_args_str, overwrite=overwrite, **data
+
+def burnins_to_review_encode(
+    review_encode, output_path, data, options=None, burnin_values=None
+):
+    """Render review output with burnins in one ffmpeg process.
+
+    Burnin filters are appended to video filters of review encode prepared
+    by ExtractReview so the review is encoded from it's source only once.
+
+    Args:
+        review_encode (dict): Prepared review encode. Contain ffmpeg
+            "input_args", "video_filters", "audio_filters", "output_args"
+            (last item is output path) and "stream" describing output
+            resolution and frame rate.
+        output_path (str): Full path to output file.
+        data (dict): Data required for burnin settings.
+        options (dict): Options for burnins.
+        burnin_values (dict): Contain positioned values.
+    """
+    filter_string = burnin_filter_string(
+        data, options, burnin_values, streams=[review_encode["stream"]]
     )
 
+    video_filters = list(review_encode["video_filters"])
+    if filter_string:
+        video_filters.append(filter_string)
+
+    args = [ffmpeg_path]
+    args.extend(review_encode["input_args"])
+    if video_filters:
+        args.append("-filter:v \"{}\"".format(",".join(video_filters)))
+
+    if review_encode["audio_filters"]:
+        args.append("-filter:a {}".format(
+            ",".join(review_encode["audio_filters"])
+        ))
+
+    # Replace output path of review with burnin output
+    args.extend(review_encode["output_args"][:-1])
+    args.append("\"{}\"".format(output_path))
+
+    command = " ".join(args)
+    log.info("Launching command: {}".format(command))
+
+    proc = subprocess.Popen(command, shell=True)
+    proc.communicate()
+    if proc.returncode != 0:
+        raise RuntimeError(
+            "Failed to render '{}': {}'".format(output_path, command)
+        )
+
+
+def process_script_data(in_data):
+    """Render burnins described by data prepared by ExtractBurnin.
+
+    Same data are passed to this script as json string when is launched
+    as subprocess so burnins can be rendered in-process or in subprocess
+    with the same result. Entered data are not modified.
+
+    Args:
+        in_data (dict): Contain "input", "output", "burnin_data" and
+            optionally "codec", "options", "values" and "review_encode".
+    """
+    in_data = copy.deepcopy(in_data)
+    if in_data.get("review_encode"):
+        burnins_to_review_encode(
+            in_data["review_encode"],
+            in_data["output"],
+            in_data["burnin_data"],
+            options=in_data.get("options"),
+            burnin_values=in_data.get("values")
+        )
+        return
 
-if __name__ == "__main__":
-    in_data = json.loads(sys.argv[-1])
     burnins_from_data(
         in_data["input"],
         in_data["output"],
@@ -551,3 +669,7 @@ if __name__ == "__main__":
         options=in_data.get("options"),
         burnin_values=in_data.get("values")
     )
+
+
+if __name__ == "__main__":
+    process_script_data(json.loads(sys.argv[-1]))
@@ -13,9 +13,10 @@ from .items import (
 )
 
 try:
-    from pype.api.config import get_presets
+    from pype.settings import get_presets, thaw
 except Exception:
     get_presets = dict
+    thaw = dict
 
 log = logging.getLogger(__name__)
 
@@ -53,6 +54,8 @@ def create_slates(
                     slate_name
                 )
             )
+        # Presets are cached and shared
+        slate_data = thaw(slate_data)
 
     missing_keys = []
     for key in RequiredSlateKeys:
@@ -1,9 +1,15 @@
 from .lib import (
     system_settings,
-    project_settings
+    project_settings,
+    get_presets,
+    reset_settings_cache,
+    thaw
 )
 
 __all__ = (
     "system_settings",
-    "project_settings"
+    "project_settings",
+    "get_presets",
+    "reset_settings_cache",
+    "thaw"
 )
@@ -1,7 +1,17 @@
 import os
+import re
 import json
+import time
+import uuid
+import hashlib
+import tempfile
 import logging
+import threading
 import copy
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
 
 log = logging.getLogger(__name__)
 
@@ -38,6 +48,20 @@ DEFAULTS_DIR = os.path.join(os.path.dirname(__file__), "defaults")
 # Variable where cache of default settings are stored
 _DEFAULT_SETTINGS = None
 
+# Snapshot of merged default settings, can be changed with
+# `PYPE_SETTINGS_SNAPSHOT_PATH` environment variable (empty string disables
+# the snapshot)
+DEFAULTS_SNAPSHOT_PATH = os.environ.get("PYPE_SETTINGS_SNAPSHOT_PATH")
+if DEFAULTS_SNAPSHOT_PATH is None:
+    DEFAULTS_SNAPSHOT_PATH = os.path.join(
+        tempfile.gettempdir(), "pype_settings_defaults.json"
+    )
+
+# Trailing comma before closing bracket, strings are matched to be skipped
+_TRAILING_COMMA_REGEX = re.compile(
+    r'("(?:\\.|[^"\\])*")|,(\s*[\]}])'
+)
+
 
 def reset_default_settings():
     global _DEFAULT_SETTINGS
@@ -47,61 +71,258 @@ def reset_default_settings():
 def default_settings():
     global _DEFAULT_SETTINGS
     if _DEFAULT_SETTINGS is None:
-        _DEFAULT_SETTINGS = load_jsons_from_dir(DEFAULTS_DIR)
+        _DEFAULT_SETTINGS = load_defaults_snapshot(DEFAULTS_DIR)
     return _DEFAULT_SETTINGS
 
 
-def load_json(fpath):
-    # Load json data
-    with open(fpath, "r") as opened_file:
-        lines = opened_file.read().splitlines()
+def tree_hash(path):
+    """Hash of relative paths, modification times and sizes of json files."""
+    hash_obj = hashlib.sha1()
+    base_len = len(path) + 1
+    for base, directories, filenames in os.walk(path):
+        directories.sort()
+        for filename in sorted(filenames):
+            if not filename.endswith(".json"):
+                continue
+            full_path = os.path.join(base, filename)
+            stat = os.stat(full_path)
+            hash_obj.update("{}|{}|{}\n".format(
+                full_path[base_len:], stat.st_mtime, stat.st_size
+            ).encode("utf-8"))
+    return hash_obj.hexdigest()
+
+
+def load_defaults_snapshot(path, snapshot_path=None):
+    """Merged json files from directory loaded from compiled snapshot.
+
+    Snapshot is single json file with merged content of all files in the
+    directory and hash of the directory tree. Files are loaded and the
+    snapshot is created again when any of files changes.
+    """
+    if snapshot_path is None:
+        snapshot_path = DEFAULTS_SNAPSHOT_PATH
+
+    if not snapshot_path:
+        return load_jsons_from_dir(path)
+
+    path = os.path.normpath(path)
+    current_hash = tree_hash(path)
+    try:
+        with open(snapshot_path, "r") as stream:
+            snapshot = json.load(stream)
+        if (
+            snapshot.get("path") == path
+            and snapshot.get("hash") == current_hash
+        ):
+            return snapshot["data"]
+
+    except (IOError, OSError, ValueError, KeyError):
+        pass
+
+    data = load_jsons_from_dir(path)
+    try:
+        # Write to temporary file first so other processes never read
+        # incomplete file
+        tmp_path = "{}.{}.tmp".format(snapshot_path, uuid.uuid4().hex)
+        with open(tmp_path, "w") as stream:
+            json.dump(
+                {"path": path, "hash": current_hash, "data": data}, stream
+            )
+        if os.path.exists(snapshot_path):
+            os.remove(snapshot_path)
+        os.rename(tmp_path, snapshot_path)
+
+    except (IOError, OSError):
+        log.debug("Failed to store settings snapshot.", exc_info=True)
+    return data
+
+
+class SettingsView(Mapping):
+    """Read only view of loaded settings.
+
+    Nested dictionaries are returned as views and lists as tuples so cached
+    values can be shared without deep copies. Use `thaw` to get mutable
+    copy of a value.
+    """
+
+    __slots__ = ("_data", )
+
+    def __init__(self, data):
+        self._data = data
 
-    # prepare json string
-    standard_json = ""
-    for line in lines:
-        # Remove all whitespace on both sides
-        line = line.strip()
+    def __getitem__(self, key):
+        return freeze(self._data[key])
 
-        # Skip blank lines
-        if len(line) == 0:
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __repr__(self):
+        return "<SettingsView {}>".format(self._data)
+
+    def to_dict(self):
+        return copy.deepcopy(self._data)
+
+
+def freeze(value):
+    """Read only representation of loaded value."""
+    if isinstance(value, dict):
+        return SettingsView(value)
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def thaw(value):
+    """Mutable deep copy of value returned from settings cache."""
+    if isinstance(value, SettingsView):
+        return value.to_dict()
+    if isinstance(value, (list, tuple)):
+        return [thaw(item) for item in value]
+    return copy.deepcopy(value)
+
+
+def files_signature(paths):
+    """Modification times and sizes of files or json files in directories.
+
+    Used to find out if cached values loaded from the paths are outdated.
+    """
+    signature = []
+    for path in paths:
+        if not path:
             continue
 
-        standard_json += line
+        if os.path.isdir(path):
+            for base, _directories, filenames in os.walk(path):
+                for filename in filenames:
+                    if filename.endswith(".json"):
+                        signature.append(
+                            _file_signature(os.path.join(base, filename))
+                        )
+        else:
+            signature.append(_file_signature(path))
+    return tuple(sorted(signature))
 
-    # Check if has extra commas
-    extra_comma = False
-    if ",]" in standard_json or ",}" in standard_json:
-        extra_comma = True
-    standard_json = standard_json.replace(",]", "]")
-    standard_json = standard_json.replace(",}", "}")
 
-    if extra_comma:
-        log.error("Extra comma in json file: \"{}\"".format(fpath))
+def _file_signature(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return (path, None, None)
+    return (path, stat.st_mtime, stat.st_size)
+
+
+class SettingsCache(object):
+    """Memory cache of values loaded from json files.
+
+    Value is loaded again only when any of its source files is changed,
+    added or removed. Files are checked at most once per `check_interval`
+    seconds so values can be requested inside loops (e.g. per event or
+    entity) without touching disk.
+    """
+
+    check_interval = 2.0
+
+    def __init__(self):
+        self._items = {}
+        self._lock = threading.Lock()
+
+    def get(self, key, paths, loader):
+        """Cached value or value returned by `loader`.
+
+        Args:
+            key (tuple): Key of value. Second item is project name, used
+                for invalidation of project values.
+            paths (list): Files or directories value is loaded from.
+            loader (callable): Function loading the value.
+        """
+        now = time.time()
+        item = self._items.get(key)
+        if item is not None and now - item["checked"] < self.check_interval:
+            return item["value"]
+
+        signature = files_signature(paths)
+        if item is not None and item["signature"] == signature:
+            item["checked"] = now
+            return item["value"]
+
+        value = loader()
+        with self._lock:
+            self._items[key] = {
+                "signature": signature,
+                "value": value,
+                "checked": now
+            }
+        return value
+
+    def invalidate(self, project_name=None):
+        """Remove cached values of project or all values."""
+        with self._lock:
+            if project_name is None:
+                self._items.clear()
+                return
+
+            for key in tuple(self._items.keys()):
+                if key[1] == project_name:
+                    self._items.pop(key)
+
+
+_SETTINGS_CACHE = SettingsCache()
+
+
+def reset_settings_cache(project_name=None):
+    """Force reload of cached settings and presets."""
+    _SETTINGS_CACHE.invalidate(project_name)
+
+
+def _remove_trailing_commas(content):
+    def _replace(match):
+        if match.group(1):
+            return match.group(1)
+        return match.group(2)
+    return _TRAILING_COMMA_REGEX.sub(_replace, content)
+
+
+def load_json(fpath):
+    """Load json file.
+
+    Trailing commas before closing brackets are tolerated but reported.
+
+    Returns:
+        dict: Loaded data or empty dictionary if file is empty or invalid.
+    """
+    # Load json data
+    with open(fpath, "r") as opened_file:
+        content = opened_file.read()
 
     # return empty dict if file is empty
-    if standard_json == "":
+    if not content.strip():
         return {}
 
-    # Try to parse string
     try:
-        return json.loads(standard_json)
+        return json.loads(content)
+    except ValueError:
+        pass
 
-    except json.decoder.JSONDecodeError:
-        # Return empty dict if it is first time that decode error happened
-        return {}
+    # Tolerant mode
+    fixed_content = _remove_trailing_commas(content)
+    if fixed_content != content:
+        log.error("Extra comma in json file: \"{}\"".format(fpath))
+        try:
+            return json.loads(fixed_content)
+        except ValueError:
+            pass
 
-    # Repreduce the exact same exception but traceback contains better
-    # information about position of error in the loaded json
+    # Traceback contains information about position of error in the file
     try:
-        with open(fpath, "r") as opened_file:
-            json.load(opened_file)
-
-    except json.decoder.JSONDecodeError:
+        json.loads(fixed_content)
+    except ValueError:
         log.warning(
             "File has invalid json format \"{}\"".format(fpath),
             exc_info=True
         )
-
     return {}
 
 
@@ -241,13 +462,13 @@ def apply_overrides(source_data, override_data):
     return merge_overrides(_source_data, override_data)
 
 
-def system_settings():
+def _system_settings():
     default_values = default_settings()[SYSTEM_SETTINGS_KEY]
     studio_values = studio_system_settings()
     return apply_overrides(default_values, studio_values)
 
 
-def project_settings(project_name):
+def _project_settings(project_name):
     default_values = default_settings()[PROJECT_SETTINGS_KEY]
     studio_values = studio_project_settings()
 
@@ -256,3 +477,65 @@ def project_settings(project_name):
     project_overrides = project_settings_overrides(project_name)
 
     return apply_overrides(studio_overrides, project_overrides)
+
+
+def system_settings():
+    """System settings with studio overrides.
+
+    Returns:
+        SettingsView: Cached read only settings.
+    """
+    return _SETTINGS_CACHE.get(
+        (SYSTEM_SETTINGS_KEY, None),
+        [SYSTEM_SETTINGS_PATH],
+        lambda: SettingsView(_system_settings())
+    )
+
+
+def project_settings(project_name):
+    """Project settings with studio and project overrides.
+
+    Returns:
+        SettingsView: Cached read only settings.
+    """
+    paths = [PROJECT_SETTINGS_PATH]
+    if project_name:
+        paths.append(path_to_project_overrides(project_name))
+    return _SETTINGS_CACHE.get(
+        (PROJECT_SETTINGS_KEY, project_name),
+        paths,
+        lambda: SettingsView(_project_settings(project_name))
+    )
+
+
+def presets_paths(project_name=None):
+    """Directories presets of `pypeapp` are loaded from."""
+    paths = []
+    config_path = os.environ.get("PYPE_CONFIG")
+    if config_path:
+        paths.append(os.path.join(config_path, "presets"))
+    if project_name:
+        paths.append(os.path.join(STUDIO_OVERRIDES_PATH, project_name))
+    return paths
+
+
+def get_presets(project_name=None):
+    """Cached presets of current or passed project.
+
+    Replacement of `config.get_presets` for code which only reads presets
+    and calls it often. Presets are loaded again only when preset files
+    change.
+
+    Returns:
+        SettingsView: Cached read only presets.
+    """
+    from pypeapp import config
+
+    if project_name is None:
+        project_name = os.environ.get("AVALON_PROJECT")
+
+    return _SETTINGS_CACHE.get(
+        ("presets", project_name),
+        presets_paths(project_name),
+        lambda: SettingsView(config.get_presets(project=project_name))
+    )
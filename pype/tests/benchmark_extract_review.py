@@ -0,0 +1,113 @@
+"""Benchmark of single pass multi output encoding used by ExtractReview.
+
+Compares time of encoding outputs from synthetic image sequence with one
+ffmpeg process per output (default behavior of ExtractReview) and with one
+ffmpeg process using `split` filter (`single_pass_outputs` enabled). Both
+are encoded by `ExtractReview.process_output_jobs` so arguments are built
+by the plugin.
+
+Requires pyblish and ffmpeg available in PATH or path passed as first
+argument:
+    python benchmark_extract_review.py [ffmpeg_path] [frames]
+"""
+import os
+import sys
+import time
+import shutil
+import tempfile
+import subprocess
+
+import pyblish.plugin
+
+
+PUBLISH_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "plugins", "global", "publish"
+)
+
+# Output name, video filters and output arguments
+OUTPUTS = (
+    ("h264", ["scale=1920:1080"], ["-c:v libx264", "-pix_fmt yuv420p"]),
+    ("prores", [], ["-c:v prores_ks", "-profile:v 3"]),
+    ("small", ["scale=960:540"], ["-c:v libx264", "-pix_fmt yuv420p"])
+)
+
+
+def get_plugin(ffmpeg_path):
+    for plugin in pyblish.plugin.discover(paths=[PUBLISH_DIR]):
+        if plugin.__name__ == "ExtractReview":
+            extractor = plugin()
+            extractor.ffmpeg_path = ffmpeg_path
+            return extractor
+    raise RuntimeError("ExtractReview was not found in " + PUBLISH_DIR)
+
+
+def create_sequence(ffmpeg_path, dirpath, frames):
+    subprocess.check_call(
+        " ".join([
+            ffmpeg_path, "-y",
+            "-f lavfi",
+            "-i testsrc2=size=2048x1152:rate=24",
+            "-frames:v {}".format(frames),
+            "\"{}\"".format(os.path.join(dirpath, "input.%04d.png"))
+        ]),
+        shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+    )
+
+
+def output_jobs(dirpath, prefix):
+    """Output jobs as prepared by `ExtractReview.main_process`."""
+    jobs = []
+    for name, video_filters, output_args in OUTPUTS:
+        temp_data = {"output_ext_is_image": False}
+        ffmpeg_parts = {
+            "input_args": [
+                "-start_number 1",
+                "-framerate 24",
+                "-i \"{}\"".format(os.path.join(dirpath, "input.%04d.png"))
+            ],
+            "video_filters": list(video_filters),
+            "audio_filters": [],
+            "output_args": list(output_args) + [
+                "-shortest",
+                "-y",
+                "\"{}\"".format(
+                    os.path.join(dirpath, "{}_{}.mov".format(prefix, name))
+                )
+            ]
+        }
+        jobs.append(({"filename_suffix": name}, {}, temp_data, ffmpeg_parts))
+    return jobs
+
+
+def benchmark(extractor, dirpath, single_pass_outputs):
+    prefix = "single" if single_pass_outputs else "separate"
+    extractor.single_pass_outputs = single_pass_outputs
+    jobs = output_jobs(dirpath, prefix)
+    start = time.time()
+    extractor.process_output_jobs(jobs)
+    return time.time() - start
+
+
+def main(ffmpeg_path="ffmpeg", frames=100):
+    dirpath = tempfile.mkdtemp(prefix="pype_review_benchmark_")
+    try:
+        extractor = get_plugin(ffmpeg_path)
+        create_sequence(ffmpeg_path, dirpath, frames)
+        separate = benchmark(extractor, dirpath, False)
+        single = benchmark(extractor, dirpath, True)
+    finally:
+        shutil.rmtree(dirpath)
+
+    print("Frames: {}, outputs: {}".format(frames, len(OUTPUTS)))
+    print("Process per output: {:.2f}s".format(separate))
+    print("Single pass:        {:.2f}s".format(single))
+    print("Speedup:            {:.2f}x".format(separate / single))
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    main(
+        args[0] if args else "ffmpeg",
+        int(args[1]) if len(args) > 1 else 100
+    )
@@ -0,0 +1,89 @@
+"""Benchmark of pair scheduling in pyblish_pype Controller.
+
+Publishes mock context with many instances and plugins through Controller
+and measures wall time. Controller with `process_pairs_budget` set to 1
+yields to Qt event loop after every pair, default settings process pairs
+back-to-back until time budget is exhausted. Time spent only in fixed
+timers of previous scheduler (100ms + 10ms per pair) is printed for
+comparison.
+
+Requires Qt binding and pyblish:
+    python benchmark_pyblish_controller.py [instances] [plugins]
+"""
+import sys
+import time
+
+import pyblish.api
+from Qt import QtCore, QtWidgets
+
+from pype.tools.pyblish_pype import control, mock
+
+
+def create_plugins(instances_count, plugins_count):
+    class CollectMockInstances(pyblish.api.ContextPlugin):
+        order = pyblish.api.CollectorOrder
+
+        def process(self, context):
+            for idx in range(instances_count):
+                context.create_instance(
+                    "MockInstance{}".format(idx), families=["mockFamily"]
+                )
+
+    plugins = [mock.CollectComment, CollectMockInstances]
+    orders = (pyblish.api.ValidatorOrder, pyblish.api.ExtractorOrder)
+    for idx in range(plugins_count):
+        plugins.append(type(
+            "MockPlugin{}".format(idx),
+            (pyblish.api.InstancePlugin, ),
+            {
+                "order": orders[idx % len(orders)],
+                "families": ["mockFamily"],
+                "process": lambda self, instance: None
+            }
+        ))
+    return plugins
+
+
+def run_controller(pairs_budget=None):
+    controller = control.Controller()
+    if pairs_budget is not None:
+        controller.process_pairs_budget = pairs_budget
+
+    loop = QtCore.QEventLoop()
+    pairs = []
+    controller.was_processed.connect(pairs.append)
+    controller.was_finished.connect(loop.quit)
+    controller.was_stopped.connect(loop.quit)
+
+    start = time.time()
+    controller.reset()
+    loop.exec_()
+    controller.publish()
+    loop.exec_()
+    return time.time() - start, len(pairs)
+
+
+def main(instances_count=100, plugins_count=30):
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+    pyblish.api.deregister_all_plugins()
+    pyblish.api.deregister_all_paths()
+    for plugin in create_plugins(instances_count, plugins_count):
+        pyblish.api.register_plugin(plugin)
+
+    every_pair, pairs = run_controller(pairs_budget=1)
+    budgeted, _ = run_controller()
+    app.processEvents()
+
+    print("Pairs: {}".format(pairs))
+    print("Fixed timers of previous scheduler: {:.2f}s".format(pairs * 0.11))
+    print("Yield after every pair:             {:.2f}s".format(every_pair))
+    print("Time budget:                        {:.2f}s".format(budgeted))
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    main(
+        int(args[0]) if args else 100,
+        int(args[1]) if len(args) > 1 else 30
+    )
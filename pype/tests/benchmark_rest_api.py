@@ -0,0 +1,167 @@
+"""Benchmark of request routing and statics of tray Rest Api server.
+
+Registers many routes with dynamic keys and statics directory with one
+large file. First compares matching of request paths by compiled router with
+sequential matching of all registered routes (previous behavior). Then runs
+load test against `ThreadingSimpleServer` with concurrent clients requesting
+routes, whole static file and byte ranges of the file.
+
+Requires Qt binding (imported by rest api module):
+    python benchmark_rest_api.py [clients] [requests] [routes]
+"""
+import os
+import re
+import sys
+import time
+import shutil
+import tempfile
+import threading
+import http.client
+from multiprocessing.pool import ThreadPool
+
+from pype.modules.rest_api.lib import RestApiFactory, Handler, RestMethods
+from pype.modules.rest_api.rest_api import ThreadingSimpleServer
+
+
+STATIC_SIZE = 32 * 1024 * 1024
+
+
+def callback(request_info):
+    return dict(request_info.url_data)
+
+
+def register_routes(routes_count):
+    paths = []
+    for idx in range(routes_count):
+        url_prefix = "/prefix{}".format(idx % 10)
+        path = "/route{}/<project_name>/<asset_name>".format(idx)
+        RestApiFactory.register_route(
+            path, callback, url_prefix, ["get"], True
+        )
+        paths.append("{}/route{}/project/asset".format(url_prefix, idx))
+    return paths
+
+
+def sequential_match(rest_method, path):
+    url_prefixes = RestApiFactory.prepared_routes[rest_method]
+    for url_prefix, items in url_prefixes.items():
+        if url_prefix is not None and not path.startswith(url_prefix):
+            continue
+
+        for item in items:
+            regex = item["regex"]
+            if regex is None:
+                if path == item["fullpath"]:
+                    return item, None
+
+            else:
+                found = re.match(regex, path)
+                if found:
+                    return item, found.groupdict()
+    return None, None
+
+
+def benchmark_matching(paths, repeats=20):
+    router = RestApiFactory.router
+    results = []
+    for match_func in (sequential_match, router.match):
+        start = time.time()
+        for _ in range(repeats):
+            for path in paths:
+                match_func(RestMethods.GET, path)
+        results.append(time.time() - start)
+    return results
+
+
+def request(port, path, headers=None):
+    connection = http.client.HTTPConnection("127.0.0.1", port)
+    try:
+        connection.request("GET", path, headers=headers or {})
+        response = connection.getresponse()
+        size = len(response.read())
+        return response.status, size
+    finally:
+        connection.close()
+
+
+def load_test(port, clients, requests):
+    pool = ThreadPool(clients)
+    try:
+        start = time.time()
+        results = pool.starmap(request, requests, chunksize=1)
+        duration = time.time() - start
+    finally:
+        pool.close()
+        pool.join()
+
+    received = sum(size for _, size in results)
+    failed = len([status for status, _ in results if status >= 400])
+    return duration, received, failed
+
+
+def main(clients=8, requests_count=2000, routes_count=500):
+    dirpath = tempfile.mkdtemp(prefix="pype_rest_api_benchmark_")
+    with open(os.path.join(dirpath, "media.bin"), "wb") as file_obj:
+        file_obj.write(os.urandom(STATIC_SIZE))
+
+    paths = register_routes(routes_count)
+    RestApiFactory.register_statics(("/res", dirpath))
+    RestApiFactory.prepare_registered()
+
+    sequential, compiled = benchmark_matching(paths)
+    print("Routes: {}, matched paths: {}".format(routes_count, len(paths)))
+    print("Sequential matching: {:.3f}s".format(sequential))
+    print("Compiled router:     {:.3f}s".format(compiled))
+    print("Speedup:             {:.2f}x".format(sequential / compiled))
+
+    server = ThreadingSimpleServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    Handler.log_message = lambda *args: None
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    port = server.server_address[1]
+
+    tests = (
+        ("Routes", [
+            (port, paths[idx % len(paths)])
+            for idx in range(requests_count)
+        ]),
+        ("Whole static file", [
+            (port, "/res/media.bin")
+            for _ in range(max(clients, requests_count // 100))
+        ]),
+        ("Static byte ranges", [
+            (port, "/res/media.bin", {"Range": "bytes={}-{}".format(
+                offset, offset + 65535
+            )})
+            for offset in (
+                (idx * 65536) % STATIC_SIZE
+                for idx in range(requests_count)
+            )
+        ])
+    )
+    try:
+        print("Clients: {}".format(clients))
+        for label, requests in tests:
+            duration, received, failed = load_test(port, clients, requests)
+            print((
+                "{}: {} requests in {:.2f}s ({:.0f} req/s, {:.1f} MB/s,"
+                " failed {})"
+            ).format(
+                label, len(requests), duration, len(requests) / duration,
+                received / duration / (1024 * 1024), failed
+            ))
+    finally:
+        server.shutdown()
+        server.server_close()
+        shutil.rmtree(dirpath)
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    main(
+        int(args[0]) if args else 8,
+        int(args[1]) if len(args) > 1 else 2000,
+        int(args[2]) if len(args) > 2 else 500
+    )
@@ -0,0 +1,117 @@
+import json
+import threading
+
+from six.moves import BaseHTTPServer, socketserver
+
+from pype.deadline import DeadlineRestClient, DeadlineSubmissionError
+
+
+class StubDeadlineHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+    """Mimics `/api/jobs` endpoint of Deadline Web Service."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        length = int(self.headers["Content-Length"])
+        payload = json.loads(self.rfile.read(length).decode("utf-8"))
+        if self.path != "/api/jobs" or "JobInfo" not in payload:
+            self._respond(400, b"Invalid job")
+            return
+
+        server = self.server
+        with server.lock:
+            server.job_count += 1
+            job_id = "job_{}".format(server.job_count)
+            server.jobs[job_id] = payload
+
+        job = {
+            "_id": job_id,
+            "Props": {"Ex0": payload["JobInfo"].get("ExtraInfo0")}
+        }
+        self._respond(200, json.dumps(job).encode("utf-8"))
+
+    def _respond(self, status, body):
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class StubDeadlineServer(
+    socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer
+):
+    daemon_threads = True
+
+
+def _start_server():
+    server = StubDeadlineServer(("127.0.0.1", 0), StubDeadlineHandler)
+    server.lock = threading.Lock()
+    server.job_count = 0
+    server.jobs = {}
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    return server
+
+
+def test_submit_jobs_keeps_order_and_wires_dependencies():
+    server = _start_server()
+    url = "http://127.0.0.1:{}".format(server.server_address[1])
+    client = DeadlineRestClient(url, max_workers=4)
+    try:
+        tile_payloads = [
+            {"JobInfo": {"ExtraInfo0": str(frame)}, "AuxFiles": []}
+            for frame in range(20)
+        ]
+        tile_jobs = client.submit_jobs(tile_payloads)
+        assert len(server.jobs) == 20
+        for payload, job in zip(tile_payloads, tile_jobs):
+            assert job["Props"]["Ex0"] == payload["JobInfo"]["ExtraInfo0"]
+
+        assembly_payloads = [
+            {"JobInfo": {"JobDependency0": job["_id"]}, "AuxFiles": []}
+            for job in tile_jobs
+        ]
+        assembly_jobs = client.submit_jobs(assembly_payloads)
+        for tile_job, assembly_job in zip(tile_jobs, assembly_jobs):
+            submitted = server.jobs[assembly_job["_id"]]
+            assert submitted["JobInfo"]["JobDependency0"] == tile_job["_id"]
+    finally:
+        client.close()
+        server.shutdown()
+
+
+def test_refused_job_raises():
+    server = _start_server()
+    url = "http://127.0.0.1:{}".format(server.server_address[1])
+    client = DeadlineRestClient(url, max_workers=4)
+    try:
+        payloads = [{"JobInfo": {}}, {"PluginInfo": {}}]
+        try:
+            client.submit_jobs(payloads)
+        except DeadlineSubmissionError:
+            pass
+        else:
+            raise AssertionError("Refused job did not raise")
+    finally:
+        client.close()
+        server.shutdown()
+
+
+def test_context_manager_closes_session():
+    server = _start_server()
+    url = "http://127.0.0.1:{}".format(server.server_address[1])
+    closed = []
+    try:
+        try:
+            with DeadlineRestClient(url, max_workers=4) as client:
+                client.session.close = lambda: closed.append(True)
+                client.submit_jobs([{"PluginInfo": {}}])
+        except DeadlineSubmissionError:
+            pass
+        assert closed == [True]
+    finally:
+        server.shutdown()
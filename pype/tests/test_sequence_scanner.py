@@ -0,0 +1,143 @@
+import os
+
+from pype.lib import SequenceScanner, FrameSequence
+
+
+def _write(directory, filename, size=1000):
+    with open(os.path.join(directory, filename), "wb") as stream:
+        stream.write(b"x" * size)
+
+
+def _create_files(tmpdir):
+    directory = str(tmpdir)
+    # 1004-1005 are missing, 1007 is empty and 1009 is truncated
+    for frame in (1001, 1002, 1003, 1006, 1008, 1010):
+        _write(directory, "beauty.{:04d}.exr".format(frame))
+    _write(directory, "beauty.1007.exr", 0)
+    _write(directory, "beauty.1009.exr", 10)
+
+    # Padding changes when frame number is longer than padding
+    for frame in ("0998", "0999", "1000", "1001"):
+        _write(directory, "shot.{}.png".format(frame))
+
+    # Digits in head of file name
+    for frame in range(1, 4):
+        _write(directory, "diffuse_v001.{:04d}.jpg".format(frame))
+
+    # Not padded sequence
+    for frame in range(8, 13):
+        _write(directory, "plate.{}.dpx".format(frame))
+
+    # Not sequences
+    _write(directory, "single.0001.exr")
+    _write(directory, "notes.txt")
+    return directory
+
+
+def test_scan_groups_sequences(tmpdir):
+    directory = _create_files(tmpdir)
+    sequences = SequenceScanner().scan(directory)
+
+    by_name = {
+        (sequence.head, sequence.tail): sequence for sequence in sequences
+    }
+    assert sorted(by_name.keys()) == [
+        ("beauty.", ".exr"),
+        ("diffuse_v001.", ".jpg"),
+        ("plate.", ".dpx"),
+        ("shot.", ".png")
+    ]
+
+    # Padding can't be detected from frame numbers without leading zeros
+    beauty = by_name[("beauty.", ".exr")]
+    assert beauty.padding == 0
+    assert beauty.filename(1004) == "beauty.1004.exr"
+
+    shot = by_name[("shot.", ".png")]
+    assert shot.format() == "shot.####.png"
+    assert shot.padding == 4
+    assert shot.ranges == [[998, 1001]]
+    assert shot.filename(998) == "shot.0998.png"
+    assert shot.filename(1001) == "shot.1001.png"
+
+    plate = by_name[("plate.", ".dpx")]
+    assert plate.padding == 0
+    assert list(plate.frames()) == [8, 9, 10, 11, 12]
+    assert plate.path(8) == os.path.join(
+        os.path.normpath(directory), "plate.8.dpx"
+    )
+
+    diffuse = by_name[("diffuse_v001.", ".jpg")]
+    assert diffuse.padding == 4
+    assert diffuse.ranges == [[1, 3]]
+
+
+def test_find_sequence(tmpdir):
+    directory = _create_files(tmpdir)
+    scanner = SequenceScanner()
+
+    for filename in (
+        "beauty.1001.exr", "beauty.####.exr", "beauty.%04d.exr"
+    ):
+        sequence = scanner.find_sequence(os.path.join(directory, filename))
+        assert sequence is not None
+        assert sequence.head == "beauty."
+        assert sequence.tail == ".exr"
+
+    assert scanner.find_sequence(
+        os.path.join(directory, "single.0001.exr")
+    ) is None
+    assert scanner.find_sequence(
+        os.path.join(directory, "other.####.exr")
+    ) is None
+    assert scanner.find_sequence(
+        os.path.join(directory, "notes.txt")
+    ) is None
+
+
+def test_missing_frames(tmpdir):
+    directory = _create_files(tmpdir)
+    sequence = SequenceScanner().find_sequence(
+        os.path.join(directory, "beauty.####.exr")
+    )
+
+    assert len(sequence) == 8
+    assert sequence.ranges == [[1001, 1003], [1006, 1010]]
+    assert sequence.missing() == [(1004, 1005)]
+    assert sequence.missing(1000, 1012) == [
+        (1000, 1000), (1004, 1005), (1011, 1012)
+    ]
+    assert sequence.missing(1006, 1010) == []
+    assert FrameSequence.format_ranges(sequence.missing(1000, 1012)) == (
+        "1000, 1004-1005, 1011-1012"
+    )
+
+
+def test_damaged_frames(tmpdir):
+    directory = _create_files(tmpdir)
+    sequence = SequenceScanner().find_sequence(
+        os.path.join(directory, "beauty.1001.exr")
+    )
+
+    assert sequence.zero_byte_frames() == [1007]
+    assert sequence.truncated_frames() == [1009]
+
+    shot = SequenceScanner().find_sequence(
+        os.path.join(directory, "shot.####.png")
+    )
+    assert shot.zero_byte_frames() == []
+    assert shot.truncated_frames() == []
+
+
+def test_scan_is_cached(tmpdir):
+    directory = _create_files(tmpdir)
+    scanner = SequenceScanner()
+    pattern = os.path.join(directory, "beauty.####.exr")
+    assert scanner.find_sequence(pattern).missing() == [(1004, 1005)]
+
+    _write(directory, "beauty.1004.exr")
+    _write(directory, "beauty.1005.exr")
+    assert scanner.find_sequence(pattern).missing() == [(1004, 1005)]
+
+    scanner.scan(directory, refresh=True)
+    assert scanner.find_sequence(pattern).missing() == []
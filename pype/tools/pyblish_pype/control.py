@@ -7,6 +7,7 @@ an active window manager; such as via Travis-CI.
 """
 import os
 import sys
+import time
 import traceback
 import inspect
 
@@ -18,10 +19,15 @@ import pyblish.logic
 import pyblish.lib
 import pyblish.version
 
-from . import util
+from . import util, settings
 from .constants import InstanceStates
 
-from pype.api import config
+from pype.settings import get_presets, thaw
+from pype.plugin import (
+    plugin_pairs,
+    parallel_validators_run,
+    ParallelProcessing
+)
 
 
 class IterationBreak(Exception):
@@ -64,11 +70,19 @@ class Controller(QtCore.QObject):
     # When instance is toggled
     instance_toggled = QtCore.Signal(object, object, object)
 
+    # Pairs are processed back-to-back and control is given back to Qt event
+    # loop when processing took more than `process_time_budget` seconds or
+    # `process_pairs_budget` pairs were processed.
+    process_time_budget = 0.016
+    process_pairs_budget = 50
+
     def __init__(self, parent=None):
         super(Controller, self).__init__(parent)
         self.context = None
         self.plugins = {}
         self.optional_default = {}
+        self.parallel_validation = settings.ParallelValidation
+        self.validation_workers = settings.ValidationWorkers
         self.instance_toggled.connect(self._on_instance_toggled)
 
     def reset_variables(self):
@@ -81,6 +95,11 @@ class Controller(QtCore.QObject):
         self.pair_generator = None
         # Active pair
         self.current_pair = None
+        # Results of pairs processed in parallel by (plugin, id(instance))
+        self.prepared_results = {}
+        self.prepared_plugins = set()
+        # Validators processed in background thread
+        self.parallel_processing = None
 
         # Orders which changes GUI
         # - passing collectors order disables plugin/instance toggle
@@ -116,11 +135,11 @@ class Controller(QtCore.QObject):
 
     def presets_by_hosts(self):
         # Get global filters as base
-        presets = config.get_presets().get("plugins", {})
+        presets = get_presets().get("plugins", {})
         if not presets:
             return {}
 
-        result = presets.get("global", {}).get("filter", {})
+        result = thaw(presets.get("global", {}).get("filter", {}))
         hosts = pyblish.api.registered_hosts()
         for host in hosts:
             host_presets = presets.get(host, {}).get("filter")
@@ -231,7 +250,13 @@ class Controller(QtCore.QObject):
         self.processing["nextOrder"] = plugin.order
 
         try:
-            result = pyblish.plugin.process(plugin, self.context, instance)
+            result = self.prepared_results.pop(
+                (plugin, id(instance)), None
+            )
+            if result is None:
+                result = pyblish.plugin.process(
+                    plugin, self.context, instance
+                )
             # Make note of the order at which the
             # potential error error occured.
             if result["error"] is not None:
@@ -244,8 +269,38 @@ class Controller(QtCore.QObject):
 
         return result
 
-    def _pair_yielder(self, plugins):
+    def _prepare_parallel_results(self, plugins):
+        """Start processing of pairs of thread safe validators at once.
+
+        Pairs are processed in background thread so UI is not blocked.
+        Results are returned by `_process` when pairs are yielded so
+        signals and error bookkeeping stay the same as for serial
+        processing.
+        """
+        pairs = []
         for plugin in plugins:
+            self.prepared_plugins.add(plugin)
+            if plugin.active:
+                pairs.extend(plugin_pairs(plugin, self.context)[1])
+
+        return ParallelProcessing(
+            pairs, self.context, self.validation_workers
+        )
+
+    def _collect_parallel_results(self, parallel_processing):
+        if parallel_processing.error is not None:
+            # Pairs without result are processed one by one
+            traceback.print_exception(*parallel_processing.error)
+            return
+
+        for pair, result in zip(
+            parallel_processing.pairs, parallel_processing.results
+        ):
+            plugin, instance = pair
+            self.prepared_results[(plugin, id(instance))] = result
+
+    def _pair_yielder(self, plugins):
+        for idx, plugin in enumerate(plugins):
             if (
                 self.processing["current_group_order"] is not None
                 and plugin.order > self.processing["current_group_order"]
@@ -301,6 +356,14 @@ class Controller(QtCore.QObject):
                 yield IterationBreak("Stopped due to \"{}\"".format(message))
 
             self.processing["last_plugin_order"] = plugin.order
+            if (
+                self.parallel_validation
+                and plugin not in self.prepared_plugins
+            ):
+                parallel_plugins = parallel_validators_run(plugins, idx)
+                if parallel_plugins:
+                    yield self._prepare_parallel_results(parallel_plugins)
+
             if not plugin.active:
                 pyblish.logic.log.debug("%s was inactive, skipping.." % plugin)
                 self.was_skipped.emit(plugin)
@@ -346,33 +409,60 @@ class Controller(QtCore.QObject):
         This process don't stop on one
         """
         def on_next():
-            try:
-                self.current_pair = next(self.pair_generator)
-                if isinstance(self.current_pair, IterationBreak):
-                    raise self.current_pair
-
-            except IterationBreak:
-                self.is_running = False
-                self.was_stopped.emit()
-                return
+            parallel_processing = self.parallel_processing
+            if parallel_processing is not None:
+                # Wait for validators processed in background without
+                #   blocking UI (wait in place when processing is synchronous)
+                if not parallel_processing.wait(util.defer_timeout()):
+                    return util.defer(10, on_next)
+                self.parallel_processing = None
+                self._collect_parallel_results(parallel_processing)
+
+            start = time.time()
+            processed = 0
+            while True:
+                try:
+                    self.current_pair = next(self.pair_generator)
+                    if isinstance(self.current_pair, IterationBreak):
+                        raise self.current_pair
+
+                    if isinstance(self.current_pair, ParallelProcessing):
+                        self.parallel_processing = self.current_pair
+                        break
+
+                except IterationBreak:
+                    self.is_running = False
+                    self.was_stopped.emit()
+                    return
+
+                except StopIteration:
+                    self.is_running = False
+                    # All pairs were processed successfully!
+                    return util.defer(500, on_finished)
+
+                except Exception:
+                    # This is a bug
+                    exc_type, exc_msg, exc_tb = sys.exc_info()
+                    traceback.print_exception(exc_type, exc_msg, exc_tb)
+                    self.is_running = False
+                    self.was_stopped.emit()
+                    return util.defer(
+                        500, lambda: on_unexpected_error(error=exc_msg)
+                    )
 
-            except StopIteration:
-                self.is_running = False
-                # All pairs were processed successfully!
-                return util.defer(500, on_finished)
+                self.about_to_process.emit(*self.current_pair)
+                if not on_process():
+                    return
 
-            except Exception:
-                # This is a bug
-                exc_type, exc_msg, exc_tb = sys.exc_info()
-                traceback.print_exception(exc_type, exc_msg, exc_tb)
-                self.is_running = False
-                self.was_stopped.emit()
-                return util.defer(
-                    500, lambda: on_unexpected_error(error=exc_msg)
-                )
+                # Yield to event loop only when budget is exhausted
+                processed += 1
+                if (
+                    processed >= self.process_pairs_budget
+                    or time.time() - start >= self.process_time_budget
+                ):
+                    break
 
-            self.about_to_process.emit(*self.current_pair)
-            util.defer(100, on_process)
+            util.defer(1, on_next)
 
         def on_process():
             try:
@@ -386,11 +476,12 @@ class Controller(QtCore.QObject):
                 # TODO this should be handled much differently
                 exc_type, exc_msg, exc_tb = sys.exc_info()
                 traceback.print_exception(exc_type, exc_msg, exc_tb)
-                return util.defer(
+                util.defer(
                     500, lambda: on_unexpected_error(error=exc_msg)
                 )
+                return False
 
-            util.defer(10, on_next)
+            return True
 
         def on_unexpected_error(error):
             util.u_print(u"An unexpected error occurred:\n %s" % error)
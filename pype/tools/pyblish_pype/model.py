@@ -25,6 +25,11 @@ Roles:
 """
 from __future__ import unicode_literals
 
+import array
+import bisect
+import heapq
+import collections
+
 import pyblish
 
 from . import settings, util
@@ -1000,7 +1005,11 @@ class ArtistProxy(QtCore.QAbstractProxyModel):
         return QtCore.QModelIndex()
 
 
-class TerminalDetailItem(QtGui.QStandardItem):
+class TerminalDetailItem(object):
+    """Detail of terminal record formatted on demand.
+
+    Used as internal pointer of detail index in `TerminalModel`.
+    """
     key_label_record_map = (
         ("instance", "Instance"),
         ("msg", "Message"),
@@ -1013,21 +1022,20 @@ class TerminalDetailItem(QtGui.QStandardItem):
         ("msecs", "Millis")
     )
 
-    def __init__(self, record_item):
+    def __init__(self, seq, record_item):
+        self.seq = seq
         self.record_item = record_item
         self.msg = None
-        msg = record_item.get("msg")
-        if msg is None:
-            msg = record_item["label"].split("\n")[0]
-
-        super(TerminalDetailItem, self).__init__(msg)
 
     def data(self, role=QtCore.Qt.DisplayRole):
         if role in (QtCore.Qt.DisplayRole, QtCore.Qt.EditRole):
             if self.msg is None:
                 self.msg = self.compute_detail_text(self.record_item)
             return self.msg
-        return super(TerminalDetailItem, self).data(role)
+
+        if role == Roles.TypeRole:
+            return TerminalDetailType
+        return None
 
     def compute_detail_text(self, item_data):
         if item_data["type"] == "info":
@@ -1063,7 +1071,20 @@ class TerminalDetailItem(QtGui.QStandardItem):
         return html_text
 
 
-class TerminalModel(QtGui.QStandardItemModel):
+class TerminalModel(QtCore.QAbstractItemModel):
+    """Bounded model of terminal records.
+
+    Records are stored in ring buffer of `settings.TerminalCapacity` items
+    and oldest records are removed when capacity is reached. Type and
+    instance of each record are stored in compact arrays, label and detail
+    are formatted on demand in `data`.
+
+    Model contains only records passing type and instance filters. Sequence
+    numbers of records are indexed by type and by instance so filtered rows
+    are rebuilt by merging indexes of enabled types, or of filtered
+    instances, instead of testing every row.
+    """
+
     item_icon_name = {
         "info": "fa.info",
         "record": "fa.circle",
@@ -1090,12 +1111,132 @@ class TerminalModel(QtGui.QStandardItemModel):
 
     )
 
+    filter_buttons_checks = {
+        "info": settings.TerminalFilters.get("info", True),
+        "log_debug": settings.TerminalFilters.get("log_debug", True),
+        "log_info": settings.TerminalFilters.get("log_info", True),
+        "log_warning": settings.TerminalFilters.get("log_warning", True),
+        "log_error": settings.TerminalFilters.get("log_error", True),
+        "log_critical": settings.TerminalFilters.get("log_critical", True),
+        "error": settings.TerminalFilters.get("error", True)
+    }
+
+    # Terminal item types stored as index to this tuple
+    item_types = (
+        None, "info", "error",
+        "log_debug", "log_info", "log_warning", "log_error", "log_critical"
+    )
+
+    instances = []
+
     def __init__(self, *args, **kwargs):
         super(TerminalModel, self).__init__(*args, **kwargs)
-        self.reset()
+        self.__class__.instances.append(self)
+
+        self.capacity = max(1, int(settings.TerminalCapacity))
+        self.instance_filter = None
+        self._type_codes = {
+            item_type: code for code, item_type in enumerate(self.item_types)
+        }
+        self._init_buffer()
+
+    def _init_buffer(self):
+        # Ring buffer columns indexed by `seq % capacity`
+        self._types = array.array("B", [0]) * self.capacity
+        self._instances = array.array("i", [-1]) * self.capacity
+        self._records = [None] * self.capacity
+        # Sequence number of oldest stored and of next record
+        self._first_seq = 0
+        self._next_seq = 0
+
+        self._instance_names = []
+        self._instance_idx_by_name = {}
+        self._seqs_by_type = collections.defaultdict(list)
+        self._seqs_by_instance = collections.defaultdict(list)
+        self._detail_items = {}
+
+        # Sorted sequence numbers of visible rows, rows start at offset
+        self._visible = []
+        self._visible_offset = 0
+
+    @classmethod
+    def change_filter(cls, name, value):
+        cls.filter_buttons_checks[name] = value
+
+        for instance in tuple(cls.instances):
+            try:
+                instance.refilter()
+
+            except RuntimeError:
+                # C++ Object was deleted
+                cls.instances.remove(instance)
+
+    def set_instance_filter(self, instance_names):
+        """Show only records of passed instances (all if None)."""
+        if instance_names is not None:
+            instance_names = set(instance_names)
+        if instance_names == self.instance_filter:
+            return
+        self.instance_filter = instance_names
+        self.refilter()
+
+    def refilter(self):
+        self.beginResetModel()
+        self._rebuild_visible()
+        self.endResetModel()
+
+    def _rebuild_visible(self):
+        enabled_codes = set()
+        indexes = []
+        for code, seqs in self._seqs_by_type.items():
+            self._prune_seqs(seqs)
+            item_type = self.item_types[code]
+            if self.filter_buttons_checks.get(item_type, True):
+                enabled_codes.add(code)
+                indexes.append(seqs)
+
+        if self.instance_filter is None:
+            visible = list(heapq.merge(*indexes))
+
+        else:
+            # Intersect index of filtered instances with enabled types
+            instance_indexes = []
+            for name in self.instance_filter:
+                instance_idx = self._instance_idx_by_name.get(name)
+                if instance_idx is None:
+                    continue
+                seqs = self._seqs_by_instance[instance_idx]
+                self._prune_seqs(seqs)
+                instance_indexes.append(seqs)
+
+            visible = [
+                seq for seq in heapq.merge(*instance_indexes)
+                if self._types[seq % self.capacity] in enabled_codes
+            ]
+
+        self._visible = visible
+        self._visible_offset = 0
+
+    def _prune_seqs(self, seqs):
+        idx = bisect.bisect_left(seqs, self._first_seq)
+        if idx:
+            del seqs[:idx]
+
+    def _is_visible(self, code, instance_idx):
+        if not self.filter_buttons_checks.get(self.item_types[code], True):
+            return False
+
+        if self.instance_filter is None:
+            return True
+
+        if instance_idx < 0:
+            return False
+        return self._instance_names[instance_idx] in self.instance_filter
 
     def reset(self):
-        self.clear()
+        self.beginResetModel()
+        self._init_buffer()
+        self.endResetModel()
 
     def prepare_records(self, result, suspend_logs):
         prepared_records = []
@@ -1147,90 +1288,189 @@ class TerminalModel(QtGui.QStandardItemModel):
 
         return prepared_records
 
-    def append(self, record_item):
+    def terminal_item_type(self, record_item):
         record_type = record_item["type"]
+        if record_type != "record":
+            return record_type
 
         terminal_item_type = None
-        if record_type == "record":
-            for level, _type in self.level_to_record:
-                if level > record_item["levelno"]:
-                    break
-                terminal_item_type = _type
-
-        else:
-            terminal_item_type = record_type
+        for level, _type in self.level_to_record:
+            if level > record_item["levelno"]:
+                break
+            terminal_item_type = _type
+        return terminal_item_type
 
-        icon_color = self.item_icon_colors.get(terminal_item_type)
-        icon_name = self.item_icon_name.get(record_type)
+    def append(self, record_item):
+        self.extend([record_item])
 
-        top_item_icon = None
-        if icon_color and icon_name:
-            top_item_icon = QAwesomeIconFactory.icon(icon_name, icon_color)
+    def extend(self, record_items):
+        record_items = list(record_items)
+        if not record_items:
+            return
 
-        label = record_item["label"].split("\n")[0]
+        # Only last records can be stored
+        skipped = max(0, len(record_items) - self.capacity)
+        if skipped:
+            self._next_seq += skipped
+            record_items = record_items[skipped:]
 
-        top_item = QtGui.QStandardItem()
-        top_item.setData(TerminalLabelType, Roles.TypeRole)
-        top_item.setData(terminal_item_type, Roles.TerminalItemTypeRole)
-        top_item.setData(label, QtCore.Qt.DisplayRole)
-        top_item.setFlags(
-            QtCore.Qt.ItemIsSelectable | QtCore.Qt.ItemIsEnabled
+        self._remove_oldest(
+            self._next_seq + len(record_items) - self.capacity
         )
 
-        if top_item_icon:
-            top_item.setData(top_item_icon, QtCore.Qt.DecorationRole)
+        new_visible = []
+        for record_item in record_items:
+            seq = self._next_seq
+            self._next_seq += 1
+            pos = seq % self.capacity
 
-        self.appendRow(top_item)
+            code = self._type_codes.get(
+                self.terminal_item_type(record_item), 0
+            )
+            instance_idx = -1
+            instance_name = record_item.get("instance")
+            if instance_name is not None:
+                instance_idx = self._instance_idx_by_name.get(instance_name)
+                if instance_idx is None:
+                    instance_idx = len(self._instance_names)
+                    self._instance_names.append(instance_name)
+                    self._instance_idx_by_name[instance_name] = instance_idx
+
+            self._types[pos] = code
+            self._instances[pos] = instance_idx
+            self._records[pos] = record_item
+            self._seqs_by_type[code].append(seq)
+            if instance_idx >= 0:
+                self._seqs_by_instance[instance_idx].append(seq)
+            if self._is_visible(code, instance_idx):
+                new_visible.append(seq)
+
+        if not new_visible:
+            return
+
+        row_count = self.rowCount()
+        self.beginInsertRows(
+            QtCore.QModelIndex(), row_count, row_count + len(new_visible) - 1
+        )
+        self._visible.extend(new_visible)
+        self.endInsertRows()
+
+    def _remove_oldest(self, first_seq):
+        """Remove records with sequence number lower than `first_seq`."""
+        if first_seq <= self._first_seq:
+            return
 
-        detail_item = TerminalDetailItem(record_item)
-        detail_item.setData(TerminalDetailType, Roles.TypeRole)
-        top_item.appendRow(detail_item)
+        removed_rows = (
+            bisect.bisect_left(self._visible, first_seq, self._visible_offset)
+            - self._visible_offset
+        )
+        if removed_rows:
+            self.beginRemoveRows(QtCore.QModelIndex(), 0, removed_rows - 1)
+            self._visible_offset += removed_rows
+            self.endRemoveRows()
+
+        clear_from = max(self._first_seq, first_seq - self.capacity)
+        for seq in range(clear_from, first_seq):
+            self._records[seq % self.capacity] = None
+            self._detail_items.pop(seq, None)
+        self._first_seq = first_seq
+
+        # Compact indexes
+        if self._visible_offset > len(self._visible) // 2:
+            del self._visible[:self._visible_offset]
+            self._visible_offset = 0
+
+        for indexes in (self._seqs_by_type, self._seqs_by_instance):
+            for seqs in indexes.values():
+                if len(seqs) > 2 * self.capacity:
+                    self._prune_seqs(seqs)
 
     def update_with_result(self, result):
-        for record in result["records"]:
-            self.append(record)
+        self.extend(result["records"])
 
+    def _row_seq(self, row):
+        return self._visible[self._visible_offset + row]
 
-class TerminalProxy(QtCore.QSortFilterProxyModel):
-    filter_buttons_checks = {
-        "info": settings.TerminalFilters.get("info", True),
-        "log_debug": settings.TerminalFilters.get("log_debug", True),
-        "log_info": settings.TerminalFilters.get("log_info", True),
-        "log_warning": settings.TerminalFilters.get("log_warning", True),
-        "log_error": settings.TerminalFilters.get("log_error", True),
-        "log_critical": settings.TerminalFilters.get("log_critical", True),
-        "error": settings.TerminalFilters.get("error", True)
-    }
+    def _seq_row(self, seq):
+        idx = bisect.bisect_left(self._visible, seq, self._visible_offset)
+        if idx < len(self._visible) and self._visible[idx] == seq:
+            return idx - self._visible_offset
+        return None
 
-    instances = []
+    def index(self, row, column, parent=QtCore.QModelIndex()):
+        if column != 0 or row < 0:
+            return QtCore.QModelIndex()
 
-    def __init__(self, view, *args, **kwargs):
-        super(self.__class__, self).__init__(*args, **kwargs)
-        self.__class__.instances.append(self)
-        # Store parent because by own `QSortFilterProxyModel` has `parent`
-        # method not returning parent QObject in PySide and PyQt4
-        self.view = view
+        if not parent.isValid():
+            if row >= self.rowCount():
+                return QtCore.QModelIndex()
+            return self.createIndex(row, column)
 
-    @classmethod
-    def change_filter(cls, name, value):
-        cls.filter_buttons_checks[name] = value
+        # Only top items have one child with detail
+        if row != 0 or parent.internalPointer() is not None:
+            return QtCore.QModelIndex()
 
-        for instance in cls.instances:
-            try:
-                instance.invalidate()
-                if instance.view:
-                    instance.view.updateGeometry()
+        seq = self._row_seq(parent.row())
+        detail_item = self._detail_items.get(seq)
+        if detail_item is None:
+            detail_item = TerminalDetailItem(
+                seq, self._records[seq % self.capacity]
+            )
+            self._detail_items[seq] = detail_item
+        return self.createIndex(row, column, detail_item)
 
-            except RuntimeError:
-                # C++ Object was deleted
-                cls.instances.remove(instance)
+    def parent(self, index=None):
+        if index is None:
+            return QtCore.QObject.parent(self)
 
-    def filterAcceptsRow(self, source_row, source_parent):
-        index = self.sourceModel().index(source_row, 0, source_parent)
-        item_type = index.data(Roles.TypeRole)
-        if not item_type == TerminalLabelType:
-            return True
-        terminal_item_type = index.data(Roles.TerminalItemTypeRole)
-        return self.__class__.filter_buttons_checks.get(
-            terminal_item_type, True
-        )
+        if not index.isValid():
+            return QtCore.QModelIndex()
+
+        detail_item = index.internalPointer()
+        if detail_item is None:
+            return QtCore.QModelIndex()
+
+        row = self._seq_row(detail_item.seq)
+        if row is None:
+            return QtCore.QModelIndex()
+        return self.createIndex(row, 0)
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        if not parent.isValid():
+            return len(self._visible) - self._visible_offset
+
+        if parent.internalPointer() is None:
+            return 1
+        return 0
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 1
+
+    def flags(self, index):
+        return QtCore.Qt.ItemIsSelectable | QtCore.Qt.ItemIsEnabled
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        detail_item = index.internalPointer()
+        if detail_item is not None:
+            return detail_item.data(role)
+
+        pos = self._row_seq(index.row()) % self.capacity
+        if role == QtCore.Qt.DisplayRole:
+            return self._records[pos]["label"].split("\n")[0]
+
+        if role == Roles.TypeRole:
+            return TerminalLabelType
+
+        terminal_item_type = self.item_types[self._types[pos]]
+        if role == Roles.TerminalItemTypeRole:
+            return terminal_item_type
+
+        if role == QtCore.Qt.DecorationRole:
+            icon_color = self.item_icon_colors.get(terminal_item_type)
+            icon_name = self.item_icon_name.get(self._records[pos]["type"])
+            if icon_color and icon_name:
+                return QAwesomeIconFactory.icon(icon_name, icon_color)
+        return None
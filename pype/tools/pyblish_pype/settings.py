@@ -8,6 +8,14 @@ InitialTab = "artist"
 # Customize the window size.
 WindowSize = (430, 600)
 
+# Process validators with `thread_safe` attribute concurrently and number of
+# validators processed at once.
+ParallelValidation = False
+ValidationWorkers = 4
+
+# Maximum number of records kept in terminal, oldest records are removed.
+TerminalCapacity = 50000
+
 TerminalFilters = {
     "info": True,
     "log_debug": True,
@@ -50,6 +50,16 @@ def defer(delay, func):
         return func()
 
 
+def defer_timeout():
+    """Timeout of waiting in place before `defer` is used to wait more.
+
+    None (wait until done) when `defer` is synchronous.
+    """
+    if float(os.getenv("PYBLISH_DELAY", 1)) > 0:
+        return 0
+    return None
+
+
 def u_print(msg, **kwargs):
     """`print` with encoded unicode.
 
@@ -261,6 +261,11 @@ class TerminalView(QtWidgets.QTreeView):
 
         return super(TerminalView, self).event(event)
 
+    def setModel(self, model):
+        super(TerminalView, self).setModel(model)
+        if model is not None:
+            model.modelReset.connect(self.updateGeometry)
+
     def focusOutEvent(self, event):
         self.selectionModel().clear()
 
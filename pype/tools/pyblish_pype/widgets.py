@@ -119,10 +119,8 @@ class PerspectiveWidget(QtWidgets.QWidget):
         terminal_view = view.TerminalView()
         terminal_view.setObjectName("TerminalView")
         terminal_model = model.TerminalModel()
-        terminal_proxy = model.TerminalProxy(terminal_view)
-        terminal_proxy.setSourceModel(terminal_model)
 
-        terminal_view.setModel(terminal_proxy)
+        terminal_view.setModel(terminal_model)
         terminal_delegate = delegate.TerminalItem()
         terminal_view.setItemDelegate(terminal_delegate)
         records.set_content(terminal_view)
@@ -137,7 +135,6 @@ class PerspectiveWidget(QtWidgets.QWidget):
 
         self.terminal_view = terminal_view
         self.terminal_model = terminal_model
-        self.terminal_proxy = terminal_proxy
 
         self.indicator = indicator
         self.scroll_widget = scroll_widget
@@ -512,11 +509,11 @@ class FilterButton(QtWidgets.QPushButton):
         self.setObjectName("TerminalFilerBtn")
         self.setCheckable(True)
         self.setChecked(
-            model.TerminalProxy.filter_buttons_checks[name]
+            model.TerminalModel.filter_buttons_checks[name]
         )
 
     def on_toggle(self, toggle_state):
-        model.TerminalProxy.change_filter(self.filter_name, toggle_state)
+        model.TerminalModel.change_filter(self.filter_name, toggle_state)
 
 
 class TerminalFilterWidget(QtWidgets.QWidget):
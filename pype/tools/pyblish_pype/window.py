@@ -190,10 +190,8 @@ class Window(QtWidgets.QDialog):
 
         terminal_view = view.TerminalView()
         terminal_model = model.TerminalModel()
-        terminal_proxy = model.TerminalProxy(terminal_view)
-        terminal_proxy.setSourceModel(terminal_model)
 
-        terminal_view.setModel(terminal_proxy)
+        terminal_view.setModel(terminal_model)
         terminal_delegate = delegate.TerminalItem()
         terminal_view.setItemDelegate(terminal_delegate)
 
@@ -437,6 +435,9 @@ class Window(QtWidgets.QDialog):
 
         artist_view.toggled.connect(self.on_instance_toggle)
         overview_instance_view.toggled.connect(self.on_instance_toggle)
+        overview_instance_view.selectionModel().selectionChanged.connect(
+            self.on_instance_selection_changed
+        )
         overview_plugin_view.toggled.connect(self.on_plugin_toggle)
 
         button_suspend_logs.clicked.connect(self.on_suspend_clicked)
@@ -483,7 +484,6 @@ class Window(QtWidgets.QDialog):
         self.animation_info_msg = animation_info_msg
 
         self.terminal_model = terminal_model
-        self.terminal_proxy = terminal_proxy
         self.terminal_view = terminal_view
 
         self.comment_main_widget = comment_intent_widget
@@ -563,6 +563,21 @@ class Window(QtWidgets.QDialog):
         ):
             instance_item.setData(enable_value, Roles.IsEnabledRole)
 
+    def on_instance_selection_changed(self, *_args):
+        """Show only records of selected instances in terminal."""
+        instance_names = set()
+        selection_model = self.overview_instance_view.selectionModel()
+        for index in selection_model.selectedIndexes():
+            if index.data(Roles.TypeRole) != model.InstanceType:
+                continue
+
+            instance_id = index.data(Roles.ObjectIdRole)
+            instance_item = self.instance_model.instance_items[instance_id]
+            if not instance_item.is_context:
+                instance_names.add(instance_item.instance.data["name"])
+
+        self.terminal_model.set_instance_filter(instance_names or None)
+
     def on_instance_toggle(self, index, state=None):
         """An item is requesting to be toggled"""
         if not index.data(Roles.IsOptionalRole):
@@ -1026,7 +1041,6 @@ class Window(QtWidgets.QDialog):
             self.intent_model.deleteLater()
             self.plugin_model.deleteLater()
             self.terminal_model.deleteLater()
-            self.terminal_proxy.deleteLater()
             self.plugin_proxy.deleteLater()
 
             self.artist_view.setModel(None)